@@ -6,11 +6,17 @@ import asyncio
 import sys
 import os
 
+import pytest
+
+# Gerçek bir Android cihaz gerektirir: yalnızca `pytest -m integration` ile çalışır
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytest.importorskip("uiautomator2")
+
 # Proje root'unu path'e ekle
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from trendx.publisher.uiautomator_twitter_publisher import UIAutomatorTwitterPublisher
-from trendx.common.models import TweetContent
+from trendx.ai.base import TweetContent
 
 async def test_uiautomator_publisher():
     """UIAutomator2 Publisher'ı test et"""
@@ -42,5 +48,10 @@ async def test_uiautomator_publisher():
         print(f"💥 Test hatası: {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(test_uiautomator_publisher())
 
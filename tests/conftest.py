@@ -0,0 +1,89 @@
+"""Shared fixtures for TrendX tests."""
+
+import functools
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+from trendx.ai.base import TweetContent
+from trendx.ai.mock_generator import MockAIGenerator
+from trendx.common.models import TrendItem
+from trendx.sources.google_trends import GoogleTrendsSource
+from trendx.sources.reddit import RedditTrendSource
+from trendx.sources.twitter_trends import TwitterTrendsSource
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is None:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def reddit_source() -> RedditTrendSource:
+    """Reddit source shared across the test session."""
+    return RedditTrendSource()
+
+
+@pytest.fixture(scope="session")
+def google_source() -> GoogleTrendsSource:
+    """Google Trends source shared across the test session."""
+    return GoogleTrendsSource()
+
+
+@pytest.fixture(scope="session")
+def twitter_source() -> TwitterTrendsSource:
+    """Twitter trends source shared across the test session."""
+    return TwitterTrendsSource()
+
+
+@pytest.fixture(scope="session")
+def mock_ai_generator() -> MockAIGenerator:
+    """Mock AI generator shared across the test session."""
+    return MockAIGenerator()
+
+
+def _memoize_tweet_content(generate):
+    """
+    Memoize a ``generate_tweet_content`` coroutine on the trend item fields it reads.
+
+    Args:
+        generate: Unbound ``generate_tweet_content`` coroutine function
+
+    Returns:
+        Coroutine function returning cached content for repeated items
+    """
+    cache = {}
+
+    @functools.wraps(generate)
+    async def wrapper(self, trend_item: TrendItem) -> TweetContent:
+        key = (
+            trend_item.external_id,
+            trend_item.source,
+            trend_item.title,
+            trend_item.is_turkey_related,
+            trend_item.is_global,
+        )
+        if key not in cache:
+            cache[key] = await generate(self, trend_item)
+        return cache[key]
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoized_mock_ai_responses():
+    """Serve repeated mock tweet generations from a session-wide cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            MockAIGenerator,
+            "generate_tweet_content",
+            _memoize_tweet_content(MockAIGenerator.generate_tweet_content),
+        )
+        yield
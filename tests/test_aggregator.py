@@ -1,9 +1,12 @@
 """Tests for aggregator module."""
 
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 
-from trendx.aggregator import TrendScorer, Deduplicator
+from trendx.aggregator import TrendAggregator, TrendScorer, Deduplicator
+from trendx.aggregator.bloom import ScalableBloomFilter
+from trendx.aggregator.scorer import RECENCY_HALF_LIFE_HOURS
 from trendx.common.models import TrendItem, TrendSource
 from trendx.sources.base import BaseTrendSource
 
@@ -22,16 +25,58 @@ class MockSource(BaseTrendSource):
         return self.authority
 
 
+class StaticSource(MockSource):
+    """Mock source that returns a single fresh item."""
+
+    async def fetch_trends(self, limit: int = 10):
+        return [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id="test1",
+                title="Recent news",
+                created_at=datetime.utcnow(),
+            )
+        ]
+
+
+class FailingSource(MockSource):
+    """Mock source whose fetch always fails."""
+
+    async def fetch_trends(self, limit: int = 10):
+        raise RuntimeError("source unavailable")
+
+
+class TestTrendAggregator:
+    """Test trend aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_failing_source_does_not_fail_batch(self):
+        """Test that one failing source does not drop the other sources."""
+        aggregator = TrendAggregator({
+            "reddit": StaticSource("reddit", 0.8),
+            "google_trends": FailingSource("google_trends", 0.9),
+        })
+
+        trends = await aggregator.aggregate_trends(limit=5)
+
+        assert [trend.external_id for trend in trends] == ["test1"]
+
+
+@pytest.fixture(scope="session")
+def scorer_sources():
+    """Immutable source mapping shared by scorer tests."""
+    return {
+        "reddit": MockSource("reddit", 0.8),
+        "google_trends": MockSource("google_trends", 0.9),
+    }
+
+
 class TestTrendScorer:
     """Test trend scoring functionality."""
     
-    def test_calculate_scores(self):
+    def test_calculate_scores(self, scorer_sources):
         """Test score calculation."""
-        sources = {
-            "reddit": MockSource("reddit", 0.8),
-            "google_trends": MockSource("google_trends", 0.9),
-        }
-        scorer = TrendScorer(sources)
+        scorer = TrendScorer(scorer_sources)
         
         # Create test items
         now = datetime.utcnow()
@@ -65,6 +110,47 @@ class TestTrendScorer:
         # Recent item should have higher score
         assert scored_items[0].external_id == "test1"
     
+    def test_calculate_scores_identical_items(self):
+        """Test that identical raw scores normalize to 0.5 and keep order."""
+        scorer = TrendScorer({})
+
+        now = datetime.utcnow()
+        items = [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id=f"test{i}",
+                title="Same headline",
+                created_at=now,
+            )
+            for i in range(3)
+        ]
+
+        scored_items = scorer.calculate_scores(items)
+
+        assert [item.score for item in scored_items] == [0.5, 0.5, 0.5]
+        assert [item.external_id for item in scored_items] == ["test0", "test1", "test2"]
+
+    def test_calculate_scores_with_limit(self):
+        """Test that limited scoring returns the prefix of the full ranking."""
+        scorer = TrendScorer({})
+
+        now = datetime.utcnow()
+        items = [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id=f"test{i}",
+                title="Headline",
+                social_volume=(i * 37) % 5 * 1000,
+                created_at=now - timedelta(hours=i % 3),
+            )
+            for i in range(20)
+        ]
+
+        full = [item.external_id for item in scorer.calculate_scores(list(items))]
+        top = scorer.calculate_scores(list(items), limit=5)
+
+        assert [item.external_id for item in top] == full[:5]
+
     def test_recency_scoring(self):
         """Test recency scoring."""
         sources = {}
@@ -81,13 +167,44 @@ class TestTrendScorer:
         recency_score = scorer._calculate_recency_score(item)
         assert 0.0 <= recency_score <= 1.0
         assert recency_score > 0.5  # Should be high for recent item
+
+    def test_recency_decay(self):
+        """Test exponential recency decay and its floor."""
+        scorer = TrendScorer({})
+
+        scores = scorer._recency_scores(np.array([-1.0, 0.0, RECENCY_HALF_LIFE_HOURS, 72.0]))
+
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == pytest.approx(0.5)
+        assert scores[3] == pytest.approx(0.1)
+
+    def test_calculate_scores_uses_reference_time(self):
+        """Test that recency is measured against the supplied reference time."""
+        scorer = TrendScorer({})
+
+        reference = datetime(2024, 1, 1, 12, 0, 0)
+        item = TrendItem(
+            source=TrendSource.REDDIT,
+            external_id="test",
+            title="Test",
+            is_global=False,
+            created_at=reference - timedelta(hours=RECENCY_HALF_LIFE_HOURS),
+        )
+
+        assert scorer._calculate_recency_score(item, now=reference) == pytest.approx(0.5)
+        # 0.5 recency * 0.3 + 0.8 authority * 0.2 + 0.3 title quality * 0.1
+        batch = scorer._calculate_batch_scores([item], reference)
+        assert batch[0] == pytest.approx(0.34)
+
+        # An unknown source string scores with the fallback authority, 0.5
+        item.source = "unknown_source"
+        batch = scorer._calculate_batch_scores([item], reference)
+        assert batch[0] == pytest.approx(0.28)
     
-    def test_source_authority(self):
+    def test_source_authority(self, scorer_sources):
         """Test source authority scoring."""
-        sources = {
-            "reddit": MockSource("reddit", 0.8),
-        }
-        scorer = TrendScorer(sources)
+        scorer = TrendScorer(scorer_sources)
         
         authority = scorer._get_source_authority(TrendSource.REDDIT)
         assert authority == 0.8
@@ -96,6 +213,10 @@ class TestTrendScorer:
         authority = scorer._get_source_authority(TrendSource.RSS)
         assert authority == 0.5
 
+        # Sources without a default score fall back to 0.5
+        authority = scorer._get_source_authority(TrendSource.SELENIUM_TRENDS)
+        assert authority == 0.5
+
 
 class TestDeduplicator:
     """Test deduplication functionality."""
@@ -140,6 +261,13 @@ class TestDeduplicator:
         normalized = deduplicator._normalize_text(text)
         
         assert normalized == "breaking major news"
+
+    def test_normalize_text_folds_compatibility_forms(self):
+        """Test that full-width and ligature forms normalize like ASCII."""
+        deduplicator = Deduplicator()
+
+        assert deduplicator._normalize_text("ＢＲＥＡＫＩＮＧ  news") == "breaking news"
+        assert deduplicator._normalize_text("ﬁnal score") == "final score"
     
     def test_clear_cache(self):
         """Test cache clearing."""
@@ -162,3 +290,121 @@ class TestDeduplicator:
         # Clear cache
         deduplicator.clear_cache()
         assert len(deduplicator.seen_hashes) == 0
+
+    def test_deduplicate_across_batches(self):
+        """Test that items seen in an earlier batch are dropped."""
+        deduplicator = Deduplicator()
+
+        first = TrendItem(
+            source=TrendSource.REDDIT,
+            external_id="test1",
+            title="Same title",
+            url="https://example.com/1",
+        )
+        second = TrendItem(
+            source=TrendSource.GOOGLE_TRENDS,
+            external_id="test2",
+            title="Same title",
+            url="https://example.com/1",
+        )
+
+        assert len(deduplicator.deduplicate([first])) == 1
+        assert deduplicator.deduplicate([second]) == []
+
+    def test_deduplicate_near_duplicates(self):
+        """Test that reworded headlines are dropped by the MinHash-LSH pass."""
+        deduplicator = Deduplicator()
+        base = (
+            "Istanbul metro line extension opens to passengers after years "
+            "of construction delays across three districts two bridges and "
+            "seven new stations connecting ferry piers with the airport rail link"
+        )
+
+        items = [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id="original",
+                title=base,
+                url="https://example.com/a",
+            ),
+            TrendItem(
+                source=TrendSource.GOOGLE_TRENDS,
+                external_id="reworded",
+                title=base + " today",
+                url="https://example.com/b",
+            ),
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id="unrelated",
+                title="Galatasaray wins the league title on the final day",
+                url="https://example.com/c",
+            ),
+        ]
+
+        unique_items = deduplicator.deduplicate(items)
+
+        assert [item.external_id for item in unique_items] == ["original", "unrelated"]
+
+    def test_short_titles_skip_near_duplicate_check(self):
+        """Test that short same-title items with different URLs are kept."""
+        deduplicator = Deduplicator()
+
+        items = [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id=f"test{i}",
+                title="Same title",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(2)
+        ]
+
+        assert len(deduplicator.deduplicate(items)) == 2
+
+    def test_near_duplicate_index_is_bounded(self):
+        """Test that the oldest titles are evicted from the near-duplicate index."""
+        deduplicator = Deduplicator(max_indexed_titles=1)
+        base = "Istanbul metro line extension opens to passengers after years of delays"
+
+        def item(external_id, title):
+            return TrendItem(
+                source=TrendSource.REDDIT,
+                external_id=external_id,
+                title=title,
+                url=f"https://example.com/{external_id}",
+            )
+
+        deduplicator.deduplicate([item("original", base)])
+        deduplicator.deduplicate([
+            item("unrelated", "Galatasaray wins the league title on the final day of season")
+        ])
+
+        assert len(deduplicator._lsh_keys) == 1
+        # The original was evicted, so its rewording is no longer suppressed
+        assert len(deduplicator.deduplicate([item("reworded", base + " today")])) == 1
+
+
+class TestScalableBloomFilter:
+    """Test Bloom filter used for the deduplication cache."""
+
+    def test_membership_and_growth(self):
+        """Test membership survives growing past the initial capacity."""
+        bloom = ScalableBloomFilter(initial_capacity=10, error_rate=1e-6)
+
+        fingerprints = [(i << 64) | (i * 7919) for i in range(1, 51)]
+        for fingerprint in fingerprints:
+            bloom.add(fingerprint)
+
+        assert len(bloom) == 50
+        assert len(bloom.filters) > 1
+        assert all(fingerprint in bloom for fingerprint in fingerprints)
+
+    def test_clear(self):
+        """Test clearing resets the filter."""
+        bloom = ScalableBloomFilter(initial_capacity=10, error_rate=1e-6)
+        bloom.add(12345)
+
+        bloom.clear()
+
+        assert len(bloom) == 0
+        assert 12345 not in bloom
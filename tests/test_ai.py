@@ -1,24 +1,87 @@
 """Tests for AI module."""
 
+import asyncio
+import json
+import time
+
+import httpx
 import pytest
 
-from trendx.ai.mock_generator import MockAIGenerator
+from trendx.ai.base import TweetContent, tweet_length
+from trendx.ai.cache import ResponseCache, SemanticCache
+from trendx.ai import openai_generator
+from trendx.ai.openai_generator import OpenAIGenerator
 from trendx.common.models import TrendItem, TrendSource
+from trendx.common.rate_limiter import TokenBucket
+
+
+class TestTweetContent:
+    """Test generated tweet content."""
+
+    def test_rendered_text_joins_present_parts(self):
+        """Test that the post text skips empty parts and prefixes hashtags."""
+        content = TweetContent(
+            turkish_text="Merhaba",
+            english_text="Hello",
+            hashtags=["TrendX", "AI"],
+            media_url="https://example.com/a.jpg",
+        )
+        assert content.rendered_text == (
+            "Merhaba\n\nHello\n\n#TrendX #AI\n\nhttps://example.com/a.jpg"
+        )
+        assert TweetContent("Merhaba", "Hello", []).rendered_text == "Merhaba\n\nHello"
+
+    def test_rendered_text_tracks_changes(self):
+        """Test that the text is cached, tags are not doubled and late media is included."""
+        content = TweetContent("Merhaba", "Hello", ["#Turkey", "AI"])
+        rendered = content.rendered_text
+        assert rendered == "Merhaba\n\nHello\n\n#Turkey #AI"
+        assert content.rendered_text is rendered
+        content.media_url = "https://example.com/a.jpg"
+        assert content.rendered_text.endswith("\n\nhttps://example.com/a.jpg")
+
+    def test_texts_must_fit_one_tweet(self):
+        """Test that each language's text is limited to one tweet."""
+        TweetContent("a" * 280, "b" * 280, ["#TrendX"])
+        with pytest.raises(ValueError):
+            TweetContent("a" * 281, "b", [])
+        content = TweetContent("a", "b", [])
+        with pytest.raises(ValueError):
+            content.english_text = "日本" * 71
+
+    def test_hashtag_suffix(self):
+        """Test that hashtags become a space-prefixed suffix."""
+        assert TweetContent("a", "b", ["#TrendX", "#AI"]).hashtag_suffix == " #TrendX #AI"
+        assert TweetContent("a", "b", ["TrendX", "#AI"]).hashtag_suffix == " #TrendX #AI"
+        assert TweetContent("a", "b", []).hashtag_suffix == ""
+
+        content = TweetContent("a", "b", ["#TrendX"])
+        assert content.hashtag_suffix is content.hashtag_suffix
+        content.hashtags = ["AI"]
+        assert content.hashtag_suffix == " #AI"
+
+    def test_tweet_length_weights_wide_characters(self):
+        """Test that CJK and emoji count double while Turkish letters count once."""
+        assert tweet_length("Merhaba") == 7
+        assert tweet_length("Güneş ışığı") == 11
+        assert tweet_length("日本") == 4
+        assert tweet_length("ok 🎉") == 5
+        content = TweetContent("a", "b", ["#日本"])
+        assert content.hashtag_suffix_length == 6
+        content.hashtags = ["#AI"]
+        assert content.hashtag_suffix_length == 4
 
 
 class TestMockAIGenerator:
     """Test mock AI generator."""
     
-    def test_initialization(self):
+    def test_initialization(self, mock_ai_generator):
         """Test generator initialization."""
-        generator = MockAIGenerator()
-        assert generator.mock_responses is not None
+        assert mock_ai_generator.mock_responses is not None
     
     @pytest.mark.asyncio
-    async def test_generate_tweet_content(self):
+    async def test_generate_tweet_content(self, mock_ai_generator):
         """Test tweet content generation."""
-        generator = MockAIGenerator()
-        
         trend_item = TrendItem(
             source=TrendSource.REDDIT,
             external_id="test",
@@ -27,7 +90,7 @@ class TestMockAIGenerator:
             is_global=False,
         )
         
-        content = await generator.generate_tweet_content(trend_item)
+        content = await mock_ai_generator.generate_tweet_content(trend_item)
         
         assert content.turkish_text
         assert content.english_text
@@ -35,10 +98,50 @@ class TestMockAIGenerator:
         assert len(content.hashtags) > 0
         assert content.media_path is None
     
-    def test_customize_hashtags(self):
-        """Test hashtag customization."""
-        generator = MockAIGenerator()
+    @pytest.mark.asyncio
+    async def test_generate_tweet_content_memoized(self, mock_ai_generator):
+        """Test repeated generation for the same item is served from cache."""
+        def make_item(title: str) -> TrendItem:
+            return TrendItem(
+                source=TrendSource.REDDIT,
+                external_id="memo",
+                title=title,
+                is_turkey_related=False,
+                is_global=True,
+            )
         
+        first = await mock_ai_generator.generate_tweet_content(make_item("Memo topic"))
+        second = await mock_ai_generator.generate_tweet_content(make_item("Memo topic"))
+        other = await mock_ai_generator.generate_tweet_content(make_item("Other topic"))
+        
+        assert first is second
+        assert other is not first
+        assert other.turkish_text.startswith("Other topic")
+    
+    @pytest.mark.asyncio
+    async def test_generate_batch(self, mock_ai_generator):
+        """Test batch generation keeps input order."""
+        items = [
+            TrendItem(
+                source=TrendSource.REDDIT,
+                external_id=f"batch{i}",
+                title=f"Batch topic {i}",
+                is_turkey_related=False,
+                is_global=True,
+            )
+            for i in range(3)
+        ]
+
+        contents = await mock_ai_generator.generate_batch(items, concurrency=2)
+
+        assert [content.english_text.split("\n")[0] for content in contents] == [
+            "Batch topic 0",
+            "Batch topic 1",
+            "Batch topic 2",
+        ]
+    
+    def test_customize_hashtags(self, mock_ai_generator):
+        """Test hashtag customization."""
         # Turkey-related item
         turkey_item = TrendItem(
             source=TrendSource.REDDIT,
@@ -48,7 +151,7 @@ class TestMockAIGenerator:
             is_global=False,
         )
         
-        hashtags = generator._customize_hashtags(["#News"], turkey_item)
+        hashtags = mock_ai_generator._customize_hashtags(["#News"], turkey_item)
         assert "#Turkey" in hashtags or "#Türkiye" in hashtags
         
         # Global item
@@ -60,5 +163,449 @@ class TestMockAIGenerator:
             is_global=True,
         )
         
-        hashtags = generator._customize_hashtags(["#News"], global_item)
+        hashtags = mock_ai_generator._customize_hashtags(["#News"], global_item)
         assert "#Global" in hashtags
+
+
+class TestOpenAIGenerator:
+    """Test OpenAI generator plumbing that does not hit the network."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_shared(self):
+        """Test that calls on one event loop reuse a single pooled client."""
+        client = OpenAIGenerator._get_client()
+
+        assert OpenAIGenerator._get_client() is client
+
+        await OpenAIGenerator.aclose()
+        assert client.is_closed
+        assert OpenAIGenerator._client is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Test that concurrent generations for one trend share an API call."""
+        generator = OpenAIGenerator()
+        generator._use_mock = False
+        calls = []
+
+        async def fake_call(user_message, title=None):
+            calls.append(user_message)
+            await asyncio.sleep(0.01)
+            return '{"turkish_text": "Merhaba", "english_text": "Hello", "hashtags": []}'
+
+        generator._call_openai_api = fake_call
+        trend_item = TrendItem(
+            source=TrendSource.REDDIT,
+            external_id="test",
+            title="Test trending topic",
+        )
+
+        first, second = await asyncio.gather(
+            generator.generate_tweet_content(trend_item),
+            generator.generate_tweet_content(trend_item),
+        )
+
+        assert len(calls) == 1
+        assert first.english_text == second.english_text == "Hello"
+        assert generator._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_packs_trends(self, tmp_path):
+        """Test that a batch is generated with one request and matched by id."""
+        generator = OpenAIGenerator()
+        generator._use_mock = False
+        generator.cache = ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=3600)
+        calls = []
+
+        async def fake_call(user_message, title=None, max_tokens=None):
+            calls.append(user_message)
+            # Replies out of order, one id as a string, without the third topic
+            return json.dumps({"items": [
+                {"id": "2", "turkish_text": "İki", "english_text": "Two", "hashtags": []},
+                {"id": 1, "turkish_text": "Bir", "english_text": "One", "hashtags": []},
+            ]})
+
+        async def fake_generate(trend_item):
+            return await generator._fallback.generate_tweet_content(trend_item)
+
+        generator._call_openai_api = fake_call
+        generator._generate_with_openai = fake_generate
+        items = [
+            TrendItem(source=TrendSource.REDDIT, external_id=str(i), title=f"Topic {i}")
+            for i in range(1, 4)
+        ]
+
+        contents = await generator.generate_batch(items)
+
+        assert len(calls) == 1
+        assert "TRENDING TOPIC 3:" in calls[0]
+        assert [content.english_text for content in contents[:2]] == ["One", "Two"]
+        assert contents[2].turkish_text
+
+        # Replies were cached per trend, so a repeat batch makes no request
+        repeated = await generator.generate_batch(items[:2])
+
+        assert len(calls) == 1
+        assert [content.english_text for content in repeated] == ["One", "Two"]
+        generator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_job_round_trip(self, monkeypatch):
+        """Test that a Batch API job is submitted and its output parsed."""
+        reply = '{"turkish_text": "Merhaba", "english_text": "Hello", "hashtags": []}'
+        status = {"value": "in_progress"}
+        uploads = []
+
+        def handler(request):
+            path = request.url.path
+            if path == "/v1/files":
+                uploads.append(request.content)
+                return httpx.Response(200, json={"id": "file-in"})
+            if path == "/v1/batches":
+                assert json.loads(request.content)["input_file_id"] == "file-in"
+                return httpx.Response(200, json={"id": "batch-1"})
+            if path == "/v1/batches/batch-1":
+                return httpx.Response(
+                    200, json={"status": status["value"], "output_file_id": "file-out"}
+                )
+            assert path == "/v1/files/file-out/content"
+            line = {
+                "custom_id": "0",
+                "response": {"body": {"choices": [{"message": {"content": reply}}]}},
+            }
+            return httpx.Response(200, text=json.dumps(line) + "\n")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(OpenAIGenerator, "_get_client", classmethod(lambda cls: client))
+        generator = OpenAIGenerator()
+        items = [TrendItem(source=TrendSource.REDDIT, external_id="1", title="Topic")]
+
+        batch_id = await generator.submit_batch_job(items)
+
+        assert batch_id == "batch-1"
+        assert b'"custom_id":"0"' in uploads[0]
+        assert b'"stream"' not in uploads[0]
+        assert await generator.fetch_batch_job(batch_id, items) is None
+
+        status["value"] = "completed"
+        contents = await generator.fetch_batch_job(batch_id, items)
+
+        assert [content.english_text for content in contents] == ["Hello"]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_call_openai_api_streams(self, monkeypatch):
+        """Test that streamed content deltas are joined into one reply."""
+        events = [
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": '{"turkish_text": '}}]},
+            {"choices": [{"delta": {"content": '"Merhaba"}'}}]},
+            {"choices": [{"delta": {}, "finish_reason": "stop"}]},
+            {
+                "choices": [],
+                "usage": {
+                    "prompt_tokens": 1200,
+                    "completion_tokens": 40,
+                    "total_tokens": 1240,
+                    "prompt_tokens_details": {"cached_tokens": 1024},
+                },
+            },
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(
+                200, text=body, headers={"Content-Type": "text/event-stream"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(OpenAIGenerator, "_get_client", classmethod(lambda cls: client))
+        generator = OpenAIGenerator()
+        generator.cache = None
+
+        reply = await generator._call_openai_api("TRENDING TOPIC: test")
+
+        assert reply == '{"turkish_text": "Merhaba"}'
+        assert requests[0]["stream"] is True
+        assert requests[0]["response_format"] == {"type": "json_object"}
+        assert requests[0]["stream_options"] == {"include_usage": True}
+        assert requests[0]["messages"][0]["role"] == "system"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_call_openai_api_retries_rate_limit(self, monkeypatch):
+        """Test that a 429 is retried instead of falling back immediately."""
+        body = (
+            'data: {"choices": [{"delta": {"content": "{}"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        statuses = []
+
+        def handler(request):
+            if not statuses:
+                statuses.append(429)
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            statuses.append(200)
+            return httpx.Response(
+                200, text=body, headers={"Content-Type": "text/event-stream"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(OpenAIGenerator, "_get_client", classmethod(lambda cls: client))
+        generator = OpenAIGenerator()
+        generator.cache = None
+
+        reserved, released = [], []
+        bucket = generator._token_bucket
+        bucket.acquire = _acquire_recording(bucket, reserved)
+        bucket.release = _release_recording(bucket, released)
+
+        reply = await generator._call_openai_api("TRENDING TOPIC: test")
+
+        assert reply == "{}"
+        assert statuses == [429, 200]
+        # The rejected attempt's reservation is returned
+        assert released == reserved[:1]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_call_openai_api_retries_timeout(self, monkeypatch):
+        """Test that a timed-out request is retried."""
+        body = (
+            'data: {"choices": [{"delta": {"content": "{}"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectTimeout("timed out", request=request)
+            return httpx.Response(
+                200, text=body, headers={"Content-Type": "text/event-stream"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(OpenAIGenerator, "_get_client", classmethod(lambda cls: client))
+        monkeypatch.setattr(openai_generator, "_retry_delay", lambda retry_after, attempt: 0.0)
+        generator = OpenAIGenerator()
+        generator.cache = None
+
+        reply = await generator._call_openai_api("TRENDING TOPIC: test")
+
+        assert reply == "{}"
+        assert len(attempts) == 2
+        await client.aclose()
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            '{"turkish_text": "Merhaba", "english_text": "Hello", "hashtags": ["#Test"]}',
+            'Here you go:\n```json\n{"turkish_text": "Merhaba", "english_text": "Hello", '
+            '"hashtags": ["#Test"]}\n```',
+        ],
+    )
+    def test_parse_response(self, response):
+        """Test that plain and fenced JSON replies are both parsed."""
+        generator = OpenAIGenerator()
+        trend_item = TrendItem(
+            source=TrendSource.REDDIT,
+            external_id="test",
+            title="Test trending topic",
+        )
+
+        content = generator._parse_response(response, trend_item)
+
+        assert content.turkish_text == "Merhaba"
+        assert content.english_text == "Hello"
+        assert content.hashtags == ["#Test"]
+
+    def test_semantic_cache_drops_media_url(self):
+        """Test that near-duplicate trends share text and hashtags but not media."""
+        reply = (
+            '{"turkish_text": "Merhaba", "english_text": "Hello", '
+            '"hashtags": ["#Test"], "media_url": "https://example.com/a.jpg"}'
+        )
+
+        entry = openai_generator._semantic_cache_entry(reply)
+
+        assert json.loads(entry) == {
+            "turkish_text": "Merhaba",
+            "english_text": "Hello",
+            "hashtags": ["#Test"],
+        }
+        assert openai_generator._semantic_cache_entry("not json") is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_hit_keeps_hashtags(self, monkeypatch, tmp_path):
+        """Test that a near-duplicate trend is answered with hashtags."""
+        reply = (
+            '{"turkish_text": "Merhaba", "english_text": "Hello", '
+            '"hashtags": ["#Test"], "media_url": null}'
+        )
+        body = (
+            f"data: {json.dumps({'choices': [{'delta': {'content': reply}}]})}\n\n"
+            "data: [DONE]\n\n"
+        )
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, text=body, headers={"Content-Type": "text/event-stream"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(OpenAIGenerator, "_get_client", classmethod(lambda cls: client))
+        generator = OpenAIGenerator()
+        generator._use_mock = False
+        generator.cache = None
+        generator.semantic_cache = SemanticCache(
+            str(tmp_path / "cache.db"), ttl_seconds=3600, threshold=0.9
+        )
+
+        async def fake_embed(text):
+            return [1.0, 0.0]
+
+        generator._embed = fake_embed
+        first, second = [
+            TrendItem(source=TrendSource.REDDIT, external_id=str(i), title=title)
+            for i, title in enumerate(["Test topic", "Test topic again"])
+        ]
+
+        await generator.generate_tweet_content(first)
+        content = await generator.generate_tweet_content(second)
+
+        assert len(requests) == 1
+        assert content.turkish_text == "Merhaba"
+        assert content.hashtags == ["#Test"]
+        generator.semantic_cache.close()
+        await client.aclose()
+
+
+class TestResponseCache:
+    """Test persistent AI response cache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Test that stored responses are returned for the same key."""
+        cache = ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=3600)
+        key = cache.make_key('{"prompt": "hello"}')
+
+        assert await cache.get(key) is None
+        await cache.set(key, '{"turkish_text": "merhaba"}')
+        assert await cache.get(key) == '{"turkish_text": "merhaba"}'
+        assert await cache.get(cache.make_key('{"prompt": "other"}')) is None
+
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_ignored(self, tmp_path):
+        """Test that entries older than the TTL count as misses."""
+        cache = ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=-1)
+        key = cache.make_key("payload")
+
+        await cache.set(key, "response")
+
+        assert await cache.get(key) is None
+        cache.close()
+
+
+class TestSemanticCache:
+    """Test embedding-similarity AI response cache."""
+
+    @pytest.mark.asyncio
+    async def test_similar_embeddings_hit(self, tmp_path):
+        """Test that only embeddings above the threshold reuse a response."""
+        path = str(tmp_path / "cache.db")
+        cache = SemanticCache(path, ttl_seconds=3600, threshold=0.95)
+
+        assert await cache.get([1.0, 0.0, 0.0]) is None
+        await cache.set([1.0, 0.0, 0.0], "bitcoin")
+
+        assert await cache.get([0.99, 0.05, 0.0]) == "bitcoin"
+        assert await cache.get([0.7, 0.7, 0.0]) is None
+        cache.close()
+
+        # Persisted embeddings are reloaded by a fresh cache
+        reloaded = SemanticCache(path, ttl_seconds=3600, threshold=0.95)
+        assert await reloaded.get([2.0, 0.1, 0.0]) == "bitcoin"
+        reloaded.close()
+
+
+class TestTokenBucket:
+    """Test client-side rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """Test that acquiring past capacity waits for tokens to refill."""
+        bucket = TokenBucket(capacity=2, rate=100.0)
+
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        burst_elapsed = time.monotonic() - start
+        await bucket.acquire(2)
+        total_elapsed = time.monotonic() - start
+
+        assert burst_elapsed < 0.01
+        assert total_elapsed >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_clamped(self):
+        """Test that a request larger than the bucket does not block forever."""
+        bucket = TokenBucket(capacity=5, rate=1000.0)
+
+        await asyncio.wait_for(bucket.acquire(50), timeout=1.0)
+
+        assert bucket.tokens == pytest.approx(0.0, abs=1.0)
+
+    @pytest.mark.asyncio
+    async def test_release_returns_unused_tokens(self):
+        """Test that released tokens are available again, up to capacity."""
+        bucket = TokenBucket(capacity=10, rate=0.001)
+
+        await bucket.acquire(8)
+        bucket.release(5)
+
+        assert bucket.tokens == pytest.approx(7.0, abs=0.01)
+        bucket.release(100)
+        assert bucket.tokens == 10
+
+    @pytest.mark.asyncio
+    async def test_restore_refills_for_time_since_snapshot(self):
+        """Test that a restored bucket resumes from a snapshot plus refill."""
+        bucket = TokenBucket(capacity=10, rate=0.5)
+        await bucket.acquire(9)
+        tokens, saved_at = bucket.snapshot()
+
+        restored = TokenBucket(capacity=10, rate=0.5)
+        restored.restore(tokens, saved_at - 4)
+
+        assert restored.tokens == pytest.approx(3.0, abs=0.05)
+        restored.restore(tokens, saved_at - 3600)
+        assert restored.tokens == 10
+
+
+def _acquire_recording(bucket, calls):
+    """Wrap TokenBucket.acquire, recording each amount."""
+    acquire = bucket.acquire
+
+    async def wrapper(amount=1.0):
+        calls.append(amount)
+        await acquire(amount)
+
+    return wrapper
+
+
+def _release_recording(bucket, calls):
+    """Wrap TokenBucket.release, recording each amount."""
+    release = bucket.release
+
+    def wrapper(amount):
+        calls.append(amount)
+        release(amount)
+
+    return wrapper
@@ -0,0 +1,180 @@
+"""Tests for publisher module."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import requests
+import tweepy
+
+from trendx.ai.base import TweetContent
+from trendx.publisher import mock_publisher, twitter_publisher
+from trendx.publisher.mock_publisher import MockPublisher
+from trendx.publisher.twitter_publisher import TwitterPublisher
+
+
+def _http_error(error_class, status_code, body=b"{}"):
+    """Build a tweepy HTTP error around a real requests response."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "Error"
+    response._content = body
+    return error_class(response)
+
+
+@pytest.fixture
+def twitter_publisher_with_client(monkeypatch):
+    """Twitter publisher with a mocked client and no retry delay."""
+    monkeypatch.setattr(twitter_publisher, "_retry_delay", lambda response, attempt: 0.0)
+    publisher = TwitterPublisher()
+    publisher.client = Mock()
+    yield publisher
+    publisher._executor.shutdown(wait=True)
+
+
+class TestTwitterPublisher:
+    """Test Twitter publisher retry and upload handling."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_is_retried(self, twitter_publisher_with_client):
+        """Test that a 429 is retried and the next attempt is published."""
+        client = twitter_publisher_with_client.client
+        client.create_tweet.side_effect = [
+            _http_error(tweepy.TooManyRequests, 429),
+            SimpleNamespace(data={"id": "42"}),
+        ]
+
+        result = await twitter_publisher_with_client.publish_tweet(
+            TweetContent("Merhaba", "Hello", [])
+        )
+
+        assert result.success
+        assert result.post_id == "42"
+        assert client.create_tweet.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.ConnectionError("connection reset"),
+            _http_error(tweepy.TwitterServerError, 500),
+        ],
+    )
+    async def test_ambiguous_failures_are_not_retried(
+        self, twitter_publisher_with_client, error
+    ):
+        """Test that failures which may hide a created tweet are not retried."""
+        client = twitter_publisher_with_client.client
+        client.create_tweet.side_effect = error
+
+        result = await twitter_publisher_with_client.publish_tweet(
+            TweetContent("Merhaba", "Hello", [])
+        )
+
+        assert not result.success
+        assert client.create_tweet.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_after_retry_is_success(self, twitter_publisher_with_client):
+        """Test that a duplicate 403 on a retry reports the earlier tweet."""
+        client = twitter_publisher_with_client.client
+        client.create_tweet.side_effect = [
+            _http_error(tweepy.TwitterServerError, 503),
+            _http_error(
+                tweepy.Forbidden,
+                403,
+                b'{"detail": "You are not allowed to create a Tweet with duplicate content."}',
+            ),
+        ]
+        client.get_me.return_value = SimpleNamespace(data=SimpleNamespace(id="1"))
+        client.get_users_tweets.return_value = SimpleNamespace(
+            data=[SimpleNamespace(id=7, text="Merhaba #TrendX")]
+        )
+
+        result = await twitter_publisher_with_client.publish_tweet(
+            TweetContent("Merhaba", "Hello", ["#TrendX"])
+        )
+
+        assert result.success
+        assert result.post_id == "7"
+
+    @pytest.mark.asyncio
+    async def test_first_duplicate_is_rejected(self, twitter_publisher_with_client):
+        """Test that a duplicate 403 without an earlier attempt is a failure."""
+        client = twitter_publisher_with_client.client
+        client.create_tweet.side_effect = _http_error(
+            tweepy.Forbidden, 403, b'{"detail": "duplicate content"}'
+        )
+
+        result = await twitter_publisher_with_client.publish_tweet(
+            TweetContent("Merhaba", "Hello", [])
+        )
+
+        assert not result.success
+        client.get_users_tweets.assert_not_called()
+
+    def test_concurrent_uploads_of_one_url_are_shared(self, twitter_publisher_with_client):
+        """Test that threads uploading the same URL wait for a single upload."""
+        publisher = twitter_publisher_with_client
+        publisher._media_api = Mock()
+        release = threading.Event()
+
+        def slow_upload(content):
+            release.wait(timeout=5)
+            return "99"
+
+        publisher._upload_media_file = Mock(side_effect=slow_upload)
+        content = TweetContent("a", "b", [], media_url="https://example.com/a.jpg")
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(publisher._upload_media(content)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [["99"]] * 4
+        assert publisher._upload_media_file.call_count == 1
+        assert publisher._media_uploads == {}
+        # Later posts reuse the cached media ID
+        assert publisher._upload_media(content) == ["99"]
+        assert publisher._upload_media_file.call_count == 1
+
+
+class TestMockPublisher:
+    """Test mock publisher."""
+
+    @pytest.mark.asyncio
+    async def test_thread_tweets_are_published_concurrently(self):
+        """Test that a thread's simulated delays overlap and keep their order."""
+        publisher = MockPublisher()
+        contents = [TweetContent(f"Tweet {i}", f"Tweet {i}", []) for i in range(5)]
+
+        started = time.monotonic()
+        results = await publisher.publish_thread(contents)
+
+        assert time.monotonic() - started < 0.3
+        assert [result.post_id for result in results] == [
+            f"mock_thread_1_{i}" for i in range(1, 6)
+        ]
+        assert publisher.get_published_threads()[0]["results"] == results
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, monkeypatch):
+        """Test that old tweets are dropped while post IDs keep counting."""
+        monkeypatch.setattr(mock_publisher, "_HISTORY_LIMIT", 2)
+        publisher = MockPublisher()
+
+        for i in range(3):
+            await publisher.publish_tweet(TweetContent(f"Tweet {i}", "Tweet", []))
+
+        assert [tweet["post_id"] for tweet in publisher.get_published_tweets()] == [
+            "mock_tweet_2",
+            "mock_tweet_3",
+        ]
@@ -3,26 +3,37 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from trendx.sources.reddit import RedditTrendSource
-from trendx.sources.google_trends import GoogleTrendsSource
-from trendx.sources.twitter_trends import TwitterTrendsSource
 from trendx.common.models import TrendSource
 
+TURKEY_RELATED_TITLES = [
+    "Turkey announces new policy",
+    "Istanbul'da buyuk gelisme",
+    "Turkish economy",
+    "Turkey Economy",
+    "Istanbul",
+]
+
+UNRELATED_TITLES = [
+    "Global news update",
+    "US politics",
+    "Artificial Intelligence",
+    "Climate Change",
+    "AI",
+]
+
 
 class TestRedditTrendSource:
     """Test Reddit trend source."""
     
-    def test_initialization(self):
+    def test_initialization(self, reddit_source):
         """Test source initialization."""
-        source = RedditTrendSource()
-        assert source.name == "reddit"
-        assert source.get_source_authority_score() == 0.8
+        assert reddit_source.name == "reddit"
+        assert reddit_source.get_source_authority_score() == 0.8
     
     @pytest.mark.asyncio
-    async def test_fetch_trends_mock(self):
+    async def test_fetch_trends_mock(self, reddit_source):
         """Test fetching trends with mock data."""
-        source = RedditTrendSource()
-        trends = await source.fetch_trends(limit=3)
+        trends = await reddit_source.fetch_trends(limit=3)
         
         assert len(trends) <= 3
         for trend in trends:
@@ -31,35 +42,20 @@ class TestRedditTrendSource:
             assert trend.title
             assert isinstance(trend.is_turkey_related, bool)
             assert isinstance(trend.is_global, bool)
-    
-    def test_is_turkey_related(self):
-        """Test Turkey-related content detection."""
-        source = RedditTrendSource()
-        
-        # Turkey-related content
-        assert source._is_turkey_related("Turkey announces new policy", "")
-        assert source._is_turkey_related("Istanbul'da buyuk gelisme", "")
-        assert source._is_turkey_related("Turkish economy", "")
-        
-        # Non-Turkey content
-        assert not source._is_turkey_related("Global news update", "")
-        assert not source._is_turkey_related("US politics", "")
 
 
 class TestGoogleTrendsSource:
     """Test Google Trends source."""
     
-    def test_initialization(self):
+    def test_initialization(self, google_source):
         """Test source initialization."""
-        source = GoogleTrendsSource()
-        assert source.name == "google_trends"
-        assert source.get_source_authority_score() == 0.9
+        assert google_source.name == "google_trends"
+        assert google_source.get_source_authority_score() == 0.9
     
     @pytest.mark.asyncio
-    async def test_fetch_trends_mock(self):
+    async def test_fetch_trends_mock(self, google_source):
         """Test fetching trends with mock data."""
-        source = GoogleTrendsSource()
-        trends = await source.fetch_trends(limit=3)
+        trends = await google_source.fetch_trends(limit=3)
         
         assert len(trends) <= 3
         for trend in trends:
@@ -68,35 +64,20 @@ class TestGoogleTrendsSource:
             assert trend.title.startswith("Trending:")
             assert isinstance(trend.is_turkey_related, bool)
             assert isinstance(trend.is_global, bool)
-    
-    def test_is_turkey_related(self):
-        """Test Turkey-related content detection."""
-        source = GoogleTrendsSource()
-        
-        # Turkey-related content
-        assert source._is_turkey_related("Turkey Economy")
-        assert source._is_turkey_related("Istanbul")
-        assert source._is_turkey_related("Turkish")
-        
-        # Non-Turkey content
-        assert not source._is_turkey_related("Artificial Intelligence")
-        assert not source._is_turkey_related("Climate Change")
 
 
 class TestTwitterTrendsSource:
     """Test Twitter trends source."""
     
-    def test_initialization(self):
+    def test_initialization(self, twitter_source):
         """Test source initialization."""
-        source = TwitterTrendsSource()
-        assert source.name == "twitter_trends"
-        assert source.get_source_authority_score() == 0.7
+        assert twitter_source.name == "twitter_trends"
+        assert twitter_source.get_source_authority_score() == 0.7
     
     @pytest.mark.asyncio
-    async def test_fetch_trends_mock(self):
+    async def test_fetch_trends_mock(self, twitter_source):
         """Test fetching trends with mock data."""
-        source = TwitterTrendsSource()
-        trends = await source.fetch_trends(limit=3)
+        trends = await twitter_source.fetch_trends(limit=3)
         
         assert len(trends) <= 3
         for trend in trends:
@@ -105,16 +86,15 @@ class TestTwitterTrendsSource:
             assert trend.title.startswith("Twitter Trend:")
             assert isinstance(trend.is_turkey_related, bool)
             assert isinstance(trend.is_global, bool)
-    
-    def test_is_turkey_related(self):
-        """Test Turkey-related content detection."""
-        source = TwitterTrendsSource()
-        
-        # Turkey-related content
-        assert source._is_turkey_related("Turkey")
-        assert source._is_turkey_related("Istanbul")
-        assert source._is_turkey_related("Turkish")
-        
-        # Non-Turkey content
-        assert not source._is_turkey_related("AI")
-        assert not source._is_turkey_related("Climate")
+
+
+@pytest.mark.parametrize("source_fixture", ["reddit_source", "google_source", "twitter_source"])
+def test_is_turkey_related(source_fixture, request):
+    """Test Turkey-related content detection across sources."""
+    source = request.getfixturevalue(source_fixture)
+
+    for title in TURKEY_RELATED_TITLES:
+        assert source._is_turkey_related(title), title
+
+    for title in UNRELATED_TITLES:
+        assert not source._is_turkey_related(title), title
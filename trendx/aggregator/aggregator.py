@@ -1,5 +1,6 @@
 """Main aggregator that combines scoring and deduplication."""
 
+import asyncio
 from typing import Dict, List
 
 from ..common.logging import get_logger
@@ -37,24 +38,14 @@ class TrendAggregator:
         """
         logger.info("Starting trend aggregation", limit=limit)
 
-        # Fetch from all sources
-        all_items = []
-        for source_name, source in self.sources.items():
-            try:
-                logger.info("Fetching trends from source", source=source_name)
-                items = await source.fetch_trends(limit=limit)
-                all_items.extend(items)
-                logger.info(
-                    "Fetched items from source",
-                    source=source_name,
-                    count=len(items),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch from source",
-                    source=source_name,
-                    error=str(e),
-                )
+        # Fetch from all sources concurrently
+        results = await asyncio.gather(
+            *(
+                self._safe_fetch(source_name, source, limit)
+                for source_name, source in self.sources.items()
+            )
+        )
+        all_items = [item for items in results for item in items]
 
         if not all_items:
             logger.warning("No items fetched from any source")
@@ -66,16 +57,43 @@ class TrendAggregator:
         unique_items = self.deduplicator.deduplicate(all_items)
         logger.info("Items after deduplication", count=len(unique_items))
 
-        # Score items
-        scored_items = self.scorer.calculate_scores(unique_items)
-        logger.info("Items after scoring", count=len(scored_items))
-
-        # Return top items
-        top_items = scored_items[:limit]
+        # Score items, keeping only the top ones
+        top_items = self.scorer.calculate_scores(unique_items, limit=limit)
         logger.info("Returning top items", count=len(top_items))
 
         return top_items
 
+    async def _safe_fetch(
+        self, source_name: str, source: BaseTrendSource, limit: int
+    ) -> List[TrendItem]:
+        """
+        Fetch trends from one source, logging and swallowing failures.
+
+        Args:
+            source_name: Name of the source
+            source: Source instance
+            limit: Maximum number of items to fetch
+
+        Returns:
+            Fetched trend items, or an empty list if the source failed
+        """
+        try:
+            logger.info("Fetching trends from source", source=source_name)
+            items = await source.fetch_trends(limit=limit)
+            logger.info(
+                "Fetched items from source",
+                source=source_name,
+                count=len(items),
+            )
+            return items
+        except Exception as e:
+            logger.error(
+                "Failed to fetch from source",
+                source=source_name,
+                error=str(e),
+            )
+            return []
+
     def get_source_stats(self) -> Dict[str, int]:
         """
         Get statistics about sources.
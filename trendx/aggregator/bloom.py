@@ -0,0 +1,119 @@
+"""Bloom filters over 128-bit item fingerprints."""
+
+import math
+from typing import List
+
+_LOW_64_MASK = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter for 128-bit integer fingerprints."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """
+        Initialize Bloom filter.
+
+        Args:
+            capacity: Number of fingerprints the filter is sized for
+            error_rate: Target false-positive rate at full capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, fingerprint: int) -> List[int]:
+        """
+        Derive bit positions from a fingerprint using double hashing.
+
+        The fingerprint is already a uniform 128-bit hash, so its two 64-bit
+        halves serve as the independent base hashes.
+
+        Args:
+            fingerprint: 128-bit integer fingerprint
+
+        Returns:
+            Bit positions to probe
+        """
+        h1 = fingerprint & _LOW_64_MASK
+        h2 = (fingerprint >> 64) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, fingerprint: int) -> bool:
+        bits = self.bits
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, fingerprint: int) -> None:
+        """
+        Add a fingerprint to the filter.
+
+        Args:
+            fingerprint: 128-bit integer fingerprint
+        """
+        bits = self.bits
+        for pos in self._positions(fingerprint):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by chaining progressively larger filters."""
+
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        error_rate: float = 1e-9,
+        growth_factor: int = 2,
+        tightening_ratio: float = 0.5,
+    ) -> None:
+        """
+        Initialize scalable Bloom filter.
+
+        Args:
+            initial_capacity: Capacity of the first filter
+            error_rate: Target false-positive rate of the first filter
+            growth_factor: Capacity multiplier for each new filter
+            tightening_ratio: Error-rate multiplier for each new filter
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        self.filters: List[BloomFilter] = []
+        self.clear()
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return any(fingerprint in bloom for bloom in self.filters)
+
+    def __len__(self) -> int:
+        return sum(len(bloom) for bloom in self.filters)
+
+    def add(self, fingerprint: int) -> None:
+        """
+        Add a fingerprint, allocating a new filter when the current one is full.
+
+        Args:
+            fingerprint: 128-bit integer fingerprint
+        """
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(
+                current.capacity * self.growth_factor,
+                current.error_rate * self.tightening_ratio,
+            )
+            self.filters.append(current)
+        current.add(fingerprint)
+
+    def clear(self) -> None:
+        """Drop all fingerprints and reset to a single filter."""
+        self.filters = [BloomFilter(self.initial_capacity, self.error_rate)]
@@ -1,21 +1,72 @@
 """Content deduplication implementation."""
 
-import hashlib
 import re
-from typing import List, Set
+import unicodedata
+from collections import deque
+from typing import Deque, List, Optional, Set
+
+import xxhash
+from datasketch import MinHash, MinHashLSH
 
 from ..common.logging import get_logger
 from ..common.models import TrendItem
+from .bloom import ScalableBloomFilter
 
 logger = get_logger(__name__)
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "can", "this", "that", "these",
+    "those", "i", "you", "he", "she", "it", "we", "they", "me", "him",
+    "her", "us", "them", "my", "your", "his", "its", "our", "their",
+})
+
 
 class Deduplicator:
     """Deduplication algorithm for trend items."""
 
-    def __init__(self) -> None:
-        """Initialize deduplicator."""
-        self.seen_hashes: Set[str] = set()
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        error_rate: float = 1e-9,
+        similarity_threshold: float = 0.85,
+        num_perm: int = 64,
+        shingle_size: int = 5,
+        max_indexed_titles: int = 10_000,
+    ) -> None:
+        """
+        Initialize deduplicator.
+
+        Args:
+            initial_capacity: Expected number of items across aggregation cycles
+            error_rate: Target false-positive rate for the cross-batch cache
+            similarity_threshold: Estimated Jaccard similarity of title shingles
+                above which an item counts as a near-duplicate
+            num_perm: Number of MinHash permutations
+            shingle_size: Number of tokens per title shingle; shorter titles
+                are only checked for exact duplicates
+            max_indexed_titles: Most recent kept titles held in the
+                near-duplicate index
+        """
+        self.seen_hashes = ScalableBloomFilter(
+            initial_capacity=initial_capacity, error_rate=error_rate
+        )
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Generating permutations is the costly part of MinHash(); copying an
+        # empty template reuses them for every item
+        self._minhash_template = MinHash(
+            num_perm=num_perm, hashfunc=xxhash.xxh32_intdigest
+        )
+        self.max_indexed_titles = max_indexed_titles
+        self.lsh = MinHashLSH(threshold=similarity_threshold, num_perm=num_perm)
+        # LSH keys in insertion order, so the oldest can be evicted
+        self._lsh_keys: Deque[str] = deque()
 
     def deduplicate(self, items: List[TrendItem]) -> List[TrendItem]:
         """
@@ -31,21 +82,32 @@ class Deduplicator:
             return items
 
         unique_items = []
-        seen_hashes = set()
+        batch_hashes: Set[int] = set()
 
         for item in items:
             # Generate hash for the item
             item_hash = self._generate_item_hash(item)
 
-            # Check if we've seen this item before
-            if item_hash not in seen_hashes and item_hash not in self.seen_hashes:
-                unique_items.append(item)
-                seen_hashes.add(item_hash)
-            else:
+            # Exact check within the batch, Bloom check against earlier batches
+            if item_hash in batch_hashes or item_hash in self.seen_hashes:
                 logger.debug("Duplicate item found", item_id=item.external_id)
+                continue
+
+            # Near-duplicate check against recently kept titles. Titles
+            # shorter than one shingle carry too little signal to compare.
+            minhash = self._generate_minhash(item)
+            if minhash is not None and self.lsh.query(minhash):
+                logger.debug("Near-duplicate item found", item_id=item.external_id)
+                continue
+
+            unique_items.append(item)
+            batch_hashes.add(item_hash)
+            if minhash is not None:
+                self._index_title(format(item_hash, "032x"), minhash)
 
         # Update global seen hashes
-        self.seen_hashes.update(seen_hashes)
+        for item_hash in batch_hashes:
+            self.seen_hashes.add(item_hash)
 
         logger.info(
             "Deduplication completed",
@@ -56,7 +118,7 @@ class Deduplicator:
 
         return unique_items
 
-    def _generate_item_hash(self, item: TrendItem) -> str:
+    def _generate_item_hash(self, item: TrendItem) -> int:
         """
         Generate a hash for a trend item to identify duplicates.
 
@@ -64,14 +126,59 @@ class Deduplicator:
             item: Trend item to hash
 
         Returns:
-            Hash string
+            128-bit xxh3 fingerprint
         """
         # Normalize title for comparison
         normalized_title = self._normalize_text(item.title)
 
         # Create hash from normalized title and URL
         hash_input = f"{normalized_title}|{item.url or ''}"
-        return hashlib.md5(hash_input.encode("utf-8")).hexdigest()
+        return xxhash.xxh3_128_intdigest(hash_input.encode("utf-8"))
+
+    def _generate_minhash(self, item: TrendItem) -> Optional[MinHash]:
+        """
+        Build a MinHash signature over the item's title shingles.
+
+        Args:
+            item: Trend item to sign
+
+        Returns:
+            MinHash signature of the normalized title, or None if the title
+            is shorter than one shingle
+        """
+        shingles = self._shingles(self._normalize_text(item.title))
+        if not shingles:
+            return None
+        minhash = self._minhash_template.copy()
+        minhash.update_batch(shingle.encode("utf-8") for shingle in shingles)
+        return minhash
+
+    def _shingles(self, text: str) -> List[str]:
+        """
+        Split normalized text into overlapping token shingles.
+
+        Args:
+            text: Normalized text
+
+        Returns:
+            Token shingles; empty for titles shorter than the shingle size
+        """
+        tokens = text.split()
+        size = self.shingle_size
+        return [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+
+    def _index_title(self, key: str, minhash: MinHash) -> None:
+        """
+        Add a kept title to the near-duplicate index, evicting the oldest.
+
+        Args:
+            key: LSH key of the title
+            minhash: MinHash signature of the title
+        """
+        self.lsh.insert(key, minhash)
+        self._lsh_keys.append(key)
+        while len(self._lsh_keys) > self.max_indexed_titles:
+            self.lsh.remove(self._lsh_keys.popleft())
 
     def _normalize_text(self, text: str) -> str:
         """
@@ -83,31 +190,18 @@ class Deduplicator:
         Returns:
             Normalized text
         """
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        # Fold compatibility characters (full-width, ligatures) and lowercase
+        text = unicodedata.normalize("NFKC", text).lower()
 
-        # Remove common punctuation
-        text = re.sub(r"[^\w\s]", "", text)
+        # Remove common punctuation; split() also collapses extra whitespace
+        words = _PUNCT_RE.sub("", text).split()
 
         # Remove common words that don't add meaning
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "can", "this", "that", "these",
-            "those", "i", "you", "he", "she", "it", "we", "they", "me", "him",
-            "her", "us", "them", "my", "your", "his", "her", "its", "our", "their",
-        }
-
-        words = text.split()
-        filtered_words = [word for word in words if word not in stop_words]
-
-        return " ".join(filtered_words)
+        return " ".join(word for word in words if word not in _STOP_WORDS)
 
     def clear_cache(self) -> None:
-        """Clear the seen hashes cache."""
+        """Clear the seen hashes cache and the near-duplicate index."""
         self.seen_hashes.clear()
+        self.lsh = MinHashLSH(threshold=self.similarity_threshold, num_perm=self.num_perm)
+        self._lsh_keys.clear()
         logger.info("Deduplication cache cleared")
@@ -1,7 +1,11 @@
 """Trend scoring algorithm implementation."""
 
-from datetime import datetime, timedelta
-from typing import Dict, List
+import math
+from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from ..common.logging import get_logger
 from ..common.models import TrendItem, TrendSource
@@ -9,6 +13,72 @@ from ..sources.base import BaseTrendSource
 
 logger = get_logger(__name__)
 
+# Recency decays exponentially with this half-life, floored at the minimum
+RECENCY_HALF_LIFE_HOURS = 6.0
+MIN_RECENCY_SCORE = 0.1
+
+# Authority score for sources with neither a configured nor a default score
+FALLBACK_AUTHORITY_SCORE = 0.5
+
+# Authority scores for sources that are not configured on the scorer
+DEFAULT_AUTHORITY_SCORES: Dict[TrendSource, float] = {
+    TrendSource.REDDIT: 0.8,
+    TrendSource.GOOGLE_TRENDS: 0.9,
+    TrendSource.TWITTER_TRENDS: 0.7,
+    TrendSource.YOUTUBE_TRENDING: 0.6,
+    TrendSource.RSS: 0.5,
+}
+
+# Item fields read by batch scoring, gathered in one pass per item
+_SCORING_FIELDS = (
+    "created_at",
+    "social_volume",
+    "is_turkey_related",
+    "is_global",
+    "source",
+    "title",
+)
+_get_loaded_fields = itemgetter(*_SCORING_FIELDS)
+_get_fields = attrgetter(*_SCORING_FIELDS)
+
+
+def _gather_scoring_fields(items: List[TrendItem]) -> List[Tuple[Any, ...]]:
+    """
+    Read the scoring fields of each item as a tuple.
+
+    Loaded column values are read straight from the instance dict, which
+    skips the ORM attribute instrumentation; items with expired or unloaded
+    columns fall back to regular attribute access.
+
+    Args:
+        items: Trend items to read
+
+    Returns:
+        One tuple of _SCORING_FIELDS values per item
+    """
+    rows = []
+    for item in items:
+        try:
+            rows.append(_get_loaded_fields(item.__dict__))
+        except KeyError:
+            rows.append(_get_fields(item))
+    return rows
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to naive UTC, the form numpy's datetime64 holds.
+
+    Args:
+        value: Aware datetime, or naive datetime already in UTC
+
+    Returns:
+        Naive UTC datetime
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 class TrendScorer:
     """Scoring algorithm for trend items."""
@@ -22,90 +92,169 @@ class TrendScorer:
         """
         self.sources = sources
 
-    def calculate_scores(self, items: List[TrendItem]) -> List[TrendItem]:
+        # Source authority never changes, so resolve it once per source. The
+        # table covers every TrendSource, which lets batch scoring use plain
+        # indexing with no per-item fallback branch.
+        self._authority_lut: Dict[TrendSource, float] = {}
+        for source in TrendSource:
+            configured = sources.get(source.value)
+            if configured is not None:
+                self._authority_lut[source] = configured.get_source_authority_score()
+            else:
+                self._authority_lut[source] = DEFAULT_AUTHORITY_SCORES.get(
+                    source, FALLBACK_AUTHORITY_SCORE
+                )
+
+    def calculate_scores(
+        self,
+        items: List[TrendItem],
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[TrendItem]:
         """
         Calculate scores for trend items.
 
         Args:
             items: List of trend items to score
+            limit: If given, return only the highest-scoring items
+            now: Reference time for recency (aware, or naive UTC); defaults
+                to the current time, read once for the whole batch
 
         Returns:
-            List of trend items with calculated scores
+            List of trend items with calculated scores, highest first
         """
         if not items:
             return items
 
-        # Calculate base scores
-        for item in items:
-            item.score = self._calculate_item_score(item)
+        # Calculate base scores for the whole batch at once
+        scores = self._calculate_batch_scores(items, now or datetime.now(timezone.utc))
 
         # Normalize scores
-        self._normalize_scores(items)
+        scores = self._normalize_scores(scores)
+
+        for item, score in zip(items, scores.tolist(), strict=True):
+            item.score = score
 
-        # Sort by score (highest first)
-        items.sort(key=lambda x: x.score, reverse=True)
+        if limit is not None and limit < len(items):
+            # Select the top items without sorting the whole batch
+            order = self._top_k_order(scores, limit)
+            logger.info("Calculated scores for trend items", count=len(items), limit=limit)
+            return [items[i] for i in order]
+
+        # Sort by score (highest first); stable so ties keep fetch order
+        order = np.argsort(-scores, kind="stable")
+        items[:] = [items[i] for i in order]
 
         logger.info("Calculated scores for trend items", count=len(items))
         return items
 
-    def _calculate_item_score(self, item: TrendItem) -> float:
+    @staticmethod
+    def _top_k_order(scores: np.ndarray, k: int) -> np.ndarray:
         """
-        Calculate score for a single trend item.
+        Indices of the k highest scores, in the order a stable sort would give.
+
+        Runs in O(n + k log k) instead of O(n log n). Ties at the cut-off are
+        resolved in favour of earlier items, as with a stable full sort.
 
         Args:
-            item: Trend item to score
+            scores: Score array
+            k: Number of indices to select
 
         Returns:
-            Calculated score
+            Indices of the top k scores, highest first
         """
-        score = 0.0
-
-        # Recency score (0.0 to 1.0)
-        recency_score = self._calculate_recency_score(item)
-        score += recency_score * 0.3
-
-        # Source authority score (0.0 to 1.0)
-        source_authority = self._get_source_authority(item.source)
-        score += source_authority * 0.2
-
-        # Social volume score (0.0 to 1.0)
-        social_volume_score = self._calculate_social_volume_score(item)
-        score += social_volume_score * 0.2
-
-        # Turkey/Global relevance bonus
-        relevance_bonus = self._calculate_relevance_bonus(item)
-        score += relevance_bonus * 0.2
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        n = len(scores)
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: k - len(above)]
+        top = np.concatenate((above, ties))
+        return top[np.argsort(-scores[top], kind="stable")]
+
+    def _calculate_batch_scores(
+        self, items: List[TrendItem], now: datetime
+    ) -> np.ndarray:
+        """
+        Calculate scores for a batch of trend items.
 
-        # Title quality score (0.0 to 1.0)
-        title_quality = self._calculate_title_quality_score(item)
-        score += title_quality * 0.1
+        Item attributes are gathered into per-field columns in a single pass
+        and every component is computed as a single array operation.
 
-        return min(score, 1.0)  # Cap at 1.0
+        Args:
+            items: Trend items to score
+            now: Reference time for recency (aware, or naive UTC)
 
-    def _calculate_recency_score(self, item: TrendItem) -> float:
+        Returns:
+            Array of scores aligned with items
+        """
+        count = len(items)
+        created_at, volumes, turkey, global_, sources, titles = zip(
+            *_gather_scoring_fields(items), strict=True
+        )
+
+        created_at = np.array(list(map(_naive_utc, created_at)), dtype="datetime64[us]")
+        ages_hours = (
+            np.datetime64(_naive_utc(now), "us") - created_at
+        ) / np.timedelta64(1, "h")
+        volumes = np.array(volumes, dtype=np.float64)
+        turkey_mask = np.array(turkey, dtype=bool)
+        global_mask = np.array(global_, dtype=bool)
+        authority_lut = self._authority_lut
+        authority = np.fromiter(
+            (authority_lut.get(source, FALLBACK_AUTHORITY_SCORE) for source in sources),
+            dtype=np.float64,
+            count=count,
+        )
+        title_quality = np.fromiter(
+            map(self._title_quality_score, titles), dtype=np.float64, count=count
+        )
+
+        scores = (
+            self._recency_scores(ages_hours) * 0.3
+            + authority * 0.2
+            + self._social_volume_scores(volumes) * 0.2
+            + self._relevance_bonuses(turkey_mask, global_mask) * 0.2
+            + title_quality * 0.1
+        )
+
+        return np.minimum(scores, 1.0)  # Cap at 1.0
+
+    def _calculate_recency_score(
+        self, item: TrendItem, now: Optional[datetime] = None
+    ) -> float:
         """
         Calculate recency score based on creation time.
 
         Args:
             item: Trend item
+            now: Reference time (aware, or naive UTC); defaults to the current time
 
         Returns:
             Recency score (0.0 to 1.0)
         """
-        now = datetime.utcnow()
-        age = now - item.created_at
+        age = _naive_utc(now or datetime.now(timezone.utc)) - _naive_utc(item.created_at)
+        age_hours = age.total_seconds() / 3600
+        return float(self._recency_scores(age_hours))
 
-        # Items newer than 1 hour get full score
-        if age <= timedelta(hours=1):
-            return 1.0
+    @staticmethod
+    def _recency_scores(ages_hours: np.ndarray) -> np.ndarray:
+        """
+        Map item ages to recency scores.
 
-        # Items older than 24 hours get minimum score
-        if age >= timedelta(hours=24):
-            return 0.1
+        Scores halve every RECENCY_HALF_LIFE_HOURS and never drop below
+        MIN_RECENCY_SCORE; items timestamped in the future count as brand new.
 
-        # Linear decay between 1 and 24 hours
-        hours_old = age.total_seconds() / 3600
-        return max(0.1, 1.0 - (hours_old - 1) / 23)
+        Args:
+            ages_hours: Item ages in hours
+
+        Returns:
+            Recency scores (0.1 to 1.0)
+        """
+        decay = np.exp(
+            -np.maximum(ages_hours, 0.0) * (math.log(2) / RECENCY_HALF_LIFE_HOURS)
+        )
+        return np.maximum(decay, MIN_RECENCY_SCORE)
 
     def _get_source_authority(self, source: TrendSource) -> float:
         """
@@ -117,20 +266,7 @@ class TrendScorer:
         Returns:
             Authority score (0.0 to 1.0)
         """
-        source_name = source.value
-        if source_name in self.sources:
-            return self.sources[source_name].get_source_authority_score()
-
-        # Default authority scores
-        authority_scores = {
-            TrendSource.REDDIT: 0.8,
-            TrendSource.GOOGLE_TRENDS: 0.9,
-            TrendSource.TWITTER_TRENDS: 0.7,
-            TrendSource.YOUTUBE_TRENDING: 0.6,
-            TrendSource.RSS: 0.5,
-        }
-
-        return authority_scores.get(source, 0.5)
+        return self._authority_lut.get(source, FALLBACK_AUTHORITY_SCORE)
 
     def _calculate_social_volume_score(self, item: TrendItem) -> float:
         """
@@ -142,17 +278,26 @@ class TrendScorer:
         Returns:
             Social volume score (0.0 to 1.0)
         """
-        if item.social_volume <= 0:
-            return 0.0
+        return float(self._social_volume_scores(item.social_volume))
+
+    @staticmethod
+    def _social_volume_scores(volumes: np.ndarray) -> np.ndarray:
+        """
+        Map social volumes to scores.
 
+        Args:
+            volumes: Social volumes
+
+        Returns:
+            Social volume scores (0.0 to 1.0)
+        """
         # Normalize based on typical ranges
         # Reddit: 0-5000, Google Trends: 0, Twitter: 0-10000
         max_volume = 5000
-        normalized_volume = min(item.social_volume / max_volume, 1.0)
+        normalized_volume = np.clip(np.asarray(volumes) / max_volume, 0.0, 1.0)
 
         # Apply logarithmic scaling to prevent very high scores
-        import math
-        return math.log(1 + normalized_volume * 9) / math.log(10)
+        return np.log10(1 + normalized_volume * 9)
 
     def _calculate_relevance_bonus(self, item: TrendItem) -> float:
         """
@@ -164,17 +309,26 @@ class TrendScorer:
         Returns:
             Relevance bonus (0.0 to 0.2)
         """
-        bonus = 0.0
+        return float(self._relevance_bonuses(item.is_turkey_related, item.is_global))
 
-        # Turkey-related content gets bonus
-        if item.is_turkey_related:
-            bonus += 0.1
+    @staticmethod
+    def _relevance_bonuses(
+        turkey_mask: np.ndarray, global_mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Map Turkey/Global flags to relevance bonuses.
 
-        # Global content gets smaller bonus
-        if item.is_global:
-            bonus += 0.05
+        Turkey-related content gets 0.1, global content a smaller 0.05.
 
-        return min(bonus, 0.2)
+        Args:
+            turkey_mask: Turkey-related flags
+            global_mask: Global flags
+
+        Returns:
+            Relevance bonuses (0.0 to 0.2)
+        """
+        bonus = 0.1 * np.asarray(turkey_mask) + 0.05 * np.asarray(global_mask)
+        return np.minimum(bonus, 0.2)
 
     def _calculate_title_quality_score(self, item: TrendItem) -> float:
         """
@@ -186,7 +340,20 @@ class TrendScorer:
         Returns:
             Title quality score (0.0 to 1.0)
         """
-        title = item.title.lower()
+        return self._title_quality_score(item.title)
+
+    @staticmethod
+    def _title_quality_score(raw_title: str) -> float:
+        """
+        Score a title on length, capitalization and punctuation.
+
+        Args:
+            raw_title: Item title
+
+        Returns:
+            Title quality score (0.0 to 1.0)
+        """
+        title = raw_title.lower()
 
         # Penalize very short titles
         if len(title) < 10:
@@ -197,7 +364,7 @@ class TrendScorer:
             return 0.5
 
         # Bonus for proper capitalization
-        if item.title[0].isupper():
+        if raw_title[0].isupper():
             score = 0.7
         else:
             score = 0.5
@@ -216,26 +383,21 @@ class TrendScorer:
 
         return min(max(score, 0.0), 1.0)
 
-    def _normalize_scores(self, items: List[TrendItem]) -> None:
+    def _normalize_scores(self, scores: np.ndarray) -> np.ndarray:
         """
         Normalize scores to ensure good distribution.
 
         Args:
-            items: List of trend items to normalize
-        """
-        if not items:
-            return
+            scores: Raw scores
 
-        scores = [item.score for item in items]
-        max_score = max(scores)
-        min_score = min(scores)
+        Returns:
+            Scores rescaled to the 0.0-1.0 range
+        """
+        min_score = scores.min()
+        span = scores.max() - min_score
 
-        if max_score == min_score:
+        if span == 0:
             # All scores are the same, set to 0.5
-            for item in items:
-                item.score = 0.5
-            return
+            return np.full_like(scores, 0.5)
 
-        # Normalize to 0.0-1.0 range
-        for item in items:
-            item.score = (item.score - min_score) / (max_score - min_score)
+        return (scores - min_score) / span
@@ -1,13 +1,55 @@
 """Base AI generator interface."""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple, Union
 
 from ..common.models import TrendItem
 
+# Code point ranges Twitter counts as one character; everything else,
+# including CJK and emoji, counts as two
+_LIGHT_RANGES = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+
+_MAX_TWEET_LENGTH = 280
+
+# Each text is posted as a tweet of its own, so each must fit one tweet
+_TWEET_TEXT_FIELDS = frozenset({"turkish_text", "english_text"})
+
+# Cached properties to drop when one of their source fields is assigned
+_CACHED_BY_FIELD = {
+    "turkish_text": ("rendered_text",),
+    "english_text": ("rendered_text",),
+    "hashtags": ("rendered_text", "_hashtag_suffix"),
+    "media_url": ("rendered_text",),
+}
+
+
+def tweet_length(text: str) -> int:
+    """
+    Measure text the way Twitter counts it against the 280 limit.
+
+    Args:
+        text: Tweet text
+
+    Returns:
+        Weighted length
+    """
+    if text.isascii():
+        return len(text)
+    length = 0
+    for char in text:
+        code = ord(char)
+        length += 1 if any(low <= code <= high for low, high in _LIGHT_RANGES) else 2
+    return length
+
 
 class TweetContent:
-    """Generated tweet content."""
+    """Generated tweet content.
+
+    Derived post text is cached on first use and dropped whenever a field it
+    is built from is assigned; replace hashtags rather than mutating the list.
+    """
 
     def __init__(
         self,
@@ -42,6 +84,52 @@ class TweetContent:
         self.quote_tweet_id = quote_tweet_id
         self.quote_tweet_url = quote_tweet_url
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Set a field, validating tweet texts and dropping stale cached text.
+
+        Raises:
+            ValueError: If a tweet text is longer than one tweet
+        """
+        if name in _TWEET_TEXT_FIELDS and tweet_length(value) > _MAX_TWEET_LENGTH:
+            raise ValueError(f"{name} exceeds {_MAX_TWEET_LENGTH} characters")
+        super().__setattr__(name, value)
+        for cached in _CACHED_BY_FIELD.get(name, ()):
+            self.__dict__.pop(cached, None)
+
+    @property
+    def hashtag_text(self) -> str:
+        """Hashtags joined by spaces, each with exactly one "#" prefix."""
+        return " ".join(f"#{tag.lstrip('#')}" for tag in self.hashtags)
+
+    @functools.cached_property
+    def rendered_text(self) -> str:
+        """
+        Full post text: both texts, hashtags and media link, blank-line separated.
+
+        Built on first use and reused by retries; attaching media later
+        rebuilds it.
+        """
+        return "\n\n".join(
+            filter(None, (self.turkish_text, self.english_text, self.hashtag_text, self.media_url))
+        )
+
+    @functools.cached_property
+    def _hashtag_suffix(self) -> Tuple[str, int]:
+        """Hashtag suffix and its weighted length, built once per hashtag list."""
+        suffix = " " + self.hashtag_text if self.hashtags else ""
+        return suffix, tweet_length(suffix)
+
+    @property
+    def hashtag_suffix(self) -> str:
+        """Hashtags as a space-prefixed suffix for the tweet text, or empty."""
+        return self._hashtag_suffix[0]
+
+    @property
+    def hashtag_suffix_length(self) -> int:
+        """Weighted tweet length of hashtag_suffix."""
+        return self._hashtag_suffix[1]
+
 
 class BaseAIGenerator(ABC):
     """Abstract base class for AI content generators."""
@@ -58,3 +146,27 @@ class BaseAIGenerator(ABC):
             Generated tweet content
         """
         pass
+
+    async def generate_batch(
+        self, items: List[TrendItem], concurrency: int = 8
+    ) -> List[Union[TweetContent, BaseException]]:
+        """
+        Generate tweet content for several trend items concurrently.
+
+        Args:
+            items: Trend items to generate content for
+            concurrency: Maximum number of generations in flight at once
+
+        Returns:
+            Generated content in the order of items; a failed generation is
+            returned as its exception instead of aborting the batch
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(item: TrendItem) -> TweetContent:
+            async with semaphore:
+                return await self.generate_tweet_content(item)
+
+        return await asyncio.gather(
+            *(generate_one(item) for item in items), return_exceptions=True
+        )
@@ -0,0 +1,253 @@
+"""Persistent cache for AI provider responses."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..common.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """SQLite-backed cache of raw AI responses keyed by request fingerprint."""
+
+    def __init__(self, path: str, ttl_seconds: float) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(payload: str) -> str:
+        """
+        Fingerprint a serialized request payload.
+
+        Args:
+            payload: Serialized request (model, parameters and messages)
+
+        Returns:
+            Hex digest used as the cache key
+        """
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None on a miss, expiry or cache error
+        """
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as e:
+            logger.warning("Response cache lookup failed", error=str(e))
+            return None
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            response: Raw response to cache
+        """
+        try:
+            await asyncio.to_thread(self._set, key, response)
+        except sqlite3.Error as e:
+            logger.warning("Response cache write failed", error=str(e))
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the cache table."""
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, response: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            conn.commit()
+
+
+class SemanticCache:
+    """SQLite-backed cache of AI responses looked up by embedding similarity."""
+
+    def __init__(self, path: str, ttl_seconds: float, threshold: float) -> None:
+        """
+        Initialize semantic cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: How long a cached response stays valid
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # In-memory copy of the table: unit-length embeddings, one per row
+        self._embeddings: Optional[np.ndarray] = None
+        self._responses: List[str] = []
+        self._created_at: Optional[np.ndarray] = None
+
+    async def get(self, embedding: Sequence[float]) -> Optional[str]:
+        """
+        Find the cached response with the most similar embedding.
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            Cached response above the similarity threshold, or None
+        """
+        try:
+            if self._embeddings is None:
+                await asyncio.to_thread(self._load)
+        except sqlite3.Error as e:
+            logger.warning("Semantic cache load failed", error=str(e))
+            return None
+
+        query = self._unit(embedding)
+        if not self._responses or self._embeddings.shape[1] != query.shape[0]:
+            return None
+
+        similarities = self._embeddings @ query
+        similarities[self._created_at <= time.time() - self.ttl_seconds] = -np.inf
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        logger.info("Semantic cache hit", similarity=round(float(similarities[best]), 4))
+        return self._responses[best]
+
+    async def set(self, embedding: Sequence[float], response: str) -> None:
+        """
+        Store a response under its embedding.
+
+        Args:
+            embedding: Embedding of the request
+            response: Raw response to cache
+        """
+        vector = self._unit(embedding)
+        created_at = time.time()
+        try:
+            await asyncio.to_thread(self._insert, vector, response, created_at)
+        except sqlite3.Error as e:
+            logger.warning("Semantic cache write failed", error=str(e))
+            return
+        if self._embeddings is None:
+            return
+        if not self._responses:
+            self._embeddings = vector[np.newaxis, :]
+            self._responses = [response]
+            self._created_at = np.array([created_at])
+        elif self._embeddings.shape[1] == vector.shape[0]:
+            self._embeddings = np.vstack([self._embeddings, vector])
+            self._responses.append(response)
+            self._created_at = np.append(self._created_at, created_at)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the cache table."""
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "id INTEGER PRIMARY KEY, embedding BLOB NOT NULL, "
+                "response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _load(self) -> None:
+        """Read unexpired rows with the most common embedding size into memory."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT embedding, response, created_at FROM semantic_cache "
+                "WHERE created_at > ? ORDER BY id",
+                (time.time() - self.ttl_seconds,),
+            ).fetchall()
+
+        vectors = [np.frombuffer(row[0], dtype=np.float32) for row in rows]
+        if not vectors:
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+            self._responses = []
+            self._created_at = np.empty(0)
+            return
+
+        # Rows from a different embedding model cannot be compared
+        sizes = [len(vector) for vector in vectors]
+        size = max(set(sizes), key=sizes.count)
+        keep = [i for i, vector in enumerate(vectors) if len(vector) == size]
+        self._embeddings = np.stack([vectors[i] for i in keep])
+        self._responses = [rows[i][1] for i in keep]
+        self._created_at = np.array([rows[i][2] for i in keep])
+
+    def _insert(self, vector: np.ndarray, response: str, created_at: float) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO semantic_cache (embedding, response, created_at) VALUES (?, ?, ?)",
+                (vector.tobytes(), response, created_at),
+            )
+            conn.commit()
@@ -1,6 +1,7 @@
 """Mock AI generator for testing and development."""
 
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Optional, Sequence
 
 from ..common.logging import get_logger
 from ..common.models import TrendItem
@@ -8,29 +9,36 @@ from .base import BaseAIGenerator, TweetContent
 
 logger = get_logger(__name__)
 
+# Read-only view: shared by every generator instance
+_MOCK_RESPONSES = MappingProxyType({
+    "reddit": {
+        "turkish": "Reddit'te trend olan bu konu hakkında daha fazla bilgi edinin.",
+        "english": "This trending topic on Reddit is worth following.",
+        "hashtags": ("#Reddit", "#Trending", "#News"),
+    },
+    "google_trends": {
+        "turkish": "Google'da trend olan bu konu dikkat çekiyor.",
+        "english": "This topic is trending on Google and gaining attention.",
+        "hashtags": ("#GoogleTrends", "#Trending", "#Search"),
+    },
+    "default": {
+        "turkish": "Bu konu şu anda gündemde ve takip edilmeye değer.",
+        "english": "This topic is currently trending and worth following.",
+        "hashtags": ("#Trending", "#News", "#Update"),
+    },
+})
+
+_TURKEY_HASHTAGS = ("#Turkey", "#Türkiye")
+_GLOBAL_HASHTAGS = ("#Global",)
+_SOURCE_HASHTAGS = {"reddit": "#Reddit", "google_trends": "#GoogleTrends"}
+
 
 class MockAIGenerator(BaseAIGenerator):
     """Mock AI generator that returns predefined content."""
 
     def __init__(self) -> None:
         """Initialize mock AI generator."""
-        self.mock_responses = {
-            "reddit": {
-                "turkish": "Reddit'te trend olan bu konu hakkında daha fazla bilgi edinin.",
-                "english": "This trending topic on Reddit is worth following.",
-                "hashtags": ["#Reddit", "#Trending", "#News"],
-            },
-            "google_trends": {
-                "turkish": "Google'da trend olan bu konu dikkat çekiyor.",
-                "english": "This topic is trending on Google and gaining attention.",
-                "hashtags": ["#GoogleTrends", "#Trending", "#Search"],
-            },
-            "default": {
-                "turkish": "Bu konu şu anda gündemde ve takip edilmeye değer.",
-                "english": "This topic is currently trending and worth following.",
-                "hashtags": ["#Trending", "#News", "#Update"],
-            },
-        }
+        self.mock_responses = _MOCK_RESPONSES
 
     async def generate_tweet_content(self, trend_item: TrendItem) -> TweetContent:
         """
@@ -100,7 +108,7 @@ class MockAIGenerator(BaseAIGenerator):
             return f"{trend_item.title}\n\n{base_text}"
         return base_text
 
-    def _customize_hashtags(self, base_hashtags: List[str], trend_item: TrendItem) -> List[str]:
+    def _customize_hashtags(self, base_hashtags: Sequence[str], trend_item: TrendItem) -> List[str]:
         """
         Customize hashtags based on trend item.
 
@@ -111,21 +119,17 @@ class MockAIGenerator(BaseAIGenerator):
         Returns:
             Customized hashtags
         """
-        hashtags = base_hashtags.copy()
-
-        # Add Turkey-related hashtags
-        if trend_item.is_turkey_related:
-            hashtags.extend(["#Turkey", "#Türkiye"])
-
-        # Add global hashtags
-        if trend_item.is_global:
-            hashtags.append("#Global")
+        # Base, Turkey-related and global hashtags in one list display
+        hashtags = [
+            *base_hashtags,
+            *(_TURKEY_HASHTAGS if trend_item.is_turkey_related else ()),
+            *(_GLOBAL_HASHTAGS if trend_item.is_global else ()),
+        ]
 
         # Add source-specific hashtags
-        if trend_item.source.value == "reddit":
-            hashtags.append("#Reddit")
-        elif trend_item.source.value == "google_trends":
-            hashtags.append("#GoogleTrends")
+        source_hashtag = _SOURCE_HASHTAGS.get(trend_item.source.value)
+        if source_hashtag:
+            hashtags.append(source_hashtag)
 
         # Limit to 5 hashtags
         return hashtags[:5]
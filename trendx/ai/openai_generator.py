@@ -1,27 +1,388 @@
 """OpenAI-based AI generator implementation."""
 
-import json
-from typing import List, Optional
+import asyncio
+import functools
+import hashlib
+import random
+import re
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
 import httpx
+import orjson
 
 from ..common.config import settings
 from ..common.logging import get_logger
-from ..common.models import TrendItem
+from ..common.models import TrendItem, TrendSource
+from ..common.rate_limiter import TokenBucket
 from .base import BaseAIGenerator, TweetContent
+from .cache import ResponseCache, SemanticCache
+from .mock_generator import MockAIGenerator
 
 logger = get_logger(__name__)
 
+# Outermost {...} span, for replies that wrap the JSON in prose or code fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+_DEFAULT_CONTEXT = "This is a general trending topic - focus on broad appeal and information"
+# Covers every source, so lookups need no default
+_CONTEXT_BY_SOURCE = MappingProxyType({
+    source: {
+        TrendSource.TWITTER_TRENDS: "This is trending on Twitter/X - focus on social media engagement and viral potential",
+        TrendSource.REDDIT: "This is trending on Reddit - focus on community discussion and detailed insights",
+        TrendSource.GOOGLE_TRENDS: "This is trending on Google - focus on search interest and information value",
+    }.get(source, _DEFAULT_CONTEXT)
+    for source in TrendSource
+})
+
+_TURKEY_TONE = "Use a tone that resonates with Turkish audience, include local context and cultural references"
+# Keyed by (is_turkey_related, is_global); Turkey relevance takes precedence
+_TONE_BY_RELEVANCE = MappingProxyType({
+    (True, True): _TURKEY_TONE,
+    (True, False): _TURKEY_TONE,
+    (False, True): "Use a tone that appeals to global audience, focus on universal themes and international perspective",
+    (False, False): "Use a balanced, informative tone that works for both local and global audiences",
+})
+
+# Trend'e uygun medya URL'leri (sadece görsel)
+_MEDIA_BY_TITLE = MappingProxyType({
+    "ABD Seçimleri 2024": ("image", "https://images.unsplash.com/photo-1529107386315-e1a2ed48a620?w=800"),
+    "Türkiye Ekonomi Paketi": ("image", "https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=800"),
+    "Galatasaray Şampiyonlar Ligi": ("image", "https://images.unsplash.com/photo-1574629810360-7efbbe195018?w=800"),
+    "NBA Final Serisi": ("image", "https://images.unsplash.com/photo-1546519638-68e109498ffc?w=800"),
+    "Fenerbahçe Transfer": ("image", "https://images.unsplash.com/photo-1574629810360-7efbbe195018?w=800"),
+    "Olimpiyat Oyunları 2024": ("image", "https://images.unsplash.com/photo-1461896836934-ffe607ba8211?w=800"),
+    "ChatGPT-5 Sızıntısı": ("image", "https://images.unsplash.com/photo-1677442136019-21780ecad995?w=800"),
+    "Apple Vision Pro 2": ("image", "https://images.unsplash.com/photo-1592478411213-6153e4ebc696?w=800"),
+    "Bitcoin 100K'ya Ulaştı": ("image", "https://images.unsplash.com/photo-1621761191319-c6fb62004040?w=800"),
+    "Türk Lirası Güçlendi": ("image", "https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=800"),
+    "Netflix Yeni Dizisi": ("image", "https://images.unsplash.com/photo-1489599803000-0b2b2b2b2b2b?w=800"),
+    "Spotify Wrapped 2024": ("image", "https://images.unsplash.com/photo-1493225457124-a3eb161ffa5f?w=800"),
+    "Yeni Kanser Tedavisi": ("image", "https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=800"),
+    "İklim Değişikliği Zirvesi": ("image", "https://images.unsplash.com/photo-1569163139394-de6e4a2be31c?w=800"),
+})
+_DEFAULT_MEDIA = ("image", "https://images.unsplash.com/photo-1611224923853-80b023f02d71?w=800")
+
+# Trend'e uygun quote tweet'ler
+_QUOTE_BY_TITLE = MappingProxyType({
+    "ABD Seçimleri 2024": ("1965000000000000000", "https://twitter.com/realDonaldTrump/status/1965000000000000000"),
+    "Türkiye Ekonomi Paketi": ("1965000000000000001", "https://twitter.com/RTErdogan/status/1965000000000000001"),
+    "Galatasaray Şampiyonlar Ligi": ("1965000000000000002", "https://twitter.com/GalatasaraySK/status/1965000000000000002"),
+    "NBA Final Serisi": ("1965000000000000003", "https://twitter.com/NBA/status/1965000000000000003"),
+    "Fenerbahçe Transfer": ("1965000000000000004", "https://twitter.com/Fenerbahce/status/1965000000000000004"),
+    "Olimpiyat Oyunları 2024": ("1965000000000000005", "https://twitter.com/Olympics/status/1965000000000000005"),
+    "ChatGPT-5 Sızıntısı": ("1965000000000000006", "https://twitter.com/OpenAI/status/1965000000000000006"),
+    "Apple Vision Pro 2": ("1965000000000000007", "https://twitter.com/Apple/status/1965000000000000007"),
+    "Bitcoin 100K'ya Ulaştı": ("1965000000000000008", "https://twitter.com/elonmusk/status/1965000000000000008"),
+    "Türk Lirası Güçlendi": ("1965000000000000009", "https://twitter.com/RTErdogan/status/1965000000000000009"),
+    "Netflix Yeni Dizisi": ("1965000000000000010", "https://twitter.com/netflix/status/1965000000000000010"),
+    "Spotify Wrapped 2024": ("1965000000000000011", "https://twitter.com/Spotify/status/1965000000000000011"),
+    "Yeni Kanser Tedavisi": ("1965000000000000012", "https://twitter.com/WHO/status/1965000000000000012"),
+    "İklim Değişikliği Zirvesi": ("1965000000000000013", "https://twitter.com/UN/status/1965000000000000013"),
+})
+
+# Instructions shared by every request, kept byte-identical at the start of
+# the conversation so the prefix stays stable across requests. OpenAI only
+# reuses cached prefixes of at least 1024 tokens; this one is shorter, so
+# it is not cached until the shared instructions grow past that.
+_SYSTEM_PROMPT = """You are a professional social media content creator for TrendX, a bilingual trending news platform.
+Generate engaging, informative, and viral-worthy tweet content.
+Always respond with valid JSON format.
+
+Each request describes one TRENDING TOPIC with its title, description, source, URL,
+Turkey/global relevance, social volume, and optionally real content found by Selenium.
+It also names the CONTEXT and TONE to use for that topic.
+
+REQUIREMENTS:
+1. Turkish tweet: 180-200 characters, engaging, use Turkish cultural references if relevant
+2. English tweet: 180-200 characters, engaging, use global cultural references if relevant
+3. Hashtags: 3-5 relevant hashtags, mix of trending and niche tags
+4. Make content shareable and discussion-worthy
+5. Include emojis appropriately (1-2 per tweet)
+6. Avoid controversial or sensitive topics
+7. Make it feel authentic and human-written
+8. Include media URL if available from Selenium results
+
+CONTEXT (the request gives one of these):
+- This is trending on Twitter/X - focus on social media engagement and viral potential
+- This is trending on Reddit - focus on community discussion and detailed insights
+- This is trending on Google - focus on search interest and information value
+- This is a general trending topic - focus on broad appeal and information
+
+TONE (the request gives one of these):
+- Use a tone that resonates with Turkish audience, include local context and cultural references
+- Use a tone that appeals to global audience, focus on universal themes and international perspective
+- Use a balanced, informative tone that works for both local and global audiences
+
+FORMAT (JSON only, no additional text):
+{
+    "turkish_text": "Turkish tweet with emojis and engaging content",
+    "english_text": "English tweet with emojis and engaging content",
+    "hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4"],
+    "media_url": "URL from Selenium results or null"
+}
+"""
+
+_SYSTEM_PROMPT_DIGEST = hashlib.blake2b(_SYSTEM_PROMPT.encode("utf-8"), digest_size=16).hexdigest()
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Completion budget for one tweet reply. A full-length Turkish tweet alone
+# can take ~150 tokens; with the English tweet, hashtags, media_url and the
+# JSON keys a long reply reaches ~330, and a reply cut off at the cap is
+# unparseable and falls back to mock content. OpenAI counts max_tokens
+# against the TPM limit, so it stays below the general ceiling.
+_MAX_OUTPUT_TOKENS = 400
+
+_TREND_TEMPLATE = """Title: {title}
+Description: {description}
+Source: {source}
+URL: {url}
+Turkey Related: {is_turkey_related}
+Global: {is_global}
+Social Volume: {social_volume}
+{selenium_data}
+CONTEXT: {context}
+TONE: {tone}
+"""
+
+_USER_MESSAGE_TEMPLATE = "TRENDING TOPIC:\n" + _TREND_TEMPLATE + "\nGenerate now:\n"
+
+# Batch API statuses that mean the job is still running
+_BATCH_RUNNING_STATUSES = frozenset({"validating", "in_progress", "finalizing"})
+
+# Trends packed into one request by generate_batch
+_BATCH_SIZE = 10
+
+_BATCH_HEADER = """Write a separate tweet for each of the {count} trending topics below, applying every rule to each topic independently.
+Respond with a JSON object of the form {{"items": [...]}} holding one object per topic, in the order given. Each object has the usual fields plus "id", set to the topic's number.
+
+"""
+
+_SELENIUM_TEMPLATE = """
+
+SELENIUM REAL CONTENT FOUND:
+- Links: {links}
+- Images: {images}
+- Videos: {videos}
+- Hashtag: #{hashtag}
+
+IMPORTANT: Use the real URLs found by Selenium! If no results, use fallback URLs:
+- Image: https://picsum.photos/800/600?random=1
+- Link: {url}
+"""
+
+
+class _SafeDict(dict):
+    """Format mapping that renders missing placeholders as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _load_json_object(text: str) -> Dict[str, Any]:
+    """
+    Parse a model reply as JSON, tolerating surrounding prose or code fences.
+
+    Args:
+        text: Raw model reply
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        orjson.JSONDecodeError: If no JSON object can be parsed
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(text)
+        if match is None:
+            raise
+        return orjson.loads(match.group(0))
+
+
+# Reply fields a near-duplicate trend may reuse: the texts and the topic
+# hashtags. media_url is dropped; _attach_media sets it per trend anyway
+_SEMANTIC_CACHE_FIELDS = ("turkish_text", "english_text", "hashtags")
+
+
+def _semantic_cache_entry(reply: str) -> Optional[str]:
+    """
+    Reduce a model reply to the fields the semantic cache may share.
+
+    Args:
+        reply: Raw model reply
+
+    Returns:
+        JSON object with only the text fields, or None if the reply is not
+        a single parseable object
+    """
+    try:
+        data = _load_json_object(reply)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return orjson.dumps(
+        {field: data[field] for field in _SEMANTIC_CACHE_FIELDS if field in data}
+    ).decode()
+
+
+# Attempts per chat completion on 429, 5xx, timeouts and connection errors
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """
+    Compute the wait before retrying a throttled or failed request.
+
+    Honors a numeric Retry-After header; otherwise uses exponential backoff
+    with full jitter so that concurrent retries spread out.
+
+    Args:
+        retry_after: Retry-After header value, if any
+        attempt: Zero-based number of the attempt that failed
+
+    Returns:
+        Seconds to wait
+    """
+    if retry_after:
+        try:
+            return min(_MAX_BACKOFF_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(_MAX_BACKOFF_SECONDS, 2 ** attempt))
+
+
+@functools.lru_cache(maxsize=2048)
+def _prompt_fingerprint(
+    title: str,
+    description: Optional[str],
+    source: str,
+    url: Optional[str],
+    is_turkey_related: bool,
+    is_global: bool,
+    social_volume: Optional[int],
+    metadata: bytes,
+) -> str:
+    """
+    Fingerprint the trend fields that determine the generated prompt.
+
+    Args:
+        title: Trend title
+        description: Trend description
+        source: Trend source value
+        url: Trend URL
+        is_turkey_related: Turkey relevance flag
+        is_global: Global relevance flag
+        social_volume: Social volume
+        metadata: Serialized trend metadata
+
+    Returns:
+        Hex digest identifying the prompt
+    """
+    payload = orjson.dumps(
+        [title, description, source, url, is_turkey_related, is_global, social_volume]
+    )
+    return hashlib.blake2b(payload + metadata, digest_size=16).hexdigest()
+
 
 class OpenAIGenerator(BaseAIGenerator):
     """OpenAI-based AI generator for tweet content."""
 
+    # Shared by all instances so keep-alive connections are reused across calls
+    _client: ClassVar[Optional[httpx.AsyncClient]] = None
+    _client_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+
     def __init__(self) -> None:
         """Initialize OpenAI generator."""
         self.api_key = settings.ai.api_key
         self.model = settings.ai.model
-        self.max_tokens = settings.ai.max_tokens
+        # settings.ai.max_tokens stays the general ceiling for other tasks
+        self.max_tokens = min(settings.ai.max_tokens, _MAX_OUTPUT_TOKENS)
         self.temperature = settings.ai.temperature
+        # Request parts that do not change between calls
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._base_data = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "stream": True,
+            # The final chunk reports usage, including prefix-cached tokens
+            "stream_options": {"include_usage": True},
+            # Routes requests sharing the system prompt to the same prefix cache
+            "prompt_cache_key": _SYSTEM_PROMPT_DIGEST,
+            # JSON mode: the model is constrained to emit a single JSON object
+            "response_format": {"type": "json_object"},
+        }
+        # Cache keys only vary in the user message
+        self._cache_prefix = self._serialize_cache_prefix(self._base_data)
+        self.cache = (
+            ResponseCache(settings.ai.cache_path, settings.ai.cache_ttl)
+            if settings.ai.cache_ttl > 0
+            else None
+        )
+        # Near-duplicate titles reuse a cached response; needs the exact cache
+        # to be enabled and shares its database file and TTL
+        self.embedding_model = settings.ai.embedding_model
+        self.semantic_cache = (
+            SemanticCache(
+                settings.ai.cache_path,
+                settings.ai.cache_ttl,
+                settings.ai.semantic_cache_threshold,
+            )
+            if self.cache is not None and settings.ai.semantic_cache
+            else None
+        )
+        # Used whenever OpenAI is unavailable or fails
+        self._fallback = MockAIGenerator()
+        # Without a real API key every call goes straight to the fallback
+        self._use_mock = not settings.ai.is_configured
+        if self._use_mock:
+            logger.warning("OpenAI API key not configured, using mock generator")
+        # Generations in progress, keyed by prompt fingerprint, so concurrent
+        # requests for the same trend share one API call
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Stay under the account limits instead of reacting to HTTP 429
+        self._request_bucket = TokenBucket.per_minute(settings.ai.requests_per_minute)
+        self._token_bucket = TokenBucket.per_minute(settings.ai.tokens_per_minute)
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        httpx connections are bound to the event loop that opened them, so a
+        new client is created when called from a different loop.
+
+        Returns:
+            Pooled HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            cls._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.ai.max_connections,
+                    max_keepalive_connections=settings.ai.max_keepalive_connections,
+                ),
+                timeout=60.0,  # Increased timeout for complex requests
+            )
+            cls._client_loop = loop
+        return cls._client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP client."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+            cls._client_loop = None
 
     async def generate_tweet_content(self, trend_item: TrendItem) -> TweetContent:
         """
@@ -33,141 +394,432 @@ class OpenAIGenerator(BaseAIGenerator):
         Returns:
             Generated tweet content
         """
-        if not self.api_key:
-            logger.warning("OpenAI API key not configured, using mock generator")
-            from .mock_generator import MockAIGenerator
-            mock_generator = MockAIGenerator()
-            return await mock_generator.generate_tweet_content(trend_item)
+        if self._use_mock:
+            return await self._fallback.generate_tweet_content(trend_item)
+
+        key = self._fingerprint(trend_item)
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._generate_with_openai(trend_item))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        else:
+            logger.info("Joining in-flight OpenAI generation", item_id=trend_item.external_id)
+
+        # Shielded so one caller's cancellation does not cancel the others
+        return await asyncio.shield(task)
 
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished generation from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    @staticmethod
+    def _fingerprint(trend_item: TrendItem) -> str:
+        """
+        Fingerprint a trend item's prompt inputs.
+
+        Args:
+            trend_item: Trend item
+
+        Returns:
+            Hex digest identifying the prompt
+        """
+        metadata = trend_item.trend_metadata
+        serialized_metadata = (
+            orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS, default=str)
+            if metadata
+            else b""
+        )
+        return _prompt_fingerprint(
+            trend_item.title,
+            trend_item.description,
+            trend_item.source.value,
+            trend_item.url,
+            trend_item.is_turkey_related,
+            trend_item.is_global,
+            trend_item.social_volume,
+            serialized_metadata,
+        )
+
+    async def _generate_with_openai(self, trend_item: TrendItem) -> TweetContent:
+        """
+        Generate tweet content with one OpenAI request, falling back to mock content.
+
+        Args:
+            trend_item: Trend item to generate content for
+
+        Returns:
+            Generated tweet content
+        """
         logger.info("Generating tweet content with OpenAI", item_id=trend_item.external_id)
 
         try:
-            prompt = self._create_prompt(trend_item)
-            response = await self._call_openai_api(prompt)
+            user_message = self._build_user_message(trend_item)
+            response = await self._call_openai_api(user_message, trend_item.title)
             
             # Parse response and add media/quote tweet support
             content = self._parse_response(response, trend_item)
-            
-            # Add media and quote tweet information
-            media_path, media_type, media_url = self._generate_media_info(trend_item)
-            quote_tweet_id, quote_tweet_url = self._generate_quote_tweet_info(trend_item)
-            
-            # Update content with media and quote tweet info
-            content.media_path = media_path
-            content.media_type = media_type
-            content.media_url = media_url
-            content.quote_tweet_id = quote_tweet_id
-            content.quote_tweet_url = quote_tweet_url
-            
-            return content
+            return self._attach_media(content, trend_item)
 
         except Exception as e:
             logger.error("Failed to generate content with OpenAI", error=str(e))
             # Fallback to mock generator
-            from .mock_generator import MockAIGenerator
-            mock_generator = MockAIGenerator()
-            return await mock_generator.generate_tweet_content(trend_item)
+            return await self._fallback.generate_tweet_content(trend_item)
+
+    async def generate_batch(
+        self, items: List[TrendItem], concurrency: int = 8
+    ) -> List[Union[TweetContent, BaseException]]:
+        """
+        Generate tweet content for several trend items, up to _BATCH_SIZE per request.
+
+        Packing trends into one request sends the shared system prompt once
+        per batch instead of once per trend. Trends missing from a batch
+        reply are generated individually.
+
+        Args:
+            items: Trend items to generate content for
+            concurrency: Maximum number of batch requests in flight at once
+
+        Returns:
+            Generated content in the order of items; a failed generation is
+            returned as its exception instead of aborting the batch
+        """
+        if self._use_mock or len(items) <= 1:
+            return await super().generate_batch(items, concurrency)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_chunk(chunk: List[TrendItem]) -> List[Union[TweetContent, BaseException]]:
+            async with semaphore:
+                replies = await self._request_batch(chunk)
+            missing = [item for item, reply in zip(chunk, replies, strict=True) if reply is None]
+            retried = iter(await super(OpenAIGenerator, self).generate_batch(missing, concurrency))
+            return [
+                self._batched_content(reply, item) if reply is not None else next(retried)
+                for item, reply in zip(chunk, replies, strict=True)
+            ]
+
+        chunks = [items[i:i + _BATCH_SIZE] for i in range(0, len(items), _BATCH_SIZE)]
+        results = await asyncio.gather(
+            *(generate_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        contents: List[Union[TweetContent, BaseException]] = []
+        for chunk, chunk_results in zip(chunks, results, strict=True):
+            if isinstance(chunk_results, BaseException):
+                contents.extend([chunk_results] * len(chunk))
+            else:
+                contents.extend(chunk_results)
+        return contents
 
-    def _create_prompt(self, trend_item: TrendItem) -> str:
+    def _batched_content(
+        self, reply: Dict[str, Any], trend_item: TrendItem
+    ) -> Union[TweetContent, BaseException]:
         """
-        Create prompt for OpenAI API with advanced prompt engineering.
+        Build content from one batch reply, returning a failure instead of raising.
+
+        Args:
+            reply: Reply object for the trend item
+            trend_item: Original trend item
+
+        Returns:
+            Tweet content, or the exception raised while building it
+        """
+        try:
+            return self._attach_media(self._content_from_data(reply, trend_item), trend_item)
+        except Exception as e:
+            logger.error(
+                "Failed to build batched content", item_id=trend_item.external_id, error=str(e)
+            )
+            return e
+
+    async def _request_batch(self, trend_items: List[TrendItem]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Request content for several trends in one OpenAI call.
+
+        Args:
+            trend_items: Trend items to generate content for
+
+        Returns:
+            Reply object for each trend item, or None where the reply is
+            missing, the request failed or only one trend was left to request
+        """
+        replies: List[Optional[Dict[str, Any]]] = [None] * len(trend_items)
+
+        # Trends seen before are answered from the cache under the same key
+        # as a single-trend request, so repeats are free on either path
+        cache_keys: List[Optional[str]] = [None] * len(trend_items)
+        if self.cache is not None:
+            cache_keys = [
+                self._cache_key(self._build_user_message(trend_item))
+                for trend_item in trend_items
+            ]
+            cached = await asyncio.gather(*(self.cache.get(key) for key in cache_keys))
+            for index, response in enumerate(cached):
+                if response is not None:
+                    try:
+                        replies[index] = _load_json_object(response)
+                    except orjson.JSONDecodeError:
+                        pass
+
+        pending = [index for index, reply in enumerate(replies) if reply is None]
+        if len(pending) <= 1:
+            # A lone trend goes through the single-trend path
+            return replies
+
+        logger.info("Generating batched tweet content with OpenAI", count=len(pending))
+        try:
+            response = await self._call_openai_api(
+                self._build_batch_message([trend_items[index] for index in pending]),
+                max_tokens=self.max_tokens * len(pending),
+            )
+            items = _load_json_object(response).get("items") or []
+        except Exception as e:
+            logger.error("Failed to generate batched content with OpenAI", error=str(e))
+            return replies
+
+        # Models echo the number as 3 or "3"; anything else cannot be matched
+        by_number = {}
+        for reply in items:
+            if isinstance(reply, dict):
+                try:
+                    by_number[int(reply.get("id"))] = reply
+                except (TypeError, ValueError):
+                    continue
+        for number, index in enumerate(pending, 1):
+            reply = by_number.get(number)
+            if reply is None:
+                continue
+            replies[index] = reply
+            if cache_keys[index] is not None:
+                await self.cache.set(cache_keys[index], orjson.dumps(reply).decode())
+        return replies
+
+    async def submit_batch_job(self, trend_items: List[TrendItem]) -> str:
+        """
+        Queue content generation for trend items with the OpenAI Batch API.
+
+        Batch jobs cost half as much as synchronous requests and do not count
+        against the per-minute limits, but may take up to 24 hours.
+
+        Args:
+            trend_items: Trend items to generate content for
+
+        Returns:
+            Batch job ID
+        """
+        body = {
+            key: value
+            for key, value in self._base_data.items()
+            if key not in ("stream", "stream_options")
+        }
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **body,
+                    "messages": [
+                        _SYSTEM_MESSAGE,
+                        {"role": "user", "content": self._build_user_message(trend_item)},
+                    ],
+                },
+            })
+            for index, trend_item in enumerate(trend_items)
+        ]
+
+        client = self._get_client()
+        auth = {"Authorization": self._headers["Authorization"]}
+        response = await client.post(
+            "https://api.openai.com/v1/files",
+            headers=auth,
+            data={"purpose": "batch"},
+            files={"file": ("trends.jsonl", b"\n".join(lines), "application/jsonl")},
+        )
+        response.raise_for_status()
+        response = await client.post(
+            "https://api.openai.com/v1/batches",
+            headers=self._headers,
+            content=orjson.dumps({
+                "input_file_id": orjson.loads(response.content)["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            }),
+        )
+        response.raise_for_status()
+        batch_id = orjson.loads(response.content)["id"]
+
+        logger.info("Submitted OpenAI batch job", batch_id=batch_id, count=len(trend_items))
+        return batch_id
+
+    async def fetch_batch_job(
+        self, batch_id: str, trend_items: List[TrendItem]
+    ) -> Optional[List[TweetContent]]:
+        """
+        Collect the output of a batch job submitted with submit_batch_job.
+
+        Args:
+            batch_id: Batch job ID
+            trend_items: Trend items the job was submitted with, in order
+
+        Returns:
+            Generated content in the order of trend_items, or None while the
+            job is still running
+
+        Raises:
+            Exception: If the job failed, expired or was cancelled
+        """
+        client = self._get_client()
+        auth = {"Authorization": self._headers["Authorization"]}
+        response = await client.get(
+            f"https://api.openai.com/v1/batches/{batch_id}", headers=auth
+        )
+        response.raise_for_status()
+        batch = orjson.loads(response.content)
+
+        status = batch.get("status")
+        if status in _BATCH_RUNNING_STATUSES:
+            return None
+        if status != "completed" or not batch.get("output_file_id"):
+            raise Exception(f"OpenAI batch job {batch_id} ended with status {status}")
+
+        response = await client.get(
+            f"https://api.openai.com/v1/files/{batch['output_file_id']}/content", headers=auth
+        )
+        response.raise_for_status()
+
+        replies: Dict[str, str] = {}
+        for line in response.content.splitlines():
+            if not line.strip():
+                continue
+            result = orjson.loads(line)
+            try:
+                body = result["response"]["body"]
+                replies[result["custom_id"]] = body["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                logger.warning("OpenAI batch request failed", custom_id=result.get("custom_id"))
+
+        contents = []
+        for index, trend_item in enumerate(trend_items):
+            reply = replies.get(str(index))
+            if reply is None:
+                # Failed requests are generated synchronously
+                contents.append(await self.generate_tweet_content(trend_item))
+            else:
+                contents.append(
+                    self._attach_media(self._parse_response(reply, trend_item), trend_item)
+                )
+
+        logger.info("Collected OpenAI batch job", batch_id=batch_id, count=len(contents))
+        return contents
+
+    def _attach_media(self, content: TweetContent, trend_item: TrendItem) -> TweetContent:
+        """Set media and quote tweet information on generated content."""
+        media_path, media_type, media_url = self._generate_media_info(trend_item)
+        quote_tweet_id, quote_tweet_url = self._generate_quote_tweet_info(trend_item)
+        
+        content.media_path = media_path
+        content.media_type = media_type
+        content.media_url = media_url
+        content.quote_tweet_id = quote_tweet_id
+        content.quote_tweet_url = quote_tweet_url
+        
+        return content
+
+    def _build_user_message(self, trend_item: TrendItem) -> str:
+        """
+        Create the per-trend part of the prompt.
+
+        The fixed instructions live in _SYSTEM_PROMPT; this message only
+        carries the trend fields and the context/tone to apply.
 
         Args:
             trend_item: Trend item
 
         Returns:
-            Formatted prompt
+            Formatted user message
+        """
+        return _USER_MESSAGE_TEMPLATE.format_map(self._trend_fields(trend_item))
+
+    def _build_batch_message(self, trend_items: List[TrendItem]) -> str:
+        """
+        Create one user message describing several trends.
+
+        Args:
+            trend_items: Trend items, numbered from 1 in the message
+
+        Returns:
+            Formatted user message
         """
+        parts = [_BATCH_HEADER.format(count=len(trend_items))]
+        for number, trend_item in enumerate(trend_items, 1):
+            parts.append(f"TRENDING TOPIC {number}:\n")
+            parts.append(_TREND_TEMPLATE.format_map(self._trend_fields(trend_item)))
+            parts.append("\n")
+        parts.append("Generate now:\n")
+        return "".join(parts)
+
+    def _trend_fields(self, trend_item: TrendItem) -> _SafeDict:
+        """Collect the template fields describing a trend item."""
         # Determine context and tone based on source and content
         context = self._get_context_info(trend_item)
         tone = self._get_tone_guidance(trend_item)
         
         # Selenium sonuçlarını kontrol et
         selenium_data = ""
-        if hasattr(trend_item, 'trend_metadata') and trend_item.trend_metadata:
-            selenium_links = trend_item.trend_metadata.get('selenium_links', [])
-            selenium_images = trend_item.trend_metadata.get('selenium_images', [])
-            selenium_videos = trend_item.trend_metadata.get('selenium_videos', [])
-            hashtag = trend_item.trend_metadata.get('hashtag', '')
+        metadata = trend_item.trend_metadata
+        if metadata:
+            selenium_links = metadata.get('selenium_links', [])
+            selenium_images = metadata.get('selenium_images', [])
+            selenium_videos = metadata.get('selenium_videos', [])
+            hashtag = metadata.get('hashtag', '')
             
             if selenium_links or selenium_images or selenium_videos:
-                selenium_data = f"""
-
-SELENIUM REAL CONTENT FOUND:
-- Links: {selenium_links[:3]}
-- Images: {selenium_images[:3]}
-- Videos: {selenium_videos[:3]}
-- Hashtag: #{hashtag}
-
-IMPORTANT: Use the real URLs found by Selenium! If no results, use fallback URLs:
-- Image: https://picsum.photos/800/600?random=1
-- Link: {trend_item.url or 'https://trends.google.com'}
-"""
+                selenium_data = _SELENIUM_TEMPLATE.format_map(_SafeDict(
+                    links=selenium_links[:3],
+                    images=selenium_images[:3],
+                    videos=selenium_videos[:3],
+                    hashtag=hashtag,
+                    url=trend_item.url or 'https://trends.google.com',
+                ))
         
-        return f"""
-You are a professional social media content creator for TrendX, a bilingual trending news platform. 
-Generate engaging, informative, and viral-worthy tweet content.
-
-TRENDING TOPIC:
-Title: {trend_item.title}
-Description: {trend_item.description or 'No description available'}
-Source: {trend_item.source.value}
-URL: {trend_item.url or 'No URL available'}
-Turkey Related: {trend_item.is_turkey_related}
-Global: {trend_item.is_global}
-Social Volume: {trend_item.social_volume or 'Unknown'}
-{selenium_data}
-
-CONTEXT: {context}
-TONE: {tone}
-
-REQUIREMENTS:
-1. Turkish tweet: 180-200 characters, engaging, use Turkish cultural references if relevant
-2. English tweet: 180-200 characters, engaging, use global cultural references if relevant
-3. Hashtags: 3-5 relevant hashtags, mix of trending and niche tags
-4. Make content shareable and discussion-worthy
-5. Include emojis appropriately (1-2 per tweet)
-6. Avoid controversial or sensitive topics
-7. Make it feel authentic and human-written
-8. Include media URL if available from Selenium results
-
-FORMAT (JSON only, no additional text):
-{{
-    "turkish_text": "Turkish tweet with emojis and engaging content",
-    "english_text": "English tweet with emojis and engaging content",
-    "hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4"],
-    "media_url": "URL from Selenium results or null"
-}}
-
-Generate now:
-"""
+        return _SafeDict(
+            title=trend_item.title,
+            description=trend_item.description or 'No description available',
+            source=trend_item.source.value,
+            url=trend_item.url or 'No URL available',
+            is_turkey_related=trend_item.is_turkey_related,
+            is_global=trend_item.is_global,
+            social_volume=trend_item.social_volume or 'Unknown',
+            selenium_data=selenium_data,
+            context=context,
+            tone=tone,
+        )
 
     def _get_context_info(self, trend_item: TrendItem) -> str:
         """Get contextual information for the trend item."""
-        if trend_item.source.value == "twitter_trends":
-            return "This is trending on Twitter/X - focus on social media engagement and viral potential"
-        elif trend_item.source.value == "reddit":
-            return "This is trending on Reddit - focus on community discussion and detailed insights"
-        elif trend_item.source.value == "google_trends":
-            return "This is trending on Google - focus on search interest and information value"
-        else:
-            return "This is a general trending topic - focus on broad appeal and information"
+        return _CONTEXT_BY_SOURCE[trend_item.source]
 
     def _get_tone_guidance(self, trend_item: TrendItem) -> str:
         """Get tone guidance based on trend characteristics."""
-        if trend_item.is_turkey_related:
-            return "Use a tone that resonates with Turkish audience, include local context and cultural references"
-        elif trend_item.is_global:
-            return "Use a tone that appeals to global audience, focus on universal themes and international perspective"
-        else:
-            return "Use a balanced, informative tone that works for both local and global audiences"
+        return _TONE_BY_RELEVANCE[
+            (bool(trend_item.is_turkey_related), bool(trend_item.is_global))
+        ]
 
-    async def _call_openai_api(self, prompt: str) -> str:
+    async def _call_openai_api(
+        self,
+        user_message: str,
+        title: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """
         Call OpenAI API with the prompt, including error handling and rate limiting.
 
         Args:
-            prompt: Prompt to send
+            user_message: Per-trend message sent after the shared system prompt
+            title: Trend title used for semantic cache lookups, if any
+            max_tokens: Completion budget, if different from the configured one
 
         Returns:
             API response
@@ -175,55 +827,117 @@ Generate now:
         Raises:
             Exception: If API call fails
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        base_data = self._base_data
+        if max_tokens is not None:
+            base_data = {**base_data, "max_tokens": max_tokens}
 
-        data = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": "You are a professional social media content creator. Always respond with valid JSON format."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-        }
+        # Identical requests are answered from the local cache
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(user_message, base_data)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached OpenAI response")
+                return cached
+
+        # Near-duplicate trends reuse the cached tweet text and hashtags;
+        # media is attached for this trend afterwards
+        embedding = None
+        if self.semantic_cache is not None and title:
+            embedding = await self._embed(title)
+            if embedding is not None:
+                cached = await self.semantic_cache.get(embedding)
+                if cached is not None:
+                    return cached
+
+        # Rough token estimate: ~4 characters per prompt token plus the
+        # completion budget
+        token_estimate = (
+            (len(_SYSTEM_PROMPT) + len(user_message)) // 4 + base_data["max_tokens"]
+        )
+
+        payload = orjson.dumps({
+            **base_data,
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": user_message}],
+        })
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=60.0,  # Increased timeout for complex requests
+            client = self._get_client()
+            for attempt in range(_MAX_ATTEMPTS):
+                # Retries draw from the buckets too, so a recovering API is
+                # not hit by every waiting request at once
+                await self._request_bucket.acquire()
+                await self._token_bucket.acquire(token_estimate)
+
+                try:
+                    async with client.stream(
+                        "POST",
+                        "https://api.openai.com/v1/chat/completions",
+                        headers=self._headers,
+                        content=payload,
+                    ) as response:
+                        status_code = response.status_code
+                        if response.is_error:
+                            # Rejected requests use no tokens; give back this
+                            # attempt's reservation before any retry
+                            self._token_bucket.release(token_estimate)
+                        retryable = status_code == 429 or status_code >= 500
+                        if retryable and attempt < _MAX_ATTEMPTS - 1:
+                            error = f"HTTP {status_code}"
+                            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+                        # Handle different HTTP status codes
+                        elif status_code == 429:
+                            logger.warning("OpenAI API rate limit exceeded, using fallback")
+                            # Don't raise exception, use fallback instead
+                            raise Exception("Use fallback")
+                        elif status_code == 401:
+                            logger.error("OpenAI API authentication failed")
+                            raise Exception("Invalid API key")
+                        elif status_code == 400:
+                            logger.error("OpenAI API bad request", status_code=status_code)
+                            raise Exception("Bad request to OpenAI API")
+                        else:
+                            if response.is_error:
+                                await response.aread()
+                                response.raise_for_status()
+
+                            content, usage = await self._read_stream(response)
+                            break
+                except httpx.TransportError as e:
+                    # The request never reached OpenAI; other transport errors
+                    # may have been processed, so their reservation stays
+                    if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                        self._token_bucket.release(token_estimate)
+                    # Timeouts and dropped connections are transient too
+                    if attempt == _MAX_ATTEMPTS - 1:
+                        raise
+                    error = str(e) or type(e).__name__
+                    delay = _retry_delay(None, attempt)
+
+                logger.warning(
+                    "OpenAI API request failed, retrying",
+                    error=error,
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
                 )
-                
-                # Handle different HTTP status codes
-                if response.status_code == 429:
-                    logger.warning("OpenAI API rate limit exceeded, using fallback")
-                    # Don't raise exception, use fallback instead
-                    raise Exception("Use fallback")
-                elif response.status_code == 401:
-                    logger.error("OpenAI API authentication failed")
-                    raise Exception("Invalid API key")
-                elif response.status_code == 400:
-                    logger.error("OpenAI API bad request", status_code=response.status_code)
-                    raise Exception("Bad request to OpenAI API")
-                
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                # Validate response structure
-                if "choices" not in result or not result["choices"]:
-                    raise Exception("Invalid response from OpenAI API")
-                
-                content = result["choices"][0]["message"]["content"]
-                if not content:
-                    raise Exception("Empty response from OpenAI API")
-                
-                return content
+                await asyncio.sleep(delay)
+            
+            # The estimate reserved the whole completion budget; give back
+            # what the reply did not use
+            if usage and usage.get("total_tokens") is not None:
+                self._token_bucket.release(max(0, token_estimate - usage["total_tokens"]))
+
+            if not content:
+                raise Exception("Empty response from OpenAI API")
+            
+            if cache_key is not None:
+                await self.cache.set(cache_key, content)
+            if embedding is not None:
+                text_fields = _semantic_cache_entry(content)
+                if text_fields is not None:
+                    await self.semantic_cache.set(embedding, text_fields)
+            
+            return content
                 
         except httpx.TimeoutException:
             logger.error("OpenAI API request timed out")
@@ -235,6 +949,106 @@ Generate now:
             logger.error("OpenAI API call failed", error=str(e))
             raise
 
+    def _cache_key(self, user_message: str, base_data: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the response cache key for a request.
+
+        Args:
+            user_message: Per-trend message sent after the shared system prompt
+            base_data: Request fields, if different from the generator defaults
+
+        Returns:
+            Cache key
+        """
+        prefix = (
+            self._cache_prefix
+            if base_data is None
+            else self._serialize_cache_prefix(base_data)
+        )
+        return self.cache.make_key(prefix + user_message)
+
+    @staticmethod
+    def _serialize_cache_prefix(base_data: Dict[str, Any]) -> str:
+        """Serialize the request fields that precede the user message in a cache key."""
+        # The system prompt is fixed, so its digest stands in for it
+        return (
+            orjson.dumps(base_data, option=orjson.OPT_SORT_KEYS).decode()
+            + "\x00"
+            + _SYSTEM_PROMPT_DIGEST
+            + "\x00"
+        )
+
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the OpenAI embeddings API.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector, or None if the request fails
+        """
+        # Embeddings have their own rate limits; only the shared token
+        # budget is charged, so completions keep their request slots
+        await self._token_bucket.acquire(len(text) // 4 + 1)
+
+        try:
+            response = await self._get_client().post(
+                "https://api.openai.com/v1/embeddings",
+                headers=self._headers,
+                content=orjson.dumps({"model": self.embedding_model, "input": text}),
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)["data"][0]["embedding"]
+        except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+            logger.warning("OpenAI embedding request failed", error=str(e))
+            return None
+
+    @staticmethod
+    async def _read_stream(response: httpx.Response) -> tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Accumulate the message text from a streamed chat completion.
+
+        Args:
+            response: Streaming response with server-sent events
+
+        Returns:
+            Tuple of (concatenated content deltas, token usage if reported)
+        """
+        parts = []
+        usage = None
+        buffer = b""
+        # Events are split on raw bytes and parsed by orjson without decoding
+        # each line to str first
+        async for data in response.aiter_bytes():
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if not line.startswith(b"data:"):
+                    continue
+                payload = line[5:].strip()
+                if payload == b"[DONE]":
+                    return "".join(parts), usage
+                chunk = orjson.loads(payload)
+                if chunk.get("usage"):
+                    usage = chunk["usage"]
+                    # Prompt tokens served from OpenAI's prefix cache
+                    details = usage.get("prompt_tokens_details") or {}
+                    logger.info(
+                        "OpenAI token usage",
+                        prompt_tokens=usage.get("prompt_tokens"),
+                        cached_tokens=details.get("cached_tokens", 0),
+                        completion_tokens=usage.get("completion_tokens"),
+                    )
+                choices = chunk.get("choices")
+                if choices:
+                    delta = choices[0].get("delta") or {}
+                    if delta.get("content"):
+                        parts.append(delta["content"])
+                    if choices[0].get("finish_reason") == "length":
+                        logger.warning("OpenAI reply was cut off at max_tokens")
+        return "".join(parts), usage
+
     def _parse_response(self, response: str, trend_item: TrendItem) -> TweetContent:
         """
         Parse OpenAI response into TweetContent.
@@ -248,47 +1062,12 @@ Generate now:
         """
         try:
             # Try to parse as JSON
-            data = json.loads(response)
-            
-            # Selenium sonuçlarını kontrol et
-            selenium_media_url = None
-            if hasattr(trend_item, 'trend_metadata') and trend_item.trend_metadata:
-                selenium_images = trend_item.trend_metadata.get('selenium_images', [])
-                if selenium_images:
-                    selenium_media_url = selenium_images[0]  # İlk görseli kullan
-            
-            # AI'dan gelen media_url'i kontrol et
-            ai_media_url = data.get("media_url")
-            if ai_media_url and ai_media_url != "null":
-                media_url = ai_media_url
-            elif selenium_media_url:
-                media_url = selenium_media_url
-            else:
-                media_url = None
-            
-            # Add media and quote tweet information
-            media_path, media_type, _ = self._generate_media_info(trend_item)
-            quote_tweet_id, quote_tweet_url = self._generate_quote_tweet_info(trend_item)
-            
-            return TweetContent(
-                turkish_text=data.get("turkish_text", ""),
-                english_text=data.get("english_text", ""),
-                hashtags=data.get("hashtags", []),
-                media_path=media_path,
-                media_type=media_type,
-                media_url=media_url,  # Selenium veya AI'dan gelen URL
-                quote_tweet_id=quote_tweet_id,
-                quote_tweet_url=quote_tweet_url,
-            )
+            return self._content_from_data(_load_json_object(response), trend_item)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse OpenAI response as JSON, using fallback")
-            # Fallback to mock generator
-            from .mock_generator import MockAIGenerator
-            mock_generator = MockAIGenerator()
-            # This is a sync call, but we're in an async context
-            # We'll handle this by returning a basic response
-            # Add media and quote tweet information for fallback too
+            # This is a sync call, so return a basic response built from the
+            # title; add media and quote tweet information for fallback too
             media_path, media_type, media_url = self._generate_media_info(trend_item)
             quote_tweet_id, quote_tweet_url = self._generate_quote_tweet_info(trend_item)
             
@@ -303,6 +1082,49 @@ Generate now:
                 quote_tweet_url=quote_tweet_url,
             )
 
+    def _content_from_data(self, data: Dict[str, Any], trend_item: TrendItem) -> TweetContent:
+        """
+        Build TweetContent from a parsed reply object.
+
+        Args:
+            data: Parsed JSON reply for one trend
+            trend_item: Original trend item
+
+        Returns:
+            Tweet content
+        """
+        # Selenium sonuçlarını kontrol et
+        selenium_media_url = None
+        metadata = trend_item.trend_metadata
+        if metadata:
+            selenium_images = metadata.get('selenium_images', [])
+            if selenium_images:
+                selenium_media_url = selenium_images[0]  # İlk görseli kullan
+        
+        # AI'dan gelen media_url'i kontrol et
+        ai_media_url = data.get("media_url")
+        if ai_media_url and ai_media_url != "null":
+            media_url = ai_media_url
+        elif selenium_media_url:
+            media_url = selenium_media_url
+        else:
+            media_url = None
+        
+        # Add media and quote tweet information
+        media_path, media_type, _ = self._generate_media_info(trend_item)
+        quote_tweet_id, quote_tweet_url = self._generate_quote_tweet_info(trend_item)
+        
+        return TweetContent(
+            turkish_text=data.get("turkish_text", ""),
+            english_text=data.get("english_text", ""),
+            hashtags=data.get("hashtags", []),
+            media_path=media_path,
+            media_type=media_type,
+            media_url=media_url,  # Selenium veya AI'dan gelen URL
+            quote_tweet_id=quote_tweet_id,
+            quote_tweet_url=quote_tweet_url,
+        )
+
     def _generate_media_info(self, trend_item: TrendItem) -> tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Generate media information for trend item using AI analysis.
@@ -313,31 +1135,9 @@ Generate now:
         Returns:
             Tuple of (media_path, media_type, media_url)
         """
-        # Trend'e uygun medya URL'leri (sadece görsel)
-        media_mapping = {
-            "ABD Seçimleri 2024": ("image", "https://images.unsplash.com/photo-1529107386315-e1a2ed48a620?w=800"),
-            "Türkiye Ekonomi Paketi": ("image", "https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=800"),
-            "Galatasaray Şampiyonlar Ligi": ("image", "https://images.unsplash.com/photo-1574629810360-7efbbe195018?w=800"),
-            "NBA Final Serisi": ("image", "https://images.unsplash.com/photo-1546519638-68e109498ffc?w=800"),
-            "Fenerbahçe Transfer": ("image", "https://images.unsplash.com/photo-1574629810360-7efbbe195018?w=800"),
-            "Olimpiyat Oyunları 2024": ("image", "https://images.unsplash.com/photo-1461896836934-ffe607ba8211?w=800"),
-            "ChatGPT-5 Sızıntısı": ("image", "https://images.unsplash.com/photo-1677442136019-21780ecad995?w=800"),
-            "Apple Vision Pro 2": ("image", "https://images.unsplash.com/photo-1592478411213-6153e4ebc696?w=800"),
-            "Bitcoin 100K'ya Ulaştı": ("image", "https://images.unsplash.com/photo-1621761191319-c6fb62004040?w=800"),
-            "Türk Lirası Güçlendi": ("image", "https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=800"),
-            "Netflix Yeni Dizisi": ("image", "https://images.unsplash.com/photo-1489599803000-0b2b2b2b2b2b?w=800"),
-            "Spotify Wrapped 2024": ("image", "https://images.unsplash.com/photo-1493225457124-a3eb161ffa5f?w=800"),
-            "Yeni Kanser Tedavisi": ("image", "https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=800"),
-            "İklim Değişikliği Zirvesi": ("image", "https://images.unsplash.com/photo-1569163139394-de6e4a2be31c?w=800"),
-        }
-        
-        # Trend başlığına göre medya bilgisi al
-        if trend_item.title in media_mapping:
-            media_type, media_url = media_mapping[trend_item.title]
-            return None, media_type, media_url
-        
-        # Varsayılan medya
-        return None, "image", "https://images.unsplash.com/photo-1611224923853-80b023f02d71?w=800"
+        # Trend başlığına göre medya bilgisi al, yoksa varsayılan medya
+        media_type, media_url = _MEDIA_BY_TITLE.get(trend_item.title, _DEFAULT_MEDIA)
+        return None, media_type, media_url
 
     def _generate_quote_tweet_info(self, trend_item: TrendItem) -> tuple[Optional[str], Optional[str]]:
         """
@@ -349,31 +1149,8 @@ Generate now:
         Returns:
             Tuple of (quote_tweet_id, quote_tweet_url)
         """
-        # Trend'e uygun quote tweet'ler
-        quote_mapping = {
-            "ABD Seçimleri 2024": ("1965000000000000000", "https://twitter.com/realDonaldTrump/status/1965000000000000000"),
-            "Türkiye Ekonomi Paketi": ("1965000000000000001", "https://twitter.com/RTErdogan/status/1965000000000000001"),
-            "Galatasaray Şampiyonlar Ligi": ("1965000000000000002", "https://twitter.com/GalatasaraySK/status/1965000000000000002"),
-            "NBA Final Serisi": ("1965000000000000003", "https://twitter.com/NBA/status/1965000000000000003"),
-            "Fenerbahçe Transfer": ("1965000000000000004", "https://twitter.com/Fenerbahce/status/1965000000000000004"),
-            "Olimpiyat Oyunları 2024": ("1965000000000000005", "https://twitter.com/Olympics/status/1965000000000000005"),
-            "ChatGPT-5 Sızıntısı": ("1965000000000000006", "https://twitter.com/OpenAI/status/1965000000000000006"),
-            "Apple Vision Pro 2": ("1965000000000000007", "https://twitter.com/Apple/status/1965000000000000007"),
-            "Bitcoin 100K'ya Ulaştı": ("1965000000000000008", "https://twitter.com/elonmusk/status/1965000000000000008"),
-            "Türk Lirası Güçlendi": ("1965000000000000009", "https://twitter.com/RTErdogan/status/1965000000000000009"),
-            "Netflix Yeni Dizisi": ("1965000000000000010", "https://twitter.com/netflix/status/1965000000000000010"),
-            "Spotify Wrapped 2024": ("1965000000000000011", "https://twitter.com/Spotify/status/1965000000000000011"),
-            "Yeni Kanser Tedavisi": ("1965000000000000012", "https://twitter.com/WHO/status/1965000000000000012"),
-            "İklim Değişikliği Zirvesi": ("1965000000000000013", "https://twitter.com/UN/status/1965000000000000013"),
-        }
-        
-        # Trend başlığına göre quote tweet bilgisi al
-        if trend_item.title in quote_mapping:
-            quote_tweet_id, quote_tweet_url = quote_mapping[trend_item.title]
-            return quote_tweet_id, quote_tweet_url
-        
-        # Varsayılan olarak None döndür
-        return None, None
+        # Trend başlığına göre quote tweet bilgisi al, yoksa None döndür
+        return _QUOTE_BY_TITLE.get(trend_item.title, (None, None))
 
     def get_source_authority_score(self) -> float:
         """Get the authority score for OpenAI generator."""
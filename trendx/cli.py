@@ -6,18 +6,32 @@ from typing import Optional
 
 import click
 
-from .aggregator import TrendAggregator
-from .ai import MockAIGenerator
+# Only lightweight modules are imported here; commands import what they use
+# so that e.g. `trendx queue` does not load the sources, AI stack or FastAPI
 from .common.config import settings
-from .common.database import create_tables, get_session
 from .common.logging import configure_logging, get_logger
-from .publisher import MockPublisher
-from .sources import RedditTrendSource, GoogleTrendsSource, TwitterTrendsSource
-from .web import create_app
 
 logger = get_logger(__name__)
 
 
+def _init_database() -> None:
+    """Create any missing database tables for commands that use the database."""
+    from .common.database import create_tables
+
+    create_tables()
+
+
+def _default_sources() -> dict:
+    """Create the trend sources used by the fetch and score commands."""
+    from .sources import RedditTrendSource, GoogleTrendsSource, TwitterTrendsSource
+
+    return {
+        "reddit": RedditTrendSource(),
+        "google_trends": GoogleTrendsSource(),
+        "twitter_trends": TwitterTrendsSource(),
+    }
+
+
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--config", "-c", help="Path to configuration file")
@@ -28,9 +42,6 @@ def cli(verbose: bool, config: Optional[str]) -> None:
         settings.logging.level = "DEBUG"
     
     configure_logging()
-    
-    # Initialize database
-    create_tables()
 
 
 @cli.command()
@@ -40,12 +51,10 @@ def fetch(limit: int, source: Optional[str]) -> None:
     """Fetch trending items from sources."""
     logger.info("Starting trend fetch", limit=limit, source=source)
 
+    from .aggregator import TrendAggregator
+
     # Initialize sources
-    sources = {
-        "reddit": RedditTrendSource(),
-        "google_trends": GoogleTrendsSource(),
-        "twitter_trends": TwitterTrendsSource(),
-    }
+    sources = _default_sources()
 
     # Filter sources if specified
     if source:
@@ -90,12 +99,10 @@ def score(limit: int) -> None:
     """Score and rank trending items."""
     logger.info("Starting trend scoring", limit=limit)
 
+    from .aggregator import TrendAggregator
+
     # Initialize sources
-    sources = {
-        "reddit": RedditTrendSource(),
-        "google_trends": GoogleTrendsSource(),
-        "twitter_trends": TwitterTrendsSource(),
-    }
+    sources = _default_sources()
 
     # Initialize aggregator
     aggregator = TrendAggregator(sources)
@@ -131,13 +138,18 @@ def queue(limit: int) -> None:
     """Show post queue status."""
     logger.info("Showing post queue", limit=limit)
 
+    from .common.database import get_session
+
+    _init_database()
+
     try:
         with get_session() as session:
+            from sqlmodel import select
             from .common.models import PostQueue
             
-            queue_items = session.query(PostQueue).order_by(
-                PostQueue.scheduled_at.desc()
-            ).limit(limit).all()
+            queue_items = session.exec(
+                select(PostQueue).order_by(PostQueue.scheduled_at.desc()).limit(limit)
+            ).all()
 
             if not queue_items:
                 click.echo("No items in post queue")
@@ -171,11 +183,13 @@ def queue(limit: int) -> None:
 @cli.command()
 @click.option("--dry-run", is_flag=True, help="Show what would be posted without actually posting")
 @click.option("--limit", "-l", default=1, help="Number of items to post")
-def post(dry_run: bool, limit: int) -> None:
+@click.option("--concurrency", "-c", default=8, help="Maximum content generations in flight")
+def post(dry_run: bool, limit: int, concurrency: int) -> None:
     """Post trending content to Twitter."""
-    logger.info("Starting post operation", dry_run=dry_run, limit=limit)
+    logger.info("Starting post operation", dry_run=dry_run, limit=limit, concurrency=concurrency)
 
     # Initialize components - Simple trends kullan (Selenium hatası var)
+    from .aggregator import TrendAggregator
     from .sources.simple_trends_fixed import SimpleTrendsFixed
     sources = {
         "simple_trends": SimpleTrendsFixed(),  # Simple trends kullan
@@ -184,8 +198,9 @@ def post(dry_run: bool, limit: int) -> None:
     aggregator = TrendAggregator(sources)
     
     # Initialize AI generator (OpenAI if configured, otherwise mock)
+    from .ai import MockAIGenerator
     from .ai.openai_generator import OpenAIGenerator
-    if settings.ai.api_key and settings.ai.api_key != "your_openai_api_key_here":
+    if settings.ai.is_configured:
         ai_generator = OpenAIGenerator()
         logger.info("Using OpenAI AI generator")
     else:
@@ -209,36 +224,54 @@ def post(dry_run: bool, limit: int) -> None:
             publisher = MockPublisher()
             logger.info("Using Mock publisher - final fallback")
 
-    try:
-        # Fetch trends
-        trends = asyncio.run(aggregator.aggregate_trends(limit=limit))
-        
-        if not trends:
-            logger.warning("No trends to post")
-            return
+    async def run_post():
+        # One event loop for the whole run so the pooled OpenAI connections
+        # are reused from one trend to the next
+        try:
+            # Fetch trends
+            trends = await aggregator.aggregate_trends(limit=limit)
+            
+            if not trends:
+                logger.warning("No trends to post")
+                return
 
-        click.echo(f"\n📝 {'Would post' if dry_run else 'Posting'} {len(trends)} items:\n")
+            click.echo(f"\n📝 {'Would post' if dry_run else 'Posting'} {len(trends)} items:\n")
 
-        for i, trend in enumerate(trends, 1):
-            # Generate content
-            content = asyncio.run(ai_generator.generate_tweet_content(trend))
-            
-            click.echo(f"{i}. {trend.title}")
-            click.echo(f"   Turkish: {content.turkish_text}")
-            click.echo(f"   English: {content.english_text}")
-            click.echo(f"   Hashtags: {' '.join(content.hashtags)}")
-            click.echo()
+            # Generate content for all trends concurrently up front; the
+            # OpenAI generator also packs several trends into each request
+            contents = await ai_generator.generate_batch(trends, concurrency=concurrency)
 
-            if not dry_run:
-                # Actually post
-                result = asyncio.run(publisher.publish_tweet(content))
+            for i, (trend, content) in enumerate(zip(trends, contents, strict=True), 1):
+                if isinstance(content, BaseException):
+                    logger.error("Content generation failed", title=trend.title, error=str(content))
+                    click.echo(f"{i}. {trend.title}")
+                    click.echo(f"   ❌ Failed to generate content: {content}")
+                    click.echo()
+                    continue
                 
-                if result.success:
-                    click.echo(f"   ✅ Posted successfully (ID: {result.post_id})")
-                else:
-                    click.echo(f"   ❌ Failed to post: {result.error_message}")
+                click.echo(f"{i}. {trend.title}")
+                click.echo(f"   Turkish: {content.turkish_text}")
+                click.echo(f"   English: {content.english_text}")
+                click.echo(f"   Hashtags: {' '.join(content.hashtags)}")
                 click.echo()
 
+                if not dry_run:
+                    # Actually post
+                    result = await publisher.publish_tweet(content)
+                    
+                    if result.success:
+                        click.echo(f"   ✅ Posted successfully (ID: {result.post_id})")
+                    else:
+                        click.echo(f"   ❌ Failed to post: {result.error_message}")
+                    click.echo()
+        finally:
+            await OpenAIGenerator.aclose()
+            if hasattr(publisher, "aclose"):
+                await publisher.aclose()
+
+    try:
+        asyncio.run(run_post())
+
     except Exception as e:
         logger.error("Error posting content", error=str(e))
         click.echo(f"Error: {e}", err=True)
@@ -252,8 +285,12 @@ def post(dry_run: bool, limit: int) -> None:
 def web(host: str, port: int, reload: bool) -> None:
     """Start the web dashboard."""
     import uvicorn
+
+    from .web import create_app
     
     logger.info("Starting web dashboard", host=host, port=port)
+
+    _init_database()
     
     app = create_app()
     
@@ -270,9 +307,12 @@ def web(host: str, port: int, reload: bool) -> None:
 def start() -> None:
     """Start the hourly tweet scheduler."""
     logger.info("Starting hourly tweet scheduler")
+
+    _init_database()
     
     try:
         import asyncio
+        from .ai.openai_generator import OpenAIGenerator
         from .scheduler.scheduler import TrendScheduler
         
         async def run_scheduler():
@@ -293,6 +333,10 @@ def start() -> None:
                 click.echo("\n🛑 Scheduler durduruluyor...")
                 scheduler.stop()
                 click.echo("✅ Scheduler durduruldu")
+            finally:
+                await OpenAIGenerator.aclose()
+                if hasattr(scheduler.publisher, "aclose"):
+                    await scheduler.publisher.aclose()
         
         # Run async scheduler
         asyncio.run(run_scheduler())
@@ -309,7 +353,7 @@ def init() -> None:
     logger.info("Initializing TrendX")
     
     # Create database tables
-    create_tables()
+    _init_database()
     
     click.echo("✅ Database initialized")
     click.echo("✅ Configuration loaded")
@@ -322,6 +366,12 @@ def init() -> None:
 
 def main() -> None:
     """Main entry point for CLI."""
+    # Every command's asyncio.run() picks up the faster uvloop event loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # uvloop is unavailable on Windows
+        pass
     cli()
 
 
@@ -0,0 +1,31 @@
+"""ChromeDriver binary lookup shared by the Selenium source and publisher."""
+
+import os
+from typing import Optional
+
+from .config import settings
+
+# Resolved once per process and shared by every Selenium driver
+_driver_path: Optional[str] = None
+
+
+def get_chromedriver_path() -> str:
+    """
+    Path of the ChromeDriver binary.
+
+    A configured path that exists on disk is used as-is; otherwise
+    webdriver-manager downloads or updates the driver, which needs network
+    access, and the result is reused for the rest of the process.
+
+    Returns:
+        ChromeDriver executable path
+    """
+    global _driver_path
+    configured = settings.twitter.browser_driver_path
+    if configured and os.path.isfile(configured):
+        return configured
+    if _driver_path is None or not os.path.isfile(_driver_path):
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        _driver_path = ChromeDriverManager().install()
+    return _driver_path
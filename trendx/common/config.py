@@ -1,15 +1,28 @@
 """Configuration management using pydantic-settings."""
 
+import functools
 from typing import List, Optional
 
-from pydantic import Field, validator
+from pydantic import Field, computed_field, validator
 from pydantic_settings import BaseSettings
 
 
+def _is_set(value: Optional[str]) -> bool:
+    """Check that a credential is present and not an env.example placeholder."""
+    return bool(value) and not (value.startswith("your_") and value.endswith("_here"))
+
+
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
 
     url: str = Field(default="sqlite:///.data/trendx.db", description="Database URL")
+    pool_size: int = Field(default=25, description="Connections kept open in the pool")
+    max_overflow: int = Field(
+        default=25, description="Extra connections allowed when the pool is exhausted"
+    )
+    pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is replaced"
+    )
 
     class Config:
         env_prefix = "DATABASE_"
@@ -32,9 +45,42 @@ class AISettings(BaseSettings):
 
     provider: str = Field(default="openai", description="AI provider")
     api_key: Optional[str] = Field(default=None, description="AI API key")
-    model: str = Field(default="gpt-3.5-turbo", description="AI model")
+    model: str = Field(default="gpt-4o-mini", description="AI model")
     max_tokens: int = Field(default=500, description="Maximum tokens")
     temperature: float = Field(default=0.7, description="Temperature for generation")
+    cache_path: str = Field(
+        default=".data/ai_cache.db", description="SQLite file for cached AI responses"
+    )
+    cache_ttl: int = Field(
+        default=86400, description="Seconds a cached AI response stays valid (0 disables)"
+    )
+    semantic_cache: bool = Field(
+        default=False, description="Reuse tweet text for near-duplicate trend titles"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95, description="Minimum title embedding cosine similarity for reuse"
+    )
+    embedding_model: str = Field(
+        default="text-embedding-3-small", description="Model used to embed trend titles"
+    )
+    max_connections: int = Field(
+        default=100, description="Maximum concurrent connections to the AI API"
+    )
+    max_keepalive_connections: int = Field(
+        default=50, description="Idle AI API connections kept open for reuse"
+    )
+    requests_per_minute: int = Field(
+        default=500, description="Client-side limit on AI API requests per minute"
+    )
+    tokens_per_minute: int = Field(
+        default=200_000, description="Client-side limit on AI API tokens per minute"
+    )
+
+    @computed_field
+    @functools.cached_property
+    def is_configured(self) -> bool:
+        """Whether a real AI API key is configured."""
+        return _is_set(self.api_key)
 
     class Config:
         env_prefix = "AI_"
@@ -51,6 +97,32 @@ class TwitterSettings(BaseSettings):
         default=None, description="Twitter access token secret"
     )
     bearer_token: Optional[str] = Field(default=None, description="Twitter bearer token")
+    browser_profile_dir: str = Field(
+        default=".data/chrome-profile",
+        description="Chrome profile directory that keeps the Selenium login session",
+    )
+    browser_driver_path: Optional[str] = Field(
+        default=None,
+        description="ChromeDriver binary for Selenium; skips webdriver-manager's network check",
+    )
+    browser_posts_per_window: int = Field(
+        default=15, description="Selenium posts allowed per 15-minute window"
+    )
+    browser_rate_state_path: str = Field(
+        default=".data/selenium_rate.db",
+        description="SQLite file that keeps the Selenium post budget across restarts",
+    )
+
+    @computed_field
+    @functools.cached_property
+    def is_configured(self) -> bool:
+        """Whether real Twitter API user credentials are configured."""
+        return all(
+            map(
+                _is_set,
+                (self.api_key, self.api_secret, self.access_token, self.access_token_secret),
+            )
+        )
 
     class Config:
         env_prefix = "TWITTER_"
@@ -100,6 +172,10 @@ class SchedulerSettings(BaseSettings):
     quiet_hours_start: int = Field(default=23, description="Quiet hours start (24h format)")
     quiet_hours_end: int = Field(default=7, description="Quiet hours end (24h format)")
     max_posts_per_day: int = Field(default=20, description="Maximum posts per day")
+    use_batch_api: bool = Field(
+        default=False,
+        description="Generate tweets one run ahead through the OpenAI Batch API",
+    )
 
     class Config:
         env_prefix = "SCHEDULER_"
@@ -193,5 +269,16 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment only once.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,24 +1,149 @@
 """Database connection and session management."""
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
+import orjson
+from sqlalchemy import bindparam, delete, event, func, select, tuple_, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel, create_engine, Session
 
 from .config import settings
+from .logging import get_logger
 
+logger = get_logger(__name__)
 
-# Create engine
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# writer, and synchronous=NORMAL is durable in WAL mode with fewer fsyncs
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+
+def _pool_options(url: str) -> dict:
+    """
+    Connection pool options for the database URL.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        Keyword arguments for create_engine
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        # In-memory SQLite uses a single shared connection, not a queue pool
+        return {}
+    return {
+        "pool_size": settings.database.pool_size,
+        "max_overflow": settings.database.max_overflow,
+        "pool_recycle": settings.database.pool_recycle,
+        # Replace connections the server dropped instead of failing the query
+        "pool_pre_ping": True,
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson, accepting what json.dumps does."""
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+
+# Create engine; the pooled connections are shared by every session
 engine = create_engine(
     settings.database.url,
     echo=False,  # Set to True for SQL debugging
+    # JSON columns (trend metadata, hashtags) are encoded and decoded by orjson
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     connect_args={"check_same_thread": False} if "sqlite" in settings.database.url else {},
+    **_pool_options(settings.database.url),
 )
 
 
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _merge_duplicate_trend_items() -> int:
+    """
+    Fold trend items stored more than once into their oldest row.
+
+    Tweet contents of the removed rows are moved to the row that is kept, so
+    the unique (source, external_id) index can be created.
+
+    Returns:
+        Number of rows removed
+    """
+    from .models import TrendItem, TweetContent
+
+    with engine.begin() as connection:
+        keys = connection.execute(
+            select(TrendItem.source, TrendItem.external_id)
+            .group_by(TrendItem.source, TrendItem.external_id)
+            .having(func.count() > 1)
+        ).all()
+        if not keys:
+            return 0
+
+        kept: dict = {}
+        merged: dict = {}
+        for trend_item_id, source, external_id in connection.execute(
+            select(TrendItem.id, TrendItem.source, TrendItem.external_id)
+            .where(tuple_(TrendItem.source, TrendItem.external_id).in_(keys))
+            .order_by(TrendItem.id)
+        ):
+            kept_id = kept.setdefault((source, external_id), trend_item_id)
+            if kept_id != trend_item_id:
+                merged[trend_item_id] = kept_id
+
+        connection.execute(
+            update(TweetContent)
+            .where(TweetContent.trend_item_id == bindparam("duplicate_id"))
+            .values(trend_item_id=bindparam("kept_id")),
+            [
+                {"duplicate_id": duplicate_id, "kept_id": kept_id}
+                for duplicate_id, kept_id in merged.items()
+            ],
+        )
+        connection.execute(delete(TrendItem).where(TrendItem.id.in_(merged)))
+    return len(merged)
+
+
 def create_tables() -> None:
-    """Create all database tables."""
+    """Create all database tables, and any indexes missing from existing ones."""
+    from . import models
+
     SQLModel.metadata.create_all(engine)
+    # create_all skips tables that already exist, including their indexes
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except IntegrityError as e:
+                # A unique index cannot be added over existing duplicate rows
+                if table is not models.TrendItem.__table__:
+                    raise
+                removed = _merge_duplicate_trend_items()
+                logger.warning(
+                    "Merged duplicate trend items before creating unique index",
+                    index=index.name,
+                    removed=removed,
+                    error=str(e.orig),
+                )
+                index.create(engine, checkfirst=True)
 
 
 @contextmanager
@@ -1,14 +1,20 @@
 """Structured logging configuration using structlog."""
 
 import sys
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from .config import settings
 
 
+def _orjson_dumps(value: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(value, default=default).decode("utf-8")
+
+
 def configure_logging() -> None:
     """Configure structured logging."""
     processors = [
@@ -22,7 +28,7 @@ def configure_logging() -> None:
     ]
 
     if settings.logging.format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -1,12 +1,31 @@
 """Common data models using SQLModel."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-import json
 from typing import List, Optional
 
+from sqlalchemy import DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel, JSON, Column
 
+# Binary JSONB on PostgreSQL (parsed once on write, GIN-indexable); plain
+# JSON text elsewhere
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+# Timestamps are UTC everywhere: timestamptz on PostgreSQL, so now() and
+# the aware Python defaults agree whatever the session time zone; SQLite
+# stores both as naive UTC text (its CURRENT_TIMESTAMP is UTC)
+_TIMESTAMP = DateTime(timezone=True)
+
+# Rows inserted outside the ORM get their timestamps from the database
+_CREATED_AT = {"server_default": func.now()}
+_UPDATED_AT = {"server_default": func.now(), "onupdate": func.now()}
+
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
 
 class TrendSource(str, Enum):
     """Trend source types."""
@@ -22,66 +41,76 @@ class TrendSource(str, Enum):
 class TrendItem(SQLModel, table=True):
     """Trend item model."""
 
+    __table_args__ = (
+        # Ingestion relies on it for INSERT ... ON CONFLICT DO NOTHING
+        Index("uq_trenditem_source_external_id", "source", "external_id", unique=True),
+        # Containment (@>) and key (?) lookups on PostgreSQL
+        Index(
+            "ix_trenditem_trend_metadata", "trend_metadata", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     source: TrendSource
     external_id: str
     title: str
     description: Optional[str] = None
     url: Optional[str] = None
-    score: float = Field(default=0.0)
+    score: float = Field(default=0.0, index=True)
     social_volume: int = Field(default=0)
     is_turkey_related: bool = Field(default=False)
     is_global: bool = Field(default=True)
-    trend_metadata: Optional[dict] = Field(default=None, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        indexes = [
-            ("source", "external_id"),
-            ("score",),
-            ("created_at",),
-        ]
+    trend_metadata: Optional[dict] = Field(default=None, sa_column=Column(_JSON))
+    created_at: datetime = Field(
+        default_factory=_utcnow, index=True, sa_type=_TIMESTAMP, sa_column_kwargs=_CREATED_AT
+    )
+    updated_at: datetime = Field(
+        default_factory=_utcnow, sa_type=_TIMESTAMP, sa_column_kwargs=_UPDATED_AT
+    )
 
 
 class TweetContent(SQLModel, table=True):
     """Tweet content model."""
 
+    __table_args__ = (
+        Index(
+            "ix_tweetcontent_hashtags", "hashtags", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    trend_item_id: int = Field(foreign_key="trenditem.id")
+    trend_item_id: int = Field(foreign_key="trenditem.id", index=True)
     turkish_text: str
     english_text: str
-    hashtags: List[str] = Field(default_factory=list, sa_column=Column(JSON))
+    hashtags: List[str] = Field(default_factory=list, sa_column=Column(_JSON))
     media_path: Optional[str] = None
     media_type: Optional[str] = None  # image, video, gif
     media_url: Optional[str] = None  # URL to media file
     quote_tweet_id: Optional[str] = None  # ID of tweet to quote
     quote_tweet_url: Optional[str] = None  # URL of tweet to quote
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        indexes = [
-            ("trend_item_id",),
-        ]
+    created_at: datetime = Field(
+        default_factory=_utcnow, sa_type=_TIMESTAMP, sa_column_kwargs=_CREATED_AT
+    )
 
 
 class PostQueue(SQLModel, table=True):
     """Post queue model."""
 
+    # Serves the scheduler's "pending and due" lookup
+    __table_args__ = (
+        Index("ix_postqueue_status_scheduled_at", "status", "scheduled_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     tweet_content_id: int = Field(foreign_key="tweetcontent.id")
-    scheduled_at: datetime
-    posted_at: Optional[datetime] = None
+    scheduled_at: datetime = Field(index=True, sa_type=_TIMESTAMP)
+    posted_at: Optional[datetime] = Field(default=None, sa_type=_TIMESTAMP)
     twitter_post_id: Optional[str] = None
     status: str = Field(default="pending")  # pending, posted, failed
     error_message: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        indexes = [
-            ("scheduled_at",),
-            ("status",),
-        ]
+    created_at: datetime = Field(
+        default_factory=_utcnow, sa_type=_TIMESTAMP, sa_column_kwargs=_CREATED_AT
+    )
 
 
 class PostHistory(SQLModel, table=True):
@@ -89,20 +118,8 @@ class PostHistory(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     post_queue_id: int = Field(foreign_key="postqueue.id")
-    twitter_post_id: str
-    posted_at: datetime = Field(default_factory=datetime.utcnow)
+    twitter_post_id: str = Field(index=True)
+    posted_at: datetime = Field(
+        default_factory=_utcnow, index=True, sa_type=_TIMESTAMP, sa_column_kwargs=_CREATED_AT
+    )
     response_data: Optional[str] = None  # JSON string
-
-    class Config:
-        indexes = [
-            ("twitter_post_id",),
-            ("posted_at",),
-        ]
-
-
-class PublishResult(SQLModel):
-    """Publish result model."""
-    
-    success: bool
-    post_id: Optional[str] = None
-    error_message: Optional[str] = None
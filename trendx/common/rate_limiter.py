@@ -0,0 +1,90 @@
+"""Client-side rate limiting."""
+
+import asyncio
+import time
+from typing import Tuple
+
+
+class TokenBucket:
+    """Async token bucket that refills continuously at a fixed rate."""
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        """
+        Initialize token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        """
+        Create a bucket that allows a per-minute limit with a full-minute burst.
+
+        Args:
+            limit: Tokens allowed per minute
+
+        Returns:
+            Token bucket
+        """
+        return cls(capacity=limit, rate=limit / 60.0)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until the requested tokens are available, then take them.
+
+        Waiters are served in arrival order. Requests larger than the bucket
+        are clamped to its capacity so they cannot wait forever.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def release(self, amount: float) -> None:
+        """
+        Return tokens that were acquired but not used.
+
+        Args:
+            amount: Number of tokens to give back
+        """
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def snapshot(self) -> Tuple[float, float]:
+        """
+        Read the bucket's state for persisting across restarts.
+
+        Returns:
+            Available tokens and the wall-clock time they were counted at
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        return self.tokens, time.time()
+
+    def restore(self, tokens: float, saved_at: float) -> None:
+        """
+        Resume from a snapshot, refilling for the time since it was taken.
+
+        Args:
+            tokens: Available tokens from snapshot()
+            saved_at: Wall-clock time from snapshot()
+        """
+        elapsed = max(0.0, time.time() - saved_at)
+        self.tokens = min(self.capacity, tokens + elapsed * self.rate)
+        self.last = time.monotonic()
@@ -1,7 +1,7 @@
 """Twitter/X publisher module."""
 
-from .base import BasePublisher
+from .base import BasePublisher, PublishResult
 from .twitter_publisher import TwitterPublisher
 from .mock_publisher import MockPublisher
 
-__all__ = ["BasePublisher", "TwitterPublisher", "MockPublisher"]
+__all__ = ["BasePublisher", "PublishResult", "TwitterPublisher", "MockPublisher"]
@@ -9,6 +9,8 @@ from ..ai.base import TweetContent
 class PublishResult:
     """Result of a publish operation."""
 
+    __slots__ = ("success", "post_id", "error_message")
+
     def __init__(
         self,
         success: bool,
@@ -1,7 +1,9 @@
 """Mock publisher for testing and development."""
 
 import asyncio
-from typing import List
+import time
+from collections import deque
+from typing import Deque, List
 
 from ..ai.base import TweetContent
 from ..common.logging import get_logger
@@ -9,14 +11,20 @@ from .base import BasePublisher, PublishResult
 
 logger = get_logger(__name__)
 
+# Most recent tweets and threads kept in memory by a long-running publisher
+_HISTORY_LIMIT = 10_000
+
 
 class MockPublisher(BasePublisher):
     """Mock publisher that simulates publishing without actually posting."""
 
     def __init__(self) -> None:
         """Initialize mock publisher."""
-        self.published_tweets = []
-        self.published_threads = []
+        self.published_tweets: Deque[dict] = deque(maxlen=_HISTORY_LIMIT)
+        self.published_threads: Deque[dict] = deque(maxlen=_HISTORY_LIMIT)
+        # Running totals, so IDs stay unique once old history is dropped
+        self._tweet_count = 0
+        self._thread_count = 0
 
     async def publish_tweet(self, content: TweetContent) -> PublishResult:
         """
@@ -34,13 +42,14 @@ class MockPublisher(BasePublisher):
         await asyncio.sleep(0.1)
 
         # Generate mock post ID
-        post_id = f"mock_tweet_{len(self.published_tweets) + 1}"
+        self._tweet_count += 1
+        post_id = f"mock_tweet_{self._tweet_count}"
 
         # Store published tweet
         self.published_tweets.append({
             "post_id": post_id,
             "content": content,
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
         })
 
         logger.info("Mock tweet published", post_id=post_id)
@@ -62,51 +71,69 @@ class MockPublisher(BasePublisher):
         """
         logger.info("Mock publishing thread", tweet_count=len(contents))
 
-        results = []
-        thread_id = f"mock_thread_{len(self.published_threads) + 1}"
-
-        for i, content in enumerate(contents):
-            # Simulate API delay
-            await asyncio.sleep(0.1)
-
-            post_id = f"{thread_id}_{i + 1}"
-            
-            results.append(PublishResult(
-                success=True,
-                post_id=post_id,
-            ))
+        self._thread_count += 1
+        thread_id = f"mock_thread_{self._thread_count}"
 
-            logger.info("Mock thread tweet published", post_id=post_id, tweet_index=i + 1)
+        # Simulated delays are independent, so they overlap
+        results = list(await asyncio.gather(*(
+            self._publish_one(thread_id, i, content)
+            for i, content in enumerate(contents)
+        )))
 
         # Store published thread
         self.published_threads.append({
             "thread_id": thread_id,
             "contents": contents,
             "results": results,
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
         })
 
         logger.info("Mock thread published", thread_id=thread_id, tweet_count=len(contents))
 
         return results
 
+    async def _publish_one(
+        self, thread_id: str, index: int, content: TweetContent
+    ) -> PublishResult:
+        """
+        Mock publish one tweet of a thread.
+
+        Args:
+            thread_id: Mock thread ID
+            index: Position of the tweet in the thread
+            content: Tweet content to publish
+
+        Returns:
+            Mock publish result
+        """
+        # Simulate API delay
+        await asyncio.sleep(0.1)
+
+        post_id = f"{thread_id}_{index + 1}"
+        logger.info("Mock thread tweet published", post_id=post_id, tweet_index=index + 1)
+
+        return PublishResult(
+            success=True,
+            post_id=post_id,
+        )
+
     def get_published_tweets(self) -> List[dict]:
         """
         Get list of published tweets.
 
         Returns:
-            List of published tweet data
+            List of the most recent published tweet data
         """
-        return self.published_tweets.copy()
+        return list(self.published_tweets)
 
     def get_published_threads(self) -> List[dict]:
         """
         Get list of published threads.
 
         Returns:
-            List of published thread data
+            List of the most recent published thread data
         """
-        return self.published_threads.copy()
+        return list(self.published_threads)
 
     def clear_history(self) -> None:
         """Clear publishing history."""
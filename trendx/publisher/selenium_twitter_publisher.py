@@ -3,31 +3,189 @@ Selenium Twitter Publisher - API rate limit'leri bypass eder
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
+import tempfile
 import time
 import random
-from typing import Optional, List
+import sqlite3
+from pathlib import Path
+from urllib.parse import urlparse
+from typing import Any, Callable, Optional, List, Sequence
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import structlog
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+import httpx
 
-from ..common.models import TweetContent, PublishResult
+from ..ai.base import TweetContent
+from ..common.chromedriver import get_chromedriver_path
+from ..common.config import settings
+from ..common.logging import get_logger
+from ..common.rate_limiter import TokenBucket
+from .base import PublishResult
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+# Selector listeleri öncelik sırasında; hepsi tek bir beklemede denenir
+# Ana sayfanın yüklendiğini gösteren elementler
+_HOME_INDICATORS = (
+    "[data-testid='tweetButton']",
+    "[data-testid='primaryColumn']",
+    "[aria-label='Home timeline']",
+    "[data-testid='tweetTextarea_0']",
+)
+_COMPOSE_SELECTORS = (
+    "[data-testid='tweetTextarea_0']",
+    "[aria-label='Post text']",
+    "[role='textbox']",
+)
+_TWEET_BUTTON_SELECTORS = (
+    "[data-testid='tweetButton']",
+    "[data-testid='tweetButtonInline']",
+    "[aria-label='Post']",
+)
+_POSTED_TWEET_SELECTORS = ("[data-testid='tweetText']",)
+_FILE_INPUT_SELECTORS = ("[data-testid='fileInput']",)
+
+_MEDIA_DOWNLOAD_TIMEOUT = 10.0
+
+# 2 = block: page images and notification prompts
+_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Post budget: browser_posts_per_window posts per window, throttled further
+# (halved, down to a floor) whenever the site stops confirming posts
+_RATE_WINDOW_SECONDS = 15 * 60
+_MIN_RATE_FACTOR = 1 / 16
+_POST_ATTEMPTS = 2
+_MAX_BACKOFF_SECONDS = 900.0
+
+# Metni tek CDP çağrısında yazar; React'in göreceği input event'ini
+# execCommand üretir. Sonuçta editörde görünen metni döner.
+_INSERT_TEXT_SCRIPT = """
+const el = arguments[0];
+el.focus();
+document.execCommand('insertText', false, arguments[1]);
+return el.innerText;
+"""
+
+# Waits inside the page instead of polling from Python: a MutationObserver
+# re-checks the selectors on every DOM change and resolves with the first
+# match, or with null once the timeout passes
+_WAIT_ANY_SCRIPT = """
+const [selectors, clickable, timeoutMs, done] = arguments;
+const usable = (el) => !clickable || (
+    el.getClientRects().length > 0 && !el.disabled
+    && el.getAttribute('aria-disabled') !== 'true'
+);
+const find = () => {
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (usable(el)) return el;
+        }
+    }
+    return null;
+};
+const found = find();
+if (found) {
+    done(found);
+    return;
+}
+const observer = new MutationObserver(() => {
+    const el = find();
+    if (el) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(el);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeoutMs);
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true});
+"""
+
+# Letters and digits of the posted text, compared against the rendered
+# tweets; emoji render as images and whitespace differs, so both are skipped
+_TWEET_VISIBLE_SCRIPT = """
+const norm = (s) => s.replace(/[^\\p{L}\\p{N}]/gu, '');
+return Array.from(document.querySelectorAll("[data-testid='tweetText']"))
+    .some((el) => norm(el.innerText).includes(arguments[0]));
+"""
+_CONFIRM_TEXT_LENGTH = 40
+
+
+def _text_fingerprint(text: str) -> str:
+    """Keep only letters and digits, as _TWEET_VISIBLE_SCRIPT does."""
+    return "".join(char for char in text if char.isalnum())
+
+
+# Upper bound for async scripts; _WAIT_ANY_SCRIPT enforces its own timeout
+_SCRIPT_TIMEOUT_SECONDS = 60
+# Pause before re-running a wait that a page navigation interrupted
+_NAVIGATION_RETRY_SECONDS = 0.25
 
 
 class SeleniumTwitterPublisher:
-    """Selenium ile Twitter'a post atan publisher - API rate limit'leri bypass eder."""
-    
+    """Selenium ile Twitter'a post atan publisher - API rate limit'leri bypass eder.
+
+    The Chrome session is started on the first publish and reused until
+    aclose(); use the publisher as an async context manager to close it.
+    Blocking WebDriver calls run on a dedicated thread so the event loop
+    keeps serving other tasks while the browser works.
+    """
+
     def __init__(self):
         self.driver: Optional[webdriver.Chrome] = None
         self.is_logged_in = False
+        # WebDriver is not thread-safe: one worker thread owns the driver
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="selenium"
+        )
+        # Downloaded media files, keyed by URL digest
+        self._media_cache: dict[str, str] = {}
+        limit = settings.twitter.browser_posts_per_window
+        self._base_rate = limit / _RATE_WINDOW_SECONDS
+        self._bucket = TokenBucket(capacity=limit, rate=self._base_rate)
+        self._bucket_restored = False
+
+    async def __aenter__(self) -> "SeleniumTwitterPublisher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Quit the Chrome session, if one is running, and drop downloaded media."""
+        await self._run(self._cleanup_driver)
+        for path in self._media_cache.values():
+            Path(path).unlink(missing_ok=True)
+        self._media_cache.clear()
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking driver call on the driver thread.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments for func
+
+        Returns:
+            Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
         
     def _setup_driver(self) -> bool:
         """Selenium driver'ı kurulum."""
@@ -42,16 +200,29 @@ class SeleniumTwitterPublisher:
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             # Headless değil - login için Chrome penceresi açık olacak
+
+            # DOM hazır olunca dön; elementler zaten _wait_any ile bekleniyor.
+            # Görseller ve bildirimler kapalı: medya input üzerinden yüklenir.
+            chrome_options.page_load_strategy = "eager"
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-features=Translate,BackForwardCache")
+            chrome_options.add_experimental_option("prefs", _CHROME_PREFS)
+
+            # Kalıcı profil: login cookie'si process yeniden başlasa da kalır
+            profile_dir = Path(settings.twitter.browser_profile_dir).resolve()
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
             
-            # Chrome driver'ı otomatik indir ve kur
-            service = Service(ChromeDriverManager().install())
+            # Chrome driver: ayarlı yol ya da otomatik indirme (process başına bir kez)
+            service = Service(get_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver.set_script_timeout(_SCRIPT_TIMEOUT_SECONDS)
             
             logger.info("✅ Selenium Twitter driver hazır!")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Selenium driver kurulum hatası: {e}")
+            logger.error("❌ Selenium driver kurulum hatası", error=str(e))
             return False
     
     def _cleanup_driver(self) -> None:
@@ -61,51 +232,89 @@ class SeleniumTwitterPublisher:
                 self.driver.quit()
                 logger.info("🧹 Selenium driver temizlendi")
             except Exception as e:
-                logger.error(f"❌ Driver temizleme hatası: {e}")
+                logger.error("❌ Driver temizleme hatası", error=str(e))
             finally:
                 self.driver = None
+                self.is_logged_in = False
+
+    def _wait_any(
+        self, selectors: Sequence[str], timeout: float = 10, clickable: bool = False
+    ) -> WebElement:
+        """
+        Wait for an element matching any of the selectors.
+
+        The wait runs in the browser and re-checks every selector on each DOM
+        change, so detection takes one round-trip and a selector that never
+        matches costs no timeout of its own. Earlier selectors win.
+
+        Args:
+            selectors: CSS selectors in priority order
+            timeout: Seconds to wait in total
+            clickable: Only accept visible, enabled elements
+
+        Returns:
+            First matching element
+
+        Raises:
+            TimeoutException: If nothing matched within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                element = self.driver.execute_async_script(
+                    _WAIT_ANY_SCRIPT, list(selectors), clickable, int(remaining * 1000)
+                )
+            except (JavascriptException, StaleElementReferenceException):
+                # Sayfa değişti (ör. home -> login yönlendirmesi); script yeni
+                # sayfada kalan süreyle yeniden başlar
+                time.sleep(_NAVIGATION_RETRY_SECONDS)
+                continue
+            if element is None:
+                break
+            return element
+        raise TimeoutException(f"No element matched {selectors} within {timeout}s")
+
+    def _home_loaded(self, timeout: float) -> bool:
+        """Ana sayfa elementlerinden biri görünüyor mu kontrol et."""
+        try:
+            self._wait_any(_HOME_INDICATORS, timeout)
+            return True
+        except TimeoutException:
+            return False
     
-    def _login_to_twitter(self) -> bool:
+    async def _login_to_twitter(self) -> bool:
         """Twitter'a manuel login - Chrome penceresi açık kalacak."""
         if not self.driver:
             return False
             
         try:
+            # Profilde kayıtlı oturum varsa manuel login gerekmez
+            await self._run(self.driver.get, "https://twitter.com/home")
+            if await self._run(self._home_loaded, 5):
+                self.is_logged_in = True
+                logger.info("✅ Kayıtlı Twitter oturumu kullanılıyor")
+                return True
+
             logger.info("🔐 Twitter'a manuel login için Chrome açılıyor...")
             
             # Twitter'a git
-            self.driver.get("https://twitter.com/login")
+            await self._run(self.driver.get, "https://twitter.com/login")
             
             # Kullanıcıya manuel login yapması için bekle
             logger.info("👤 Lütfen Chrome penceresinde Twitter'a manuel olarak login olun...")
             logger.info("⏳ Login olduktan sonra Enter'a basın...")
             
-            # Kullanıcı input'unu bekle
-            input("Login olduktan sonra Enter'a basın...")
+            # Kullanıcı input'unu bekle (event loop bu sırada çalışmaya devam eder)
+            await asyncio.to_thread(input, "Login olduktan sonra Enter'a basın...")
             
             # Login başarılı mı kontrol et
-            time.sleep(2)
+            await asyncio.sleep(2)
             
             # Ana sayfa elementlerini ara
-            home_indicators = [
-                "[data-testid='tweetButton']",
-                "[data-testid='primaryColumn']",
-                "[aria-label='Home timeline']",
-                "[data-testid='tweetTextarea_0']"
-            ]
-            
-            login_success = False
-            for indicator in home_indicators:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, indicator))
-                    )
-                    login_success = True
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not login_success:
+            if not await self._run(self._home_loaded, 5):
                 logger.error("❌ Login başarısız - ana sayfa yüklenemedi")
                 return False
             
@@ -114,7 +323,7 @@ class SeleniumTwitterPublisher:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Twitter login hatası: {e}")
+            logger.error("❌ Twitter login hatası", error=str(e))
             return False
     
     def _compose_tweet(self, content: TweetContent) -> bool:
@@ -125,170 +334,284 @@ class SeleniumTwitterPublisher:
         try:
             logger.info("✍️ Tweet yazılıyor...")
             
-            # Tweet compose alanını bul (yeni selector'lar)
-            compose_selectors = [
-                "[data-testid='tweetTextarea_0']",
-                "[data-testid='tweetTextarea_0']",
-                "[aria-label='Post text']",
-                "[data-testid='tweetTextarea_0']",
-                "div[data-testid='tweetTextarea_0']",
-                "[role='textbox']"
-            ]
-            
-            compose_area = None
-            for selector in compose_selectors:
-                try:
-                    compose_area = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"✅ Compose alanı bulundu: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not compose_area:
-                logger.error("❌ Tweet compose alanı bulunamadı")
-                return False
-            
-            # Tweet metnini hazırla
-            tweet_text = f"{content.turkish_text}\n\n{content.english_text}"
-            
-            # Hashtag'leri ekle
-            if content.hashtags:
-                hashtag_text = " ".join([f"#{tag}" for tag in content.hashtags])
-                tweet_text += f"\n\n{hashtag_text}"
+            # Tweet compose alanını bul
+            compose_area = self._wait_any(_COMPOSE_SELECTORS)
+            logger.info("✅ Compose alanı bulundu")
             
-            # Link ekle (media_url kullan)
-            if content.media_url:
-                tweet_text += f"\n\n{content.media_url}"
+            # Tweet metni: metinler, hashtag'ler ve link (media_url)
+            tweet_text = content.rendered_text
             
-            # Tweet yazma alanına tıkla ve metni gir
+            # Tweet yazma alanına tıkla ve metni tek seferde gir
             compose_area.click()
             compose_area.clear()
-            compose_area.send_keys(tweet_text)
-            
-            logger.info(f"✅ Tweet metni yazıldı: {len(tweet_text)} karakter")
+            typed = self.driver.execute_script(_INSERT_TEXT_SCRIPT, compose_area, tweet_text)
+            if "".join((typed or "").split()) != "".join(tweet_text.split()):
+                # insertText tutmadıysa tuş tuş yazmaya geri dön
+                logger.warning("⚠️ insertText tutmadı, send_keys kullanılıyor")
+                compose_area.clear()
+                compose_area.send_keys(tweet_text)
+            
+            logger.info("✅ Tweet metni yazıldı", characters=len(tweet_text))
             return True
             
         except TimeoutException:
             logger.error("❌ Tweet compose alanı bulunamadı")
             return False
         except Exception as e:
-            logger.error(f"❌ Tweet yazma hatası: {e}")
+            logger.error("❌ Tweet yazma hatası", error=str(e))
             return False
     
-    def _upload_media(self, media_url: str) -> bool:
+    def _load_rate_state(self) -> None:
+        """Resume the post budget saved by an earlier process, if any."""
+        with sqlite3.connect(settings.twitter.browser_rate_state_path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_state ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), "
+                "tokens REAL NOT NULL, rate REAL NOT NULL, saved_at REAL NOT NULL)"
+            )
+            row = conn.execute("SELECT tokens, rate, saved_at FROM rate_state").fetchone()
+        if row:
+            tokens, rate, saved_at = row
+            self._bucket.rate = min(max(rate, self._base_rate * _MIN_RATE_FACTOR), self._base_rate)
+            self._bucket.restore(tokens, saved_at)
+
+    def _save_rate_state(self) -> None:
+        """Persist the post budget so a restart cannot burst past it."""
+        tokens, saved_at = self._bucket.snapshot()
+        with sqlite3.connect(settings.twitter.browser_rate_state_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_state (id, tokens, rate, saved_at) VALUES (1, ?, ?, ?)",
+                (tokens, self._bucket.rate, saved_at),
+            )
+
+    async def _acquire_post_slot(self) -> None:
+        """Wait for the post budget, loading the saved budget on first use."""
+        if not self._bucket_restored:
+            self._bucket_restored = True
+            try:
+                Path(settings.twitter.browser_rate_state_path).parent.mkdir(
+                    parents=True, exist_ok=True
+                )
+                await asyncio.to_thread(self._load_rate_state)
+            except sqlite3.Error as e:
+                logger.warning("⚠️ Post bütçesi okunamadı", error=str(e))
+        await self._bucket.acquire()
+        await self._persist_rate_state()
+
+    async def _persist_rate_state(self) -> None:
+        """Save the post budget without blocking the event loop."""
+        try:
+            await asyncio.to_thread(self._save_rate_state)
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Post bütçesi kaydedilemedi", error=str(e))
+
+    def _on_post_timeout(self, attempt: int) -> float:
+        """
+        Treat a missing post confirmation as throttling and slow down.
+
+        Args:
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to back off before retrying
+        """
+        self._bucket.rate = max(self._bucket.rate / 2, self._base_rate * _MIN_RATE_FACTOR)
+        # One post interval at the base rate, doubled per attempt
+        delay = min(2 ** attempt / self._base_rate, _MAX_BACKOFF_SECONDS)
+        logger.warning(
+            "⏳ Tweet onayı gelmedi, yavaşlanıyor",
+            posts_per_window=round(self._bucket.rate * _RATE_WINDOW_SECONDS, 1),
+            backoff_seconds=round(delay),
+        )
+        return delay
+
+    async def _download_media(self, media_url: str) -> Optional[str]:
+        """
+        Download media to a local file, reusing earlier downloads of the URL.
+
+        Args:
+            media_url: Media URL
+
+        Returns:
+            Local file path, or None if the download failed
+        """
+        key = hashlib.sha256(media_url.encode("utf-8")).hexdigest()
+        path = self._media_cache.get(key)
+        if path is not None:
+            return path
+
+        try:
+            async with httpx.AsyncClient(
+                timeout=_MEDIA_DOWNLOAD_TIMEOUT, follow_redirects=True
+            ) as client:
+                response = await client.get(media_url)
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error("❌ Media indirme hatası", url=media_url, error=str(e))
+            return None
+
+        suffix = Path(urlparse(media_url).path).suffix
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as media_file:
+            media_file.write(response.content)
+        self._media_cache[key] = media_file.name
+        return media_file.name
+
+    def _upload_media(self, media_path: str) -> bool:
         """Media upload et."""
-        if not self.driver or not media_url:
+        if not self.driver or not media_path:
             return False
             
         try:
-            logger.info(f"📷 Media upload ediliyor: {media_url}")
+            logger.info("📷 Media upload ediliyor", path=media_path)
             
-            # Media upload butonunu bul ve tıkla
-            media_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='fileInput']"))
-            )
+            # File input gizli olduğundan tıklanabilirlik değil varlık beklenir
+            media_input = self._wait_any(_FILE_INPUT_SELECTORS)
             
-            # Media URL'ini input'a gir (bu basit bir yaklaşım)
-            # Gerçek implementasyonda media'yı download edip upload etmek gerekir
-            media_button.send_keys(media_url)
+            # input[type=file] sadece yerel dosya yolu kabul eder
+            media_input.send_keys(media_path)
             
             logger.info("✅ Media upload edildi")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Media upload hatası: {e}")
+            logger.error("❌ Media upload hatası", error=str(e))
             return False
     
-    def _post_tweet(self) -> Optional[str]:
-        """Tweet'i post et."""
+    def _click_tweet_button(self) -> bool:
+        """
+        Tweet butonuna tıkla.
+
+        Returns:
+            True once the button was clicked, False on an unexpected error
+
+        Raises:
+            TimeoutException: If the button never became clickable; nothing
+                was sent, so the caller may retry
+        """
         if not self.driver or not self.is_logged_in:
-            return None
-            
+            return False
+
         try:
             logger.info("🚀 Tweet post ediliyor...")
-            
-            # Tweet butonunu bul ve tıkla (yeni selector'lar)
-            tweet_button_selectors = [
-                "[data-testid='tweetButton']",
-                "[data-testid='tweetButtonInline']",
-                "[aria-label='Post']",
-                "button[data-testid='tweetButton']",
-                "[role='button'][data-testid='tweetButton']",
-                "button[type='button']:contains('Post')"
-            ]
-            
-            tweet_button = None
-            for selector in tweet_button_selectors:
-                try:
-                    tweet_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"✅ Tweet butonu bulundu: {selector}")
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not tweet_button:
-                logger.error("❌ Tweet butonu bulunamadı")
-                return None
-            
+
+            # Tweet butonunu bul
+            tweet_button = self._wait_any(_TWEET_BUTTON_SELECTORS, clickable=True)
+            logger.info("✅ Tweet butonu bulundu")
+
             # JavaScript ile tıkla (element click intercepted hatası için)
             self.driver.execute_script("arguments[0].click();", tweet_button)
-            
-            # Post başarılı mı kontrol et
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tweet']"))
-            )
-            
-            # Tweet ID'yi al (basit yaklaşım)
-            tweet_id = f"selenium_{int(time.time())}"
-            
-            logger.info(f"✅ Tweet başarıyla post edildi! ID: {tweet_id}")
-            return tweet_id
-            
+            return True
+
         except TimeoutException:
-            logger.error("❌ Tweet post timeout")
-            return None
+            logger.error("❌ Tweet butonu bulunamadı")
+            raise
         except Exception as e:
-            logger.error(f"❌ Tweet post hatası: {e}")
-            return None
-    
+            logger.error("❌ Tweet post hatası", error=str(e))
+            return False
+
+    def _confirm_posted(self, content: TweetContent) -> Optional[str]:
+        """
+        Tıklamadan sonra tweet'in zaman akışında göründüğünü doğrula.
+
+        The tweet may be live even when the page is slow to show it, so a
+        missing confirmation is checked again on a freshly loaded timeline
+        instead of posting a second time.
+
+        Args:
+            content: Posted tweet content
+
+        Returns:
+            Tweet ID, or None if the tweet could not be found
+        """
+        needle = _text_fingerprint(content.turkish_text)[:_CONFIRM_TEXT_LENGTH]
+        for reload in (False, True):
+            try:
+                if reload:
+                    logger.warning("⏳ Tweet onayı gelmedi, zaman akışı kontrol ediliyor")
+                    self.driver.get("https://twitter.com/home")
+                self._wait_any(_POSTED_TWEET_SELECTORS)
+                if self.driver.execute_script(_TWEET_VISIBLE_SCRIPT, needle):
+                    # Tweet ID'yi al (basit yaklaşım)
+                    tweet_id = f"selenium_{int(time.time())}"
+                    logger.info("✅ Tweet başarıyla post edildi!", post_id=tweet_id)
+                    return tweet_id
+            except TimeoutException:
+                pass
+            except Exception as e:
+                logger.error("❌ Tweet doğrulama hatası", error=str(e))
+                return None
+
+        logger.error("❌ Tweet zaman akışında bulunamadı")
+        return None
+
+    async def _ensure_ready(self) -> Optional[str]:
+        """
+        Start Chrome and log in, unless the current session is still usable.
+
+        Returns:
+            Error message, or None when the session is ready to post
+        """
+        if self.driver is None and not await self._run(self._setup_driver):
+            return "Selenium driver kurulamadı"
+        if not self.is_logged_in and not await self._login_to_twitter():
+            return "Twitter login başarısız"
+        return None
+
     async def publish_tweet(self, content: TweetContent) -> PublishResult:
         """Tweet'i Selenium ile post et."""
         try:
             logger.info("🚀 Selenium ile tweet post ediliyor...")
             
-            # Driver'ı kur
-            if not self._setup_driver():
-                return PublishResult(success=False, error_message="Selenium driver kurulamadı")
+            # Driver'ı kur ve login ol (oturum açıksa yeniden kullanılır)
+            error_message = await self._ensure_ready()
+            if error_message:
+                return PublishResult(success=False, error_message=error_message)
             
-            try:
-                # Twitter'a login ol
-                if not self._login_to_twitter():
-                    return PublishResult(success=False, error_message="Twitter login başarısız")
-                
+            media_path = None
+            if content.media_url:
+                media_path = await self._download_media(content.media_url)
+
+            for attempt in range(_POST_ATTEMPTS):
+                # Post bütçesini bekle (Twitter tarafı throttling'e girmemek için)
+                await self._acquire_post_slot()
+
                 # Tweet yaz
-                if not self._compose_tweet(content):
+                if not await self._run(self._compose_tweet, content):
                     return PublishResult(success=False, error_message="Tweet yazılamadı")
                 
                 # Media upload et (varsa)
-                if content.media_url:
-                    self._upload_media(content.media_url)
+                if media_path:
+                    await self._run(self._upload_media, media_path)
                 
-                # Tweet'i post et
-                tweet_id = self._post_tweet()
-                if not tweet_id:
+                # Butona tıkla; tıklanamadıysa hiçbir şey gönderilmedi, tekrar denenebilir
+                try:
+                    clicked = await self._run(self._click_tweet_button)
+                except TimeoutException:
+                    delay = self._on_post_timeout(attempt)
+                    await self._persist_rate_state()
+                    if attempt + 1 == _POST_ATTEMPTS:
+                        return PublishResult(success=False, error_message="Tweet post timeout")
+                    await asyncio.sleep(delay)
+                    # Yarım kalan taslağı (metin + medya) temiz bir sayfayla at
+                    await self._run(self.driver.get, "https://twitter.com/home")
+                    continue
+                if not clicked:
                     return PublishResult(success=False, error_message="Tweet post edilemedi")
+
+                # Tıklamadan sonra tweet yayında olabilir: asla tekrar post etme
+                tweet_id = await self._run(self._confirm_posted, content)
+                if not tweet_id:
+                    self._on_post_timeout(attempt)
+                    await self._persist_rate_state()
+                    return PublishResult(success=False, error_message="Tweet post onaylanamadı")
                 
-                # Başarılı
+                # Başarılı: hızı yavaşça normale döndür
+                self._bucket.rate = min(self._bucket.rate * 1.25, self._base_rate)
+                await self._persist_rate_state()
                 return PublishResult(success=True, post_id=tweet_id)
                 
-            finally:
-                # Driver'ı temizle
-                self._cleanup_driver()
-                
         except Exception as e:
-            logger.error(f"❌ Selenium tweet post hatası: {e}")
+            logger.error("❌ Selenium tweet post hatası", error=str(e))
+            # Oturum bozulmuş olabilir; bir sonraki post yeniden kursun
+            await self._run(self._cleanup_driver)
             return PublishResult(success=False, error_message=str(e))
@@ -1,35 +1,167 @@
 """Twitter/X publisher implementation using tweepy."""
 
 import asyncio
+import concurrent.futures
+import contextlib
+import hashlib
 import os
-from typing import List, Optional
-
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import IO, Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+import requests
 import tweepy
+from requests.adapters import HTTPAdapter
 
-from ..ai.base import TweetContent
+from ..ai.base import TweetContent, tweet_length
 from ..common.config import settings
 from ..common.logging import get_logger
+from ..common.rate_limiter import TokenBucket
 from .base import BasePublisher, PublishResult
 
 logger = get_logger(__name__)
 
+_MAX_TWEET_LENGTH = 280
+
+_PUBLISH_WORKERS = 8
+
+# Uploaded media stays attachable for about a day; reuse it for an hour
+_MEDIA_ID_TTL_SECONDS = 60 * 60
+_MEDIA_ID_CACHE_SIZE = 128
+
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+# Images up to this size stay in memory between download and upload
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Twitter allows 300 tweet creations per 3 hours per user
+_POST_LIMIT = 300
+_POST_WINDOW_SECONDS = 3 * 60 * 60
+
+# Post attempts on 429 and 503 responses; 429 waits follow the reset
+# headers when Twitter sends them
+_POST_ATTEMPTS = 3
+_BACKOFF_BASE_SECONDS = 2.0
+_MAX_BACKOFF_SECONDS = 30.0
+_MAX_RESET_WAIT_SECONDS = 900.0
+
+# Upper bound on one video upload, processing included, so a stuck upload
+# cannot hold an executor thread indefinitely
+_VIDEO_UPLOAD_TIMEOUT = 300.0
+_VIDEO_APPEND_WORKERS = 4
+_MAX_VIDEO_BYTES = 512 * 1024 * 1024
+
+
+# create_tweet is not idempotent, so only responses that say the tweet was
+# not accepted are retried: 429 and 503. Timeouts, dropped connections and
+# other 5xx may hide a tweet that was created; anything else (401, 403, 404,
+# 400) fails the post at once
+_RETRYABLE_STATUS = frozenset({429, 503})
+
+# Twitter's 403 detail for a tweet identical to a recent one
+_DUPLICATE_DETAIL = "duplicate content"
+_DUPLICATE_LOOKUP_COUNT = 5
+
+
+def _is_retryable(error: tweepy.HTTPException) -> bool:
+    """Tell whether a failed post was clearly not accepted by Twitter."""
+    return error.response is not None and error.response.status_code in _RETRYABLE_STATUS
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """
+    Compute the wait before retrying a rate-limited or failed post.
+
+    Honors x-rate-limit-reset (epoch seconds) or Retry-After; otherwise uses
+    exponential backoff with jitter.
+
+    Args:
+        response: The failed response, if any
+        attempt: Zero-based number of the attempt that failed
+
+    Returns:
+        Seconds to wait
+    """
+    headers = response.headers if response is not None else {}
+    try:
+        if headers.get("x-rate-limit-reset"):
+            delay = float(headers["x-rate-limit-reset"]) - time.time()
+            return min(_MAX_RESET_WAIT_SECONDS, max(1.0, delay))
+        if headers.get("Retry-After"):
+            return min(_MAX_RESET_WAIT_SECONDS, max(1.0, float(headers["Retry-After"])))
+    except ValueError:
+        pass
+    delay = min(_MAX_BACKOFF_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt)
+    return delay * (1 + random.uniform(0, 0.5))
+
+
+def _unlink_quietly(path: str) -> None:
+    """Delete a temporary file that may already be gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 
 class TwitterPublisher(BasePublisher):
     """Twitter/X publisher using tweepy."""
 
+    # Largest APPEND segment the v1.1 media upload endpoint accepts
+    VIDEO_CHUNK_BYTES = 5 * 1024 * 1024
+
+    # Usernames of credentials already checked with get_me(), by key digest
+    _verified_users: ClassVar[Dict[str, str]] = {}
+
     def __init__(self) -> None:
         """Initialize Twitter publisher."""
         self.client = None
+        # Client-side copy of the POST /2/tweets quota
+        self._post_bucket = TokenBucket(
+            capacity=_POST_LIMIT, rate=_POST_LIMIT / _POST_WINDOW_SECONDS
+        )
+        # v1.1 API for media uploads, built once with the client
+        self._media_api: Optional[tweepy.API] = None
+        # Recently uploaded media IDs by URL, least recently used first;
+        # uploads run on several threads
+        self._media_ids: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._media_lock = threading.Lock()
+        # Uploads in progress by URL; resolve to the media ID or None
+        self._media_uploads: Dict[str, "concurrent.futures.Future[Optional[str]]"] = {}
+        # Own threads, so uploads never queue behind other default-executor work
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_PUBLISH_WORKERS, thread_name_prefix="tw-pub"
+        )
+        # Keep-alive connections for media downloads, shared by upload threads
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
         self._initialize_client()
 
+    async def aclose(self) -> None:
+        """Close pooled media download connections and the publishing threads."""
+        self._http.close()
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking tweepy call on the publisher's threads.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments for func
+
+        Returns:
+            Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     def _initialize_client(self) -> None:
         """Initialize Twitter API client."""
-        if not all([
-            settings.twitter.api_key,
-            settings.twitter.api_secret,
-            settings.twitter.access_token,
-            settings.twitter.access_token_secret,
-        ]):
+        if not settings.twitter.is_configured:
             logger.warning("Twitter credentials not configured, using mock publisher")
             return
 
@@ -44,9 +176,26 @@ class TwitterPublisher(BasePublisher):
                 wait_on_rate_limit=False,  # Manuel rate limit handling
             )
 
-            # Verify credentials
-            user = self.client.get_me()
-            logger.info("Twitter API initialized successfully", username=user.data.username)
+            # Verify credentials once per process and key pair
+            key = hashlib.blake2b(
+                f"{settings.twitter.api_key}:{settings.twitter.access_token}".encode("utf-8"),
+                digest_size=8,
+            ).hexdigest()
+            if key not in self._verified_users:
+                user = self.client.get_me()
+                self._verified_users[key] = user.data.username
+            logger.info("Twitter API initialized successfully", username=self._verified_users[key])
+
+            # Initialize media API (v1.1 for media upload)
+            auth = tweepy.OAuthHandler(
+                settings.twitter.api_key,
+                settings.twitter.api_secret
+            )
+            auth.set_access_token(
+                settings.twitter.access_token,
+                settings.twitter.access_token_secret
+            )
+            self._media_api = tweepy.API(auth)
 
         except Exception as e:
             logger.error("Failed to initialize Twitter API", error=str(e))
@@ -71,13 +220,37 @@ class TwitterPublisher(BasePublisher):
         try:
             logger.info("Publishing tweet to Twitter", content_preview=content.turkish_text[:50])
 
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                self._publish_tweet_sync,
-                content
-            )
+            # Run in thread pool to avoid blocking.
+            # Upload media once; retries only repeat the post
+            media_ids = await self._run(self._upload_media, content)
+
+            for attempt in range(_POST_ATTEMPTS):
+                await self._post_bucket.acquire()
+                try:
+                    response = await self._run(
+                        self._publish_tweet_sync,
+                        content,
+                        media_ids,
+                    )
+                    break
+                except tweepy.Forbidden as e:
+                    # A 429/503 may still have let an earlier attempt through
+                    if attempt == 0 or _DUPLICATE_DETAIL not in str(e).lower():
+                        raise
+                    post_id = await self._run(self._find_recent_tweet_sync, content)
+                    logger.info("Tweet already published by an earlier attempt", post_id=post_id)
+                    return PublishResult(success=True, post_id=post_id)
+                except tweepy.HTTPException as e:
+                    if attempt == _POST_ATTEMPTS - 1 or not _is_retryable(e):
+                        raise
+                    delay = _retry_delay(e.response, attempt)
+                    logger.warning(
+                        "Twitter publish failed, retrying",
+                        error=str(e),
+                        attempt=attempt + 1,
+                        delay_seconds=round(delay, 1),
+                    )
+                    await asyncio.sleep(delay)
 
             logger.info("Tweet published successfully", post_id=response.data["id"])
 
@@ -87,27 +260,17 @@ class TwitterPublisher(BasePublisher):
             )
 
         except tweepy.TooManyRequests as e:
-            logger.warning("Twitter rate limit exceeded, waiting 15 minutes before retry", error=str(e))
-            # Rate limit exceeded, wait 15 minutes and retry once
-            await asyncio.sleep(900)  # Wait 15 minutes (900 seconds)
-            try:
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    self._publish_tweet_sync,
-                    content
-                )
-                logger.info("Tweet published successfully after rate limit retry", post_id=response.data["id"])
-                return PublishResult(
-                    success=True,
-                    post_id=str(response.data["id"]),
-                )
-            except Exception as retry_e:
-                logger.error("Failed to publish tweet after rate limit retry", error=str(retry_e))
-                return PublishResult(
-                    success=False,
-                    error_message=f"Rate limit retry failed: {str(retry_e)}",
-                )
+            logger.error("Failed to publish tweet after rate limit retries", error=str(e))
+            return PublishResult(
+                success=False,
+                error_message=f"Rate limit retry failed: {str(e)}",
+            )
+        except (tweepy.BadRequest, tweepy.Unauthorized, tweepy.Forbidden, tweepy.NotFound) as e:
+            logger.error("Twitter rejected tweet", error=str(e))
+            return PublishResult(
+                success=False,
+                error_message=str(e),
+            )
         except Exception as e:
             logger.error("Failed to publish tweet", error=str(e))
             return PublishResult(
@@ -115,12 +278,13 @@ class TwitterPublisher(BasePublisher):
                 error_message=str(e),
             )
 
-    def _publish_tweet_sync(self, content: TweetContent) -> tweepy.Response:
+    def _publish_tweet_sync(self, content: TweetContent, media_ids: List[str]) -> tweepy.Response:
         """
         Synchronous tweet publishing with media and quote tweet support.
 
         Args:
             content: Tweet content
+            media_ids: IDs of already uploaded media
 
         Returns:
             Twitter API response
@@ -129,16 +293,14 @@ class TwitterPublisher(BasePublisher):
         tweet_text = content.turkish_text
         
         # Add hashtags if they fit
-        if content.hashtags:
-            hashtag_text = " ".join(content.hashtags)
-            if len(tweet_text + " " + hashtag_text) <= 280:
-                tweet_text += " " + hashtag_text
+        suffix = content.hashtag_suffix
+        if suffix and tweet_length(tweet_text) + content.hashtag_suffix_length <= _MAX_TWEET_LENGTH:
+            tweet_text += suffix
 
         # Prepare tweet parameters
         tweet_params = {"text": tweet_text}
 
         # Add media if available
-        media_ids = self._upload_media(content)
         if media_ids:
             tweet_params["media_ids"] = media_ids
 
@@ -148,127 +310,178 @@ class TwitterPublisher(BasePublisher):
 
         return self.client.create_tweet(**tweet_params)
 
+    def _find_recent_tweet_sync(self, content: TweetContent) -> Optional[str]:
+        """
+        Look up the ID of a tweet an earlier attempt already created.
+
+        Args:
+            content: Tweet content that was published
+
+        Returns:
+            ID of the matching recent tweet, or None if it was not found
+        """
+        try:
+            me = self.client.get_me()
+            response = self.client.get_users_tweets(
+                me.data.id, max_results=_DUPLICATE_LOOKUP_COUNT, user_auth=True
+            )
+        except tweepy.TweepyException as e:
+            logger.warning("Failed to look up duplicate tweet", error=str(e))
+            return None
+        for tweet in response.data or []:
+            if tweet.text.startswith(content.turkish_text[:50]):
+                return str(tweet.id)
+        return None
+
     def _upload_media(self, content: TweetContent) -> List[str]:
         """
         Upload media files to Twitter.
 
+        Concurrent calls for the same URL share one upload.
+
         Args:
             content: Tweet content with media information
 
         Returns:
             List of media IDs
         """
-        media_ids = []
-
         # Check if we have media URL (not file path)
-        if not content.media_url:
-            return media_ids
-
+        if not content.media_url or self._media_api is None:
+            return []
+
+        media_url = content.media_url
+        with self._media_lock:
+            # Same media uploaded recently: attach it again
+            cached = self._media_ids.get(media_url)
+            if cached and time.monotonic() - cached[1] < _MEDIA_ID_TTL_SECONDS:
+                self._media_ids.move_to_end(media_url)
+                return [cached[0]]
+            # Same media being uploaded by another thread: wait for its ID
+            upload = self._media_uploads.get(media_url)
+            owner = upload is None
+            if owner:
+                upload = self._media_uploads[media_url] = concurrent.futures.Future()
+
+        if not owner:
+            media_id = upload.result()
+            return [media_id] if media_id else []
+
+        media_id = None
         try:
-            # Download media from URL first
-            import requests
-            import tempfile
-            
-            # Download media file
-            response = requests.get(content.media_url, timeout=30)
-            response.raise_for_status()
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg' if content.media_type == 'image' else '.mp4') as temp_file:
-                temp_file.write(response.content)
-                temp_file_path = temp_file.name
-
-            # Initialize media API (v1.1 for media upload)
-            auth = tweepy.OAuthHandler(
-                settings.twitter.api_key,
-                settings.twitter.api_secret
-            )
-            auth.set_access_token(
-                settings.twitter.access_token,
-                settings.twitter.access_token_secret
-            )
-            media_api = tweepy.API(auth)
-
-            # Upload media based on type
-            if content.media_type == "video":
-                # Video upload (chunked)
-                media_id = self._upload_video(media_api, temp_file_path)
-            else:
-                # Image upload
-                media = media_api.media_upload(temp_file_path)
-                media_id = media.media_id
+            media_id = self._upload_media_file(content)
+        finally:
+            with self._media_lock:
+                if media_id:
+                    self._media_ids[media_url] = (media_id, time.monotonic())
+                    self._media_ids.move_to_end(media_url)
+                    if len(self._media_ids) > _MEDIA_ID_CACHE_SIZE:
+                        self._media_ids.popitem(last=False)
+                del self._media_uploads[media_url]
+            upload.set_result(media_id)
+        return [media_id] if media_id else []
+
+    def _upload_media_file(self, content: TweetContent) -> Optional[str]:
+        """
+        Download the content's media and upload it to Twitter.
 
-            if media_id:
-                media_ids.append(str(media_id))
-                logger.info("Media uploaded successfully", media_id=media_id, media_type=content.media_type, media_url=content.media_url)
+        Args:
+            content: Tweet content with a media URL
 
-            # Clean up temporary file
-            os.unlink(temp_file_path)
+        Returns:
+            Media ID, or None if the download or upload failed
+        """
+        try:
+            with contextlib.ExitStack() as stack:
+                # Upload media based on type
+                if content.media_type == "video":
+                    # Video upload (chunked) reads the file from disk. The writer
+                    # stays buffered: an unbuffered write may store only part of
+                    # a chunk and would silently truncate the video.
+                    fd, temp_file_path = tempfile.mkstemp(suffix=".mp4")
+                    stack.callback(_unlink_quietly, temp_file_path)
+                    with os.fdopen(fd, "wb") as temp_file:
+                        self._download_to(content.media_url, temp_file)
+                    media_id = self._upload_video(self._media_api, temp_file_path)
+                else:
+                    # Image upload; small images never touch the disk
+                    media_file = stack.enter_context(
+                        tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+                    )
+                    self._download_to(content.media_url, media_file)
+                    media_file.seek(0)
+                    media_id = self._media_api.media_upload("media.jpg", file=media_file).media_id
 
         except Exception as e:
             logger.error("Failed to upload media", error=str(e), media_url=content.media_url)
-            # Clean up temporary file if it exists
-            try:
-                if 'temp_file_path' in locals():
-                    os.unlink(temp_file_path)
-            except:
-                pass
+            return None
 
-        return media_ids
+        if not media_id:
+            return None
+        logger.info("Media uploaded successfully", media_id=media_id, media_type=content.media_type, media_url=content.media_url)
+        return str(media_id)
+
+    def _download_to(self, url: str, file: IO[bytes]) -> None:
+        """
+        Stream a media file into an open file without buffering it in memory.
+
+        Args:
+            url: Media URL
+            file: Binary file to write to
+        """
+        with self._http.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                file.write(chunk)
 
-    def _upload_video(self, media_api: tweepy.API, video_path: str) -> Optional[str]:
+    def _upload_video(
+        self,
+        media_api: tweepy.API,
+        video_path: str,
+        timeout: float = _VIDEO_UPLOAD_TIMEOUT,
+    ) -> Optional[str]:
         """
         Upload video file to Twitter (chunked upload).
 
         Args:
             media_api: Tweepy media API instance
             video_path: Path to video file
+            timeout: Seconds the whole upload, processing included, may take
 
         Returns:
             Media ID if successful, None otherwise
         """
         try:
-            # Get file size
-            file_size = os.path.getsize(video_path)
-            
-            # Initialize upload
-            media = media_api.media_upload(
-                video_path,
-                media_category="tweet_video",
-                chunked=True
-            )
-
-            # Process chunks
-            media_id = media.media_id
-            segment_index = 0
+            deadline = time.monotonic() + timeout
 
-            with open(video_path, 'rb') as video_file:
-                while True:
-                    chunk = video_file.read(5 * 1024 * 1024)  # 5MB chunks
-                    if not chunk:
-                        break
+            # Get file size; reject what Twitter would refuse after the upload
+            file_size = os.path.getsize(video_path)
+            if not 0 < file_size <= _MAX_VIDEO_BYTES:
+                logger.error("Video size not accepted by Twitter", file_size=file_size, video_path=video_path)
+                return None
 
-                    media_api.media_upload_append(
-                        media_id=media_id,
-                        segment_index=segment_index,
-                        media=chunk
+            # Initialize upload
+            media_id = media_api.chunked_upload_init(
+                file_size, "video/mp4", media_category="tweet_video"
+            ).media_id
+
+            # Process chunks; reads are already large, so skip read buffering
+            with open(video_path, 'rb', buffering=0) as video_file:
+                if file_size <= self.VIDEO_CHUNK_BYTES:
+                    # Short clip: one segment, no worker threads needed
+                    media_api.chunked_upload_append(
+                        media_id, ("video.mp4", video_file.read()), 0
                     )
-                    segment_index += 1
+                else:
+                    self._append_segments(media_api, media_id, video_file, deadline)
 
             # Finalize upload
-            media_api.media_upload_finalize(media_id=media_id)
+            media = media_api.chunked_upload_finalize(media_id)
 
-            # Wait for processing
-            import time
-            while True:
-                status = media_api.media_upload_status(media_id=media_id)
-                if status.processing_info['state'] == 'succeeded':
-                    break
-                elif status.processing_info['state'] == 'failed':
-                    logger.error("Video processing failed", media_id=media_id)
-                    return None
-                
-                time.sleep(1)
+            # Wait for processing, if Twitter started any
+            if getattr(media, "processing_info", None) and not self._wait_for_processing(
+                media_api, media_id, deadline - time.monotonic()
+            ):
+                return None
 
             return str(media_id)
 
@@ -276,6 +489,93 @@ class TwitterPublisher(BasePublisher):
             logger.error("Failed to upload video", error=str(e), video_path=video_path)
             return None
 
+    def _append_segments(
+        self, media_api: tweepy.API, media_id: str, video_file: IO[bytes], deadline: float
+    ) -> None:
+        """
+        Upload a video's segments, several at a time.
+
+        Segments are indexed, so they may arrive in any order. Returns once
+        every APPEND has succeeded.
+
+        Args:
+            media_api: Tweepy media API instance
+            media_id: Media ID from INIT
+            video_file: Open video file
+            deadline: time.monotonic() value after which the upload is abandoned
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_VIDEO_APPEND_WORKERS, thread_name_prefix="video-append"
+        ) as pool:
+            pending = set()
+            segment_index = 0
+            while True:
+                chunk = video_file.read(self.VIDEO_CHUNK_BYTES)
+                if not chunk:
+                    break
+
+                if time.monotonic() > deadline:
+                    raise TimeoutError("Video upload timed out")
+
+                # Bound the chunks held in memory
+                if len(pending) >= _VIDEO_APPEND_WORKERS:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        future.result()
+
+                pending.add(pool.submit(
+                    media_api.chunked_upload_append,
+                    media_id, ("video.mp4", chunk), segment_index,
+                ))
+                segment_index += 1
+
+            # Every APPEND must succeed before FINALIZE
+            for future in concurrent.futures.as_completed(pending):
+                future.result()
+
+    @staticmethod
+    def _wait_for_processing(media_api: tweepy.API, media_id: str, timeout: float) -> bool:
+        """
+        Poll an uploaded video's processing state until it settles.
+
+        Sleeps for Twitter's check_after_secs hint between polls, or backs off
+        exponentially with jitter when no hint is given.
+
+        Args:
+            media_api: Tweepy media API instance
+            media_id: Uploaded media ID
+            timeout: Seconds to wait in total
+
+        Returns:
+            True if processing succeeded
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            status = media_api.get_media_upload_status(media_id)
+            processing_info = getattr(status, "processing_info", None) or {}
+            state = processing_info.get("state", "succeeded")
+            if state == "succeeded":
+                return True
+            if state == "failed":
+                logger.error("Video processing failed", media_id=media_id)
+                return False
+
+            check_after = processing_info.get("check_after_secs")
+            if check_after:
+                delay = max(1.0, float(check_after))
+            else:
+                delay = min(_MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+            attempt += 1
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error("Video processing timed out", media_id=media_id, state=state)
+                return False
+            time.sleep(min(delay, remaining))
+
     async def publish_thread(self, contents: List[TweetContent]) -> List[PublishResult]:
         """
         Publish a thread of tweets to Twitter.
@@ -298,18 +598,23 @@ class TwitterPublisher(BasePublisher):
         previous_tweet_id = None
 
         try:
+            # Uploads are independent; only the replies must go in order
+            media_ids = await self._prepare_media(contents)
+
             for i, content in enumerate(contents):
                 logger.info("Publishing thread tweet", tweet_index=i + 1)
 
+                # Waits only when the post quota is used up
+                await self._post_bucket.acquire()
+
                 # Run in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
+                response = await self._run(
                     self._publish_thread_tweet_sync,
                     content,
                     previous_tweet_id,
                     i + 1,
-                    len(contents)
+                    len(contents),
+                    media_ids[i],
                 )
 
                 tweet_id = response.data["id"]
@@ -322,10 +627,6 @@ class TwitterPublisher(BasePublisher):
 
                 logger.info("Thread tweet published", post_id=tweet_id, tweet_index=i + 1)
 
-                # Add delay between tweets to avoid rate limiting
-                if i < len(contents) - 1:
-                    await asyncio.sleep(2)
-
         except Exception as e:
             logger.error("Failed to publish thread", error=str(e))
             # Add failed result for remaining tweets
@@ -337,12 +638,28 @@ class TwitterPublisher(BasePublisher):
 
         return results
 
+    async def _prepare_media(self, contents: List[TweetContent]) -> List[List[str]]:
+        """
+        Upload the media of several tweets concurrently.
+
+        Args:
+            contents: Tweet contents
+
+        Returns:
+            Media IDs for each tweet, in the same order
+        """
+        return list(await asyncio.gather(*(
+            self._run(self._upload_media, content)
+            for content in contents
+        )))
+
     def _publish_thread_tweet_sync(
         self,
         content: TweetContent,
         previous_tweet_id: str | None,
         tweet_index: int,
         total_tweets: int,
+        media_ids: List[str],
     ) -> tweepy.Response:
         """
         Synchronous thread tweet publishing.
@@ -352,6 +669,7 @@ class TwitterPublisher(BasePublisher):
             previous_tweet_id: ID of previous tweet in thread
             tweet_index: Index of current tweet (1-based)
             total_tweets: Total number of tweets in thread
+            media_ids: IDs of already uploaded media
 
         Returns:
             Twitter API response
@@ -364,16 +682,16 @@ class TwitterPublisher(BasePublisher):
             tweet_text = f"{tweet_index}/{total_tweets} {tweet_text}"
 
         # Add hashtags if they fit
-        if content.hashtags:
-            hashtag_text = " ".join(content.hashtags)
-            if len(tweet_text + " " + hashtag_text) <= 280:
-                tweet_text += " " + hashtag_text
+        suffix = content.hashtag_suffix
+        if suffix and tweet_length(tweet_text) + content.hashtag_suffix_length <= _MAX_TWEET_LENGTH:
+            tweet_text += suffix
+
+        tweet_params = {"text": tweet_text}
+        if media_ids:
+            tweet_params["media_ids"] = media_ids
 
         # Create tweet with reply to previous tweet if it exists
         if previous_tweet_id:
-            return self.client.create_tweet(
-                text=tweet_text,
-                in_reply_to_tweet_id=previous_tweet_id,
-            )
-        else:
-            return self.client.create_tweet(text=tweet_text)
+            tweet_params["in_reply_to_tweet_id"] = previous_tweet_id
+
+        return self.client.create_tweet(**tweet_params)
@@ -11,7 +11,8 @@ from PIL import Image
 import io
 import requests
 
-from ..common.models import TweetContent, PublishResult
+from ..ai.base import TweetContent
+from .base import PublishResult
 
 logger = structlog.get_logger(__name__)
 
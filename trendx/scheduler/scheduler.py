@@ -1,24 +1,74 @@
 """Scheduler for automated trend posting."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session
 
 from ..aggregator import TrendAggregator
 from ..ai import MockAIGenerator
+from ..ai.base import TweetContent as AITweetContent
 from ..common.config import settings
 from ..common.database import get_session
 from ..common.logging import get_logger
-from ..common.models import PostQueue, TrendItem, TweetContent
-from ..publisher import MockPublisher
+from ..common.models import PostHistory, PostQueue, TrendItem, TweetContent
+from ..publisher import MockPublisher, PublishResult
 from ..publisher.selenium_twitter_publisher import SeleniumTwitterPublisher
 from ..sources import RedditTrendSource, GoogleTrendsSource, TwitterTrendsSource
 
 logger = get_logger(__name__)
 
+# Built once and reused; executed with a list of rows it runs as a single
+# executemany with one cached statement
+_INSERT_POST_HISTORY = insert(PostHistory)
+
+# Dialects whose insert() supports on_conflict_do_nothing
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _insert_trend_items(session: Session, trend_items: List[TrendItem]) -> None:
+    """
+    Insert trend items, skipping ones already stored, and set their IDs.
+
+    New rows go in with a single INSERT ... ON CONFLICT DO NOTHING; items
+    that were already stored get the ID of the existing row.
+
+    Args:
+        session: Database session
+        trend_items: Trend items to insert
+    """
+    upsert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if upsert is None:
+        # No upsert support: plain ORM insert
+        session.add_all(trend_items)
+        session.flush()
+        return
+
+    rows = [trend_item.model_dump(exclude={"id"}) for trend_item in trend_items]
+    session.execute(
+        upsert(TrendItem)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["source", "external_id"])
+    )
+
+    keys = {(trend_item.source, trend_item.external_id) for trend_item in trend_items}
+    ids = {
+        (source, external_id): trend_item_id
+        for trend_item_id, source, external_id in session.execute(
+            select(TrendItem.id, TrendItem.source, TrendItem.external_id).where(
+                tuple_(TrendItem.source, TrendItem.external_id).in_(keys)
+            )
+        )
+    }
+    for trend_item in trend_items:
+        trend_item.id = ids[(trend_item.source, trend_item.external_id)]
+
 
 class TrendScheduler:
     """Scheduler for automated trend collection and posting."""
@@ -29,6 +79,9 @@ class TrendScheduler:
         self.aggregator = None
         self.ai_generator = None
         self.publisher = None
+        # Batch API job started by an earlier run: (batch ID, its trends)
+        self._pending_batch: Optional[Tuple[str, List[TrendItem]]] = None
+        self._use_batch_api = False
         self._initialize_components()
 
     def _initialize_components(self) -> None:
@@ -44,9 +97,10 @@ class TrendScheduler:
 
         # Initialize AI generator (OpenAI if configured, otherwise mock)
         from ..ai.openai_generator import OpenAIGenerator
-        if settings.ai.api_key and settings.ai.api_key != "your_openai_api_key_here":
+        if settings.ai.is_configured:
             self.ai_generator = OpenAIGenerator()
-            logger.info("OpenAI AI generator initialized")
+            self._use_batch_api = settings.scheduler.use_batch_api
+            logger.info("OpenAI AI generator initialized", batch_api=self._use_batch_api)
         else:
             self.ai_generator = MockAIGenerator()
             logger.info("Mock AI generator initialized (OpenAI API key not configured)")
@@ -107,22 +161,36 @@ class TrendScheduler:
                 logger.info("⏰ Quiet hours - tweet atılmıyor")
                 return
 
-            # Collect trends (sadece 1 tane)
-            trends = await self.aggregator.aggregate_trends(limit=1)
+            # Content generated by an earlier run's batch job, if finished
+            prepared = await self._take_batch_content() if self._use_batch_api else None
+
+            # Collect trends (sadece 1 tane); in batch mode also one for the
+            # next run's batch job, but only when a new job can be submitted:
+            # aggregate_trends marks what it returns as seen
+            can_submit = self._use_batch_api and self._pending_batch is None
+            limit = 2 if can_submit and prepared is None else 1
+            trends = await self.aggregator.aggregate_trends(limit=limit)
             logger.info(f"📊 {len(trends)} trend bulundu")
 
-            if not trends:
+            if prepared is not None:
+                trend, tweet_content = prepared
+                upcoming = trends
+            elif not trends:
                 logger.warning("❌ Yeni içerik yok - tweet atılmıyor")
                 return
+            else:
+                # İlk trendi al ve hemen tweet at
+                trend = trends[0]
+                upcoming = trends[1:]
 
-            # İlk trendi al ve hemen tweet at
-            trend = trends[0]
+                # Generate tweet content
+                tweet_content = await self.ai_generator.generate_tweet_content(trend)
             logger.info(f"🎯 Seçilen trend: {trend.title}")
-
-            # Generate tweet content
-            tweet_content = await self.ai_generator.generate_tweet_content(trend)
             logger.info("🤖 AI tweet içeriği oluşturuldu")
 
+            if can_submit and upcoming:
+                await self._submit_batch(upcoming)
+
             # Hemen tweet at
             result = await self.publisher.publish_tweet(tweet_content)
             
@@ -137,14 +205,52 @@ class TrendScheduler:
         except Exception as e:
             logger.error(f"❌ Saat başı tweet hatası: {e}")
 
+    async def _take_batch_content(self) -> Optional[Tuple[TrendItem, AITweetContent]]:
+        """
+        Take the first result of the pending batch job if it has finished.
+
+        Returns:
+            Tuple of (trend item, tweet content), or None if nothing is ready
+        """
+        if self._pending_batch is None:
+            return None
+
+        batch_id, batch_trends = self._pending_batch
+        try:
+            contents = await self.ai_generator.fetch_batch_job(batch_id, batch_trends)
+        except Exception as e:
+            logger.error(f"❌ Batch job hatası: {e}")
+            self._pending_batch = None
+            return None
+
+        if contents is None:
+            logger.info("⏳ Batch job henüz bitmedi", batch_id=batch_id)
+            return None
+
+        self._pending_batch = None
+        return batch_trends[0], contents[0]
+
+    async def _submit_batch(self, trends: List[TrendItem]) -> None:
+        """
+        Start a batch job generating content for the next run.
+
+        Args:
+            trends: Trend items to generate content for
+        """
+        try:
+            batch_id = await self.ai_generator.submit_batch_job(trends)
+        except Exception as e:
+            logger.error(f"❌ Batch job gönderilemedi: {e}")
+            return
+        self._pending_batch = (batch_id, trends)
+
     async def _save_tweet_to_db(self, trend_item: TrendItem, tweet_content, post_id: str) -> None:
         """Tweet'i database'e kaydet."""
         try:
+            # One transaction: flush assigns the trend ID, get_session commits
             with get_session() as session:
-                # Save trend item
-                session.add(trend_item)
-                session.commit()
-                session.refresh(trend_item)
+                # Save trend item (or reuse the stored one)
+                _insert_trend_items(session, [trend_item])
 
                 # Save tweet content
                 db_tweet_content = TweetContent(
@@ -159,7 +265,25 @@ class TrendScheduler:
                     quote_tweet_url=tweet_content.quote_tweet_url,
                 )
                 session.add(db_tweet_content)
-                session.commit()
+                session.flush()
+
+                # Posted right away: record it as an already posted queue
+                # item so the post lands in PostHistory like queued posts
+                posted_at = datetime.now(timezone.utc)
+                queue_item = PostQueue(
+                    tweet_content_id=db_tweet_content.id,
+                    scheduled_at=posted_at,
+                    posted_at=posted_at,
+                    twitter_post_id=post_id,
+                    status="posted",
+                )
+                session.add(queue_item)
+                session.flush()
+                session.execute(_INSERT_POST_HISTORY, [{
+                    "post_queue_id": queue_item.id,
+                    "twitter_post_id": post_id,
+                    "posted_at": posted_at,
+                }])
                 
                 logger.info(f"💾 Tweet database'e kaydedildi: {post_id}")
                 
@@ -179,10 +303,8 @@ class TrendScheduler:
 
             # Save to database
             with get_session() as session:
-                # Save trend item
-                session.add(trend_item)
-                session.commit()
-                session.refresh(trend_item)
+                # Save trend item (or reuse the stored one)
+                _insert_trend_items(session, [trend_item])
 
                 # Save tweet content
                 db_tweet_content = TweetContent(
@@ -219,7 +341,7 @@ class TrendScheduler:
         try:
             with get_session() as session:
                 # Get items ready to post
-                now = datetime.utcnow()
+                now = datetime.now(timezone.utc)
                 ready_items = session.query(PostQueue).filter(
                     PostQueue.scheduled_at <= now,
                     PostQueue.status == "pending",
@@ -230,18 +352,32 @@ class TrendScheduler:
 
                 logger.info("Processing post queue", count=len(ready_items))
 
+                history_rows = []
                 for queue_item in ready_items:
-                    await self._post_queue_item(queue_item)
+                    result = await self._post_queue_item(queue_item)
+                    if result is not None and result.success:
+                        history_rows.append({
+                            "post_queue_id": queue_item.id,
+                            "twitter_post_id": result.post_id,
+                            "posted_at": queue_item.posted_at,
+                        })
+
+                # Record every successful post in one statement
+                if history_rows:
+                    session.execute(_INSERT_POST_HISTORY, history_rows)
 
         except Exception as e:
             logger.error("Error processing post queue", error=str(e))
 
-    async def _post_queue_item(self, queue_item: PostQueue) -> None:
+    async def _post_queue_item(self, queue_item: PostQueue) -> Optional[PublishResult]:
         """
         Post a single queue item.
 
         Args:
             queue_item: Queue item to post
+
+        Returns:
+            Publish result, or None if the item could not be published
         """
         try:
             with get_session() as session:
@@ -252,10 +388,9 @@ class TrendScheduler:
 
                 if not tweet_content:
                     logger.error("Tweet content not found", queue_id=queue_item.id)
-                    return
+                    return None
 
                 # Create content object
-                from ..ai.base import TweetContent as AITweetContent
                 content = AITweetContent(
                     turkish_text=tweet_content.turkish_text,
                     english_text=tweet_content.english_text,
@@ -269,7 +404,7 @@ class TrendScheduler:
                 # Update queue item
                 if result.success:
                     queue_item.status = "posted"
-                    queue_item.posted_at = datetime.utcnow()
+                    queue_item.posted_at = datetime.now(timezone.utc)
                     queue_item.twitter_post_id = result.post_id
                 else:
                     queue_item.status = "failed"
@@ -283,9 +418,11 @@ class TrendScheduler:
                     success=result.success,
                     post_id=result.post_id,
                 )
+                return result
 
         except Exception as e:
             logger.error("Error posting queue item", error=str(e))
+            return None
 
     def _is_quiet_hours(self) -> bool:
         """
@@ -311,7 +448,7 @@ class TrendScheduler:
         Returns:
             Next post time
         """
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         # Check if we're in quiet hours
         if self._is_quiet_hours():
@@ -1,6 +1,7 @@
 """Google Trends source implementation."""
 
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 from pytrends.request import TrendReq
@@ -12,6 +13,22 @@ from .base import BaseTrendSource
 
 logger = get_logger(__name__)
 
+TURKEY_KEYWORDS = (
+    "turkey",
+    "türkiye",
+    "istanbul",
+    "ankara",
+    "izmir",
+    "turkish",
+    "türk",
+    "erdogan",
+    "akp",
+    "chp",
+)
+
+# One compiled alternation scans the topic once instead of once per keyword
+_TURKEY_KEYWORDS_RE = re.compile("|".join(map(re.escape, TURKEY_KEYWORDS)))
+
 
 class GoogleTrendsSource(BaseTrendSource):
     """Google Trends source for trending topics."""
@@ -95,7 +112,7 @@ class GoogleTrendsSource(BaseTrendSource):
                 social_volume=0,  # Google Trends doesn't provide volume
                 is_turkey_related=is_turkey_related,
                 is_global=not is_turkey_related,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             )
 
         except Exception as e:
@@ -112,22 +129,7 @@ class GoogleTrendsSource(BaseTrendSource):
         Returns:
             True if Turkey-related
         """
-        turkey_keywords = [
-            "turkey",
-            "türkiye",
-            "istanbul",
-            "ankara",
-            "izmir",
-            "turkish",
-            "türk",
-            "erdogan",
-            "akp",
-            "chp",
-            "türkiye",
-        ]
-
-        topic_lower = topic.lower()
-        return any(keyword in topic_lower for keyword in turkey_keywords)
+        return _TURKEY_KEYWORDS_RE.search(topic.lower()) is not None
 
     def _get_mock_data(self, limit: int) -> List[TrendItem]:
         """
@@ -1,7 +1,7 @@
 """Reddit trend source implementation."""
 
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 import praw
@@ -14,6 +14,22 @@ from .base import BaseTrendSource
 
 logger = get_logger(__name__)
 
+TURKEY_KEYWORDS = (
+    "turkey",
+    "türkiye",
+    "istanbul",
+    "ankara",
+    "izmir",
+    "turkish",
+    "türk",
+    "erdogan",
+    "akp",
+    "chp",
+)
+
+# One compiled alternation scans the text once instead of once per keyword
+_TURKEY_KEYWORDS_RE = re.compile("|".join(map(re.escape, TURKEY_KEYWORDS)))
+
 
 class RedditTrendSource(BaseTrendSource):
     """Reddit trend source for r/worldnews and r/Turkey."""
@@ -91,7 +107,7 @@ class RedditTrendSource(BaseTrendSource):
         """
         try:
             # Skip if post is too old (more than 24 hours)
-            post_age = datetime.utcnow() - datetime.fromtimestamp(post.created_utc)
+            post_age = datetime.now(timezone.utc) - datetime.fromtimestamp(post.created_utc, timezone.utc)
             if post_age > timedelta(hours=24):
                 return None
 
@@ -108,14 +124,14 @@ class RedditTrendSource(BaseTrendSource):
                 social_volume=post.score,
                 is_turkey_related=is_turkey_related,
                 is_global=subreddit == "worldnews",
-                created_at=datetime.fromtimestamp(post.created_utc),
+                created_at=datetime.fromtimestamp(post.created_utc, timezone.utc),
             )
 
         except Exception as e:
             logger.error("Failed to convert Reddit post", post_id=post.id, error=str(e))
             return None
 
-    def _is_turkey_related(self, title: str, content: str) -> bool:
+    def _is_turkey_related(self, title: str, content: str = "") -> bool:
         """
         Check if content is Turkey-related.
 
@@ -126,21 +142,8 @@ class RedditTrendSource(BaseTrendSource):
         Returns:
             True if Turkey-related
         """
-        turkey_keywords = [
-            "turkey",
-            "türkiye",
-            "istanbul",
-            "ankara",
-            "izmir",
-            "turkish",
-            "türk",
-            "erdogan",
-            "akp",
-            "chp",
-        ]
-
         text = (title + " " + content).lower()
-        return any(keyword in text for keyword in turkey_keywords)
+        return _TURKEY_KEYWORDS_RE.search(text) is not None
 
     def _get_mock_data(self, limit: int) -> List[TrendItem]:
         """
@@ -4,7 +4,7 @@ Selenium ile gerçek browser kullanarak trend içeriği bulan kaynak.
 
 import asyncio
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,8 +12,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
+from ..common.chromedriver import get_chromedriver_path
 from ..common.models import TrendItem, TrendSource
 from ..common.logging import get_logger
 from .base import BaseTrendSource
@@ -193,8 +193,8 @@ class SeleniumTrendsSource(BaseTrendSource):
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             
-            # Chrome driver'ı otomatik indir ve kur
-            service = Service(ChromeDriverManager().install())
+            # Chrome driver: ayarlı yol ya da otomatik indirme (process başına bir kez)
+            service = Service(get_chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
             logger.info("✅ Selenium driver hazır!")
@@ -369,7 +369,7 @@ class SeleniumTrendsSource(BaseTrendSource):
                     social_volume=random.randint(50000, 200000),
                     is_turkey_related=True,
                     is_global=False,
-                    created_at=datetime.utcnow() - timedelta(hours=1),
+                    created_at=datetime.now(timezone.utc) - timedelta(hours=1),
                 )
                 
                 # Selenium sonuçlarını trend_item'a ekle
@@ -400,8 +400,7 @@ class SeleniumTrendsSource(BaseTrendSource):
             
             with get_session() as session:
                 # Son 7 gün içinde paylaşılan trend'leri al
-                from datetime import datetime, timedelta
-                week_ago = datetime.utcnow() - timedelta(days=7)
+                week_ago = datetime.now(timezone.utc) - timedelta(days=7)
                 
                 posted_trends = session.query(TrendItem.title).filter(
                     TrendItem.source == TrendSource.SELENIUM_TRENDS,
@@ -3,7 +3,7 @@ Ultra basit trends source - hiç API yok, rate limit yok!
 """
 
 from typing import List
-from datetime import datetime
+from datetime import datetime, timezone
 from ..common.models import TrendItem, TrendSource
 from ..common.logging import get_logger
 from .base import BaseTrendSource
@@ -106,7 +106,7 @@ class SimpleTrendsFixed(BaseTrendSource):
         for i, trend_data in enumerate(selected_trends):
             trend_item = TrendItem(
                 source=TrendSource.TWITTER_TRENDS,
-                external_id=f"simple_fixed_{i}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
+                external_id=f"simple_fixed_{i}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 title=trend_data["title"],
                 description=trend_data["description"],
                 url=f"https://twitter.com/search?q=%23{trend_data['hashtag']}",
@@ -114,7 +114,7 @@ class SimpleTrendsFixed(BaseTrendSource):
                 social_volume=trend_data["social_volume"],
                 is_turkey_related=trend_data["is_turkey_related"],
                 is_global=trend_data["is_global"],
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             )
             trends.append(trend_item)
 
@@ -3,7 +3,7 @@
 import asyncio
 import re
 from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
 
 import tweepy
@@ -15,6 +15,19 @@ from .base import BaseTrendSource
 
 logger = get_logger(__name__)
 
+TURKEY_KEYWORDS = (
+    "turkey", "türkiye", "istanbul", "ankara", "izmir", "turkish",
+    "türk", "türkçe", "antalya", "bursa", "adana", "konya", "gaziantep",
+    "mersin", "diyarbakır", "kayseri", "eskişehir", "urfa", "malatya",
+    "erzurum", "van", "batman", "elazığ", "ısparta", "kahramanmaraş",
+    "samsun", "denizli", "sakarya", "muğla", "afyon", "trabzon", "ordu",
+    "erzincan", "giresun", "rize", "artvin", "gümüşhane", "bayburt",
+    "erdogan", "akp", "chp", "mhp", "iyi", "hdp", "devlet", "cumhurbaşkanı",
+)
+
+# One compiled alternation scans the trend once instead of once per keyword
+_TURKEY_KEYWORDS_RE = re.compile("|".join(map(re.escape, TURKEY_KEYWORDS)))
+
 
 class TwitterTrendsSource(BaseTrendSource):
     """Twitter/X trends source for trending topics."""
@@ -87,7 +100,7 @@ class TwitterTrendsSource(BaseTrendSource):
                     social_volume=tweet_count,
                     is_turkey_related=self._is_turkey_related(hashtag),
                     is_global=True,
-                    created_at=datetime.utcnow(),
+                    created_at=datetime.now(timezone.utc),
                 )
                 trends.append(trend_item)
 
@@ -117,7 +130,7 @@ class TwitterTrendsSource(BaseTrendSource):
                             social_volume=tweet_count,
                             is_turkey_related=self._is_turkey_related(topic),
                             is_global=True,
-                            created_at=datetime.utcnow(),
+                            created_at=datetime.now(timezone.utc),
                         )
                         trends.append(trend_item)
 
@@ -261,7 +274,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=trend_data.get('tweet_volume', 0) or 0,
                 is_turkey_related=is_turkey_related,
                 is_global=not is_turkey_related,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             )
 
         except Exception as e:
@@ -278,19 +291,7 @@ class TwitterTrendsSource(BaseTrendSource):
         Returns:
             True if Turkey-related
         """
-        turkey_keywords = [
-            "turkey", "türkiye", "istanbul", "ankara", "izmir", "turkish", 
-            "türk", "türkçe", "ankara", "istanbul", "izmir", "antalya",
-            "bursa", "adana", "konya", "gaziantep", "mersin", "diyarbakır",
-            "kayseri", "eskişehir", "urfa", "malatya", "erzurum", "van",
-            "batman", "elazığ", "ısparta", "kahramanmaraş", "samsun",
-            "denizli", "sakarya", "muğla", "afyon", "trabzon", "ordu",
-            "erzincan", "giresun", "rize", "artvin", "gümüşhane", "bayburt",
-            "erdogan", "akp", "chp", "mhp", "iyi", "hdp", "devlet", "cumhurbaşkanı"
-        ]
-
-        trend_lower = trend_name.lower()
-        return any(keyword in trend_lower for keyword in turkey_keywords)
+        return _TURKEY_KEYWORDS_RE.search(trend_name.lower()) is not None
 
     def _get_mock_data(self, limit: int) -> List[TrendItem]:
         """
@@ -313,7 +314,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=15000,
                 is_turkey_related=False,
                 is_global=True,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             ),
             TrendItem(
                 source=TrendSource.TWITTER_TRENDS,
@@ -325,7 +326,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=8500,
                 is_turkey_related=True,
                 is_global=False,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             ),
             TrendItem(
                 source=TrendSource.TWITTER_TRENDS,
@@ -337,7 +338,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=12000,
                 is_turkey_related=False,
                 is_global=True,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             ),
             TrendItem(
                 source=TrendSource.TWITTER_TRENDS,
@@ -349,7 +350,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=10000,
                 is_turkey_related=False,
                 is_global=True,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             ),
             TrendItem(
                 source=TrendSource.TWITTER_TRENDS,
@@ -361,7 +362,7 @@ class TwitterTrendsSource(BaseTrendSource):
                 social_volume=7500,
                 is_turkey_related=True,
                 is_global=False,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             ),
         ]
 
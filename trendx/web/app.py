@@ -1,11 +1,12 @@
 """FastAPI web dashboard application."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
+from sqlmodel import select
 
 from ..common.config import settings
 from ..common.database import get_session
@@ -178,9 +179,9 @@ def create_app() -> FastAPI:
         """Get post queue items."""
         try:
             with get_session() as session:
-                queue_items = session.query(PostQueue).order_by(
-                    PostQueue.scheduled_at.desc()
-                ).limit(limit).all()
+                queue_items = session.exec(
+                    select(PostQueue).order_by(PostQueue.scheduled_at.desc()).limit(limit)
+                ).all()
 
                 return [
                     {
@@ -203,7 +204,7 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "version": "0.1.0",
         }
 